@@ -80,6 +80,9 @@ def create_app():
         return "<br>".join(sorted(output))
 
     # 스케줄러 초기화
-    # news_scheduler.init_app(app)
+    from ..services.scheduler import news_scheduler
+    news_scheduler.init_app(app)
+    if os.getenv('SCHEDULER_AUTOSTART', 'false').lower() == 'true':
+        news_scheduler.start_scheduler()
     
     return app
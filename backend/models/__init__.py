@@ -1,28 +1,41 @@
 from .artist import Artist
+from .artist_term import ArtistTerm, ArtistTermDaily
 from .channel import Channel
 from .account import Account
 from .board import Board
 from .api_key import APIKey
 from .database_config import DatabaseConfig
 from .channel_stat import ChannelStat
+from .channel_stat_rollup import ChannelStatRollup
 from .post import Post
 from .news import News
+from .news_crawl_state import NewsCrawlState
+from .news_daily_stat import NewsDailyStat
 from .activity import Activity
 from .staff import Staff
+from .job import Job
+from .scheduler_lease import SchedulerLease
 from .instagram import InstagramUser, InstagramSearchResult, InstagramProfilePic, InstagramBioLink, InstagramBusinessContact # Added Instagram models
 
 __all__ = [
     'Artist',
+    'ArtistTerm',
+    'ArtistTermDaily',
     'Channel', 
     'Account',
     'Board',
     'APIKey',
     'DatabaseConfig',
     'ChannelStat',
+    'ChannelStatRollup',
     'Post',
     'News',
+    'NewsCrawlState',
+    'NewsDailyStat',
     'Activity',
     'Staff',
+    'Job',
+    'SchedulerLease',
     'InstagramUser', # Added
     'InstagramSearchResult', # Added
     'InstagramProfilePic', # Added
@@ -0,0 +1,45 @@
+from datetime import datetime
+from backend.app import db
+
+class ArtistTerm(db.Model):
+    """아티스트별 뉴스 본문 단어 빈도 누적값 (워드클라우드/키워드가 본문을 다시 분석하지 않도록)"""
+    __tablename__ = 'artist_terms'
+
+    artist_id = db.Column(db.BigInteger, db.ForeignKey('Artists.id', ondelete='CASCADE'), primary_key=True)
+    term = db.Column(db.String(100), primary_key=True)
+    count = db.Column(db.Integer, default=0, nullable=False)
+    last_seen = db.Column(db.DateTime) # 이 단어가 나온 가장 최근 기사 발행일(없으면 수집일)
+
+    __table_args__ = (
+        db.Index('idx_artist_terms_artist_count', 'artist_id', 'count'),
+    )
+
+    def to_dict(self):
+        return {
+            'artist_id': self.artist_id,
+            'term': self.term,
+            'count': self.count,
+            'last_seen': self.last_seen.isoformat() if self.last_seen else None
+        }
+
+
+class ArtistTermDaily(db.Model):
+    """일자별 아티스트 단어 빈도 (최근 N일 키워드는 이 테이블을 합산)"""
+    __tablename__ = 'artist_term_daily_counts'
+
+    artist_id = db.Column(db.BigInteger, db.ForeignKey('Artists.id', ondelete='CASCADE'), primary_key=True)
+    term_date = db.Column(db.Date, primary_key=True) # 기사 발행일 (없으면 수집일, UTC)
+    term = db.Column(db.String(100), primary_key=True)
+    count = db.Column(db.Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        db.Index('idx_artist_term_daily_artist_date', 'artist_id', 'term_date'),
+    )
+
+    def to_dict(self):
+        return {
+            'artist_id': self.artist_id,
+            'term_date': self.term_date.isoformat() if self.term_date else None,
+            'term': self.term,
+            'count': self.count
+        }
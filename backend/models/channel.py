@@ -14,6 +14,10 @@ class Channel(db.Model):
     following_count = db.Column(db.Integer, default=0)
     post_count = db.Column(db.Integer, default=0)
     is_verified = db.Column(db.Boolean, default=False)
+    # 가장 최근 ChannelStat 비정규화 (follower/following/post_count도 이 통계 값으로 갱신됨)
+    latest_stat_id = db.Column(db.Integer) # channel_stats.id (순환 FK를 피하려고 제약 조건은 두지 않음)
+    latest_stat_date = db.Column(db.Date)
+    engagement_rate = db.Column(db.Numeric(5, 2))
     last_sync_at = db.Column(db.DateTime)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -26,6 +30,18 @@ class Channel(db.Model):
         db.UniqueConstraint('artist_id', 'platform', 'channel_id', name='unique_channel'),
     )
     
+    def apply_latest_stat(self, stat):
+        """stat이 현재 최신 통계보다 같거나 새로우면 최신 통계 컬럼을 갱신. 갱신 여부 반환"""
+        if self.latest_stat_date is not None and stat.stat_date < self.latest_stat_date:
+            return False
+        self.latest_stat_id = stat.id
+        self.latest_stat_date = stat.stat_date
+        self.follower_count = stat.follower_count
+        self.following_count = stat.following_count
+        self.post_count = stat.post_count
+        self.engagement_rate = stat.engagement_rate
+        return True
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -38,6 +54,8 @@ class Channel(db.Model):
             'following_count': self.following_count,
             'post_count': self.post_count,
             'is_verified': self.is_verified,
+            'latest_stat_date': self.latest_stat_date.isoformat() if self.latest_stat_date else None,
+            'engagement_rate': float(self.engagement_rate) if self.engagement_rate is not None else None,
             'last_sync_at': self.last_sync_at.isoformat() if self.last_sync_at else None,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
@@ -0,0 +1,40 @@
+from datetime import datetime
+from backend.app import db
+
+class ChannelStatRollup(db.Model):
+    """ChannelStat 일별 통계의 주/월 단위 집계 (성장률 조회용)"""
+    __tablename__ = 'channel_stat_rollups'
+
+    channel_id = db.Column(db.Integer, db.ForeignKey('channels.id', ondelete='CASCADE'), primary_key=True)
+    bucket = db.Column(db.Enum('week', 'month'), primary_key=True)
+    period_start = db.Column(db.Date, primary_key=True) # 주: 월요일, 월: 1일
+    first_stat_date = db.Column(db.Date) # 구간 내 첫/마지막 통계 날짜
+    last_stat_date = db.Column(db.Date)
+    start_follower_count = db.Column(db.Integer) # 기준값 (이전 구간 마지막 통계, 없으면 구간 첫 통계)
+    end_follower_count = db.Column(db.Integer)
+    follower_delta = db.Column(db.Integer, default=0)
+    growth_rate = db.Column(db.Float) # follower_delta / start_follower_count * 100
+    post_delta = db.Column(db.Integer, default=0)
+    avg_engagement_rate = db.Column(db.Float)
+    sample_count = db.Column(db.Integer, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('idx_channel_stat_rollups_bucket_period', 'bucket', 'period_start'),
+    )
+
+    def to_dict(self):
+        return {
+            'channel_id': self.channel_id,
+            'bucket': self.bucket,
+            'period_start': self.period_start.isoformat() if self.period_start else None,
+            'first_stat_date': self.first_stat_date.isoformat() if self.first_stat_date else None,
+            'last_stat_date': self.last_stat_date.isoformat() if self.last_stat_date else None,
+            'start_follower_count': self.start_follower_count,
+            'end_follower_count': self.end_follower_count,
+            'follower_delta': self.follower_delta,
+            'growth_rate': self.growth_rate,
+            'post_delta': self.post_delta,
+            'avg_engagement_rate': self.avg_engagement_rate,
+            'sample_count': self.sample_count
+        }
@@ -0,0 +1,72 @@
+from datetime import datetime
+from backend.app import db
+
+class Job(db.Model):
+    """백그라운드 작업(뉴스 크롤링, Instagram 갱신, 보고서 생성) 실행 기록"""
+    __tablename__ = 'jobs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    job_type = db.Column(db.String(50), nullable=False) # news_crawl, instagram_refresh, report
+    status = db.Column(db.Enum('pending', 'running', 'completed', 'failed'), default='pending', nullable=False)
+    trigger = db.Column(db.Enum('schedule', 'manual'), default='manual', nullable=False)
+    params = db.Column(db.JSON) # 작업 입력 파라미터
+    result = db.Column(db.JSON) # 항목별 결과 (예: 아티스트별 저장 건수)
+    progress_total = db.Column(db.Integer, default=0)
+    progress_done = db.Column(db.Integer, default=0)
+    error = db.Column(db.Text)
+    attempts = db.Column(db.Integer, default=0) # 실행(재시작 후 재개 포함) 횟수
+    worker_id = db.Column(db.String(255)) # 작업을 가져간 프로세스 (hostname:pid:uuid)
+    heartbeat_at = db.Column(db.DateTime) # 실행 중인 프로세스가 주기적으로 갱신 (lease 만료 판단용)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('idx_jobs_status', 'status'),
+    )
+
+    def get_params(self):
+        return self.params if self.params else {}
+
+    def get_result(self):
+        return self.result if self.result else {}
+
+    def set_result_value(self, key, value):
+        """result JSON의 키 하나를 갱신 (새 dict를 할당해야 변경이 감지됨)"""
+        result = dict(self.get_result())
+        result[key] = value
+        self.result = result
+
+    def record_item_result(self, item_key, value):
+        """항목(아티스트, 사용자 등) 하나의 처리 결과를 기록하고 진행률을 올림"""
+        items = dict(self.get_result().get('items', {}))
+        items[str(item_key)] = value
+        self.set_result_value('items', items)
+        self.progress_done = len(items)
+
+    def get_done_item_keys(self):
+        return set(self.get_result().get('items', {}).keys())
+
+    def to_dict(self):
+        duration = None
+        if self.started_at:
+            duration = ((self.finished_at or datetime.utcnow()) - self.started_at).total_seconds()
+        return {
+            'id': self.id,
+            'job_type': self.job_type,
+            'status': self.status,
+            'trigger': self.trigger,
+            'params': self.get_params(),
+            'result': self.get_result(),
+            'progress_total': self.progress_total,
+            'progress_done': self.progress_done,
+            'error': self.error,
+            'attempts': self.attempts,
+            'worker_id': self.worker_id,
+            'heartbeat_at': self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'duration_seconds': duration
+        }
@@ -1,7 +1,14 @@
 from datetime import datetime
+from sqlalchemy import DDL, event
 from backend.app import db
+from backend.utils.url_utils import compute_url_hash
 import json
 
+
+def _default_url_hash(context):
+    """INSERT 시 url_hash가 지정되지 않으면 url에서 계산"""
+    return compute_url_hash(context.get_current_parameters().get('url'))
+
 class News(db.Model):
     __tablename__ = 'news'
     
@@ -10,6 +17,7 @@ class News(db.Model):
     title = db.Column(db.String(500), nullable=False)
     content = db.Column(db.Text)
     url = db.Column(db.Text, nullable=False)
+    url_hash = db.Column(db.String(40), default=_default_url_hash) # 정규화된 URL의 SHA-1 (중복 확인용)
     source = db.Column(db.String(200))
     published_at = db.Column(db.DateTime)
     crawled_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -23,6 +31,11 @@ class News(db.Model):
     # 관계
     artist = db.relationship('Artist', backref='news_articles', lazy=True)
     
+    __table_args__ = (
+        db.UniqueConstraint('artist_id', 'url_hash', name='unique_news_artist_url_hash'),
+        db.Index('idx_news_crawled_at_id', 'crawled_at', 'id'), # 키셋 페이지네이션용
+    )
+    
     def set_keywords(self, keywords_list):
         """키워드 리스트를 JSON으로 저장"""
         if isinstance(keywords_list, list):
@@ -34,11 +47,14 @@ class News(db.Model):
         """저장된 키워드 리스트를 반환"""
         return self.keywords if self.keywords else []
     
-    def to_dict(self):
+    def to_dict(self, artist_name=None):
+        """artist_name을 넘기면 artist 관계를 읽지 않음 (목록 조회 시 기사마다 SELECT 방지)"""
+        if artist_name is None and self.artist:
+            artist_name = self.artist.name
         return {
             'id': self.id,
             'artist_id': self.artist_id,
-            'artist_name': self.artist.name if self.artist else None,
+            'artist_name': artist_name,
             'title': self.title,
             'content': self.content,
             'url': self.url,
@@ -52,3 +68,12 @@ class News(db.Model):
             'thumbnail': self.thumbnail,
             'media_name': self.media_name
         }
+
+
+# 제목/본문 전문 검색용 FULLTEXT 인덱스 (한국어를 위해 ngram 파서 사용). 다른 DB에서는 일반
+# 인덱스가 되므로 MySQL에서만 생성 (마이그레이션: f7b0d5c2e8a4, autogenerate에서는 env.py에서 제외)
+event.listen(
+    News.__table__,
+    'after_create',
+    DDL("ALTER TABLE news ADD FULLTEXT INDEX ft_news_title_content (title, content) WITH PARSER ngram").execute_if(dialect='mysql')
+)
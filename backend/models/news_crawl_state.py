@@ -0,0 +1,39 @@
+from datetime import datetime
+from backend.app import db
+
+class NewsCrawlState(db.Model):
+    """아티스트별 증분 뉴스 크롤링 상태 (high-water mark)"""
+    __tablename__ = 'news_crawl_states'
+
+    # 최근 본 URL 해시를 몇 개까지 보관할지
+    MAX_RECENT_HASHES = 200
+
+    artist_id = db.Column(db.BigInteger, db.ForeignKey('Artists.id', ondelete='CASCADE'), primary_key=True)
+    last_published_at = db.Column(db.DateTime) # 지금까지 본 가장 최근 기사 발행일
+    recent_url_hashes = db.Column(db.JSON) # 최근 본 기사 url_hash 목록 (최신순)
+    empty_streak = db.Column(db.Integer, default=0, nullable=False) # 새 기사가 없었던 연속 크롤링 횟수
+    last_crawled_at = db.Column(db.DateTime)
+    next_crawl_at = db.Column(db.DateTime) # NULL이면 다음 실행 때 바로 크롤링
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def get_recent_url_hashes(self):
+        return self.recent_url_hashes if self.recent_url_hashes else []
+
+    def remember_url_hashes(self, url_hashes):
+        """새로 본 해시를 앞에 추가하고 MAX_RECENT_HASHES 개로 자름"""
+        merged = list(dict.fromkeys(list(url_hashes) + self.get_recent_url_hashes()))
+        self.recent_url_hashes = merged[:self.MAX_RECENT_HASHES]
+
+    def is_due(self, now=None):
+        now = now or datetime.utcnow()
+        return self.next_crawl_at is None or self.next_crawl_at <= now
+
+    def to_dict(self):
+        return {
+            'artist_id': self.artist_id,
+            'last_published_at': self.last_published_at.isoformat() if self.last_published_at else None,
+            'recent_url_hash_count': len(self.get_recent_url_hashes()),
+            'empty_streak': self.empty_streak,
+            'last_crawled_at': self.last_crawled_at.isoformat() if self.last_crawled_at else None,
+            'next_crawl_at': self.next_crawl_at.isoformat() if self.next_crawl_at else None
+        }
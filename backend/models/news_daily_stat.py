@@ -0,0 +1,24 @@
+from datetime import datetime
+from backend.app import db
+
+class NewsDailyStat(db.Model):
+    """일자 × 아티스트 × 감정별 뉴스 건수 집계 (통계 API가 news 테이블 대신 조회)"""
+    __tablename__ = 'news_daily_stats'
+
+    stat_date = db.Column(db.Date, primary_key=True) # 뉴스 수집일 (crawled_at 기준, UTC)
+    artist_id = db.Column(db.BigInteger, db.ForeignKey('Artists.id', ondelete='CASCADE'), primary_key=True)
+    sentiment = db.Column(db.Enum('positive', 'negative', 'neutral'), primary_key=True)
+    news_count = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('idx_news_daily_stats_artist', 'artist_id'),
+    )
+
+    def to_dict(self):
+        return {
+            'stat_date': self.stat_date.isoformat() if self.stat_date else None,
+            'artist_id': self.artist_id,
+            'sentiment': self.sentiment,
+            'news_count': self.news_count
+        }
@@ -0,0 +1,19 @@
+from datetime import datetime
+from backend.app import db
+
+class SchedulerLease(db.Model):
+    """스케줄러 리더 정보 (어느 프로세스가 예약 작업을 실행 중인지 표시)"""
+    __tablename__ = 'scheduler_leases'
+
+    name = db.Column(db.String(100), primary_key=True)
+    holder = db.Column(db.String(255), nullable=False) # hostname:pid:uuid
+    acquired_at = db.Column(db.DateTime, default=datetime.utcnow)
+    heartbeat_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'holder': self.holder,
+            'acquired_at': self.acquired_at.isoformat() if self.acquired_at else None,
+            'heartbeat_at': self.heartbeat_at.isoformat() if self.heartbeat_at else None
+        }
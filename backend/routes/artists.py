@@ -1,7 +1,7 @@
 from flask import Blueprint, request, jsonify, send_file, render_template, url_for, send_from_directory
 from ..app import db
 from backend.models.artist import Artist
-from backend.models import Channel, ChannelStat, News, Activity
+from backend.models import Job
 
 from datetime import datetime, date
 from reportlab.lib.pagesizes import letter
@@ -17,7 +17,16 @@ import requests # Import requests library
 from backend.utils.wikipedia_utils import get_artist_info_from_wikipedia # New import
 from backend.utils.gemini_utils import search_artist_ai # Added Gemini import
 from backend.utils.auth import require_role # Added import
-from backend.utils.wordcloud_generator import generate_wordcloud_for_artist, generate_wordcloud_from_text # Import wordcloud generator
+from backend.utils.wordcloud_generator import generate_wordcloud_from_text # Import wordcloud generator
+from backend.services.report_service import (
+    generate_report, validate_report_request, should_generate_in_background, get_puppeteer_health,
+    ReportError, REPORT_OUTPUT_DIR
+)
+from backend.services.scheduler import news_scheduler
+from backend.services.wordcloud_cache import get_wordcloud_cache
+from backend.services.wikipedia_cache import get_wikipedia_cache
+from backend.services.channel_rollups import get_platform_performance
+from backend.services.news_terms import get_top_keywords
 
 UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'frontend', 'public', 'images', 'artists', 'profile')
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
@@ -65,7 +74,8 @@ def search_and_generate_sql():
         else:
             # Fallback to Wikipedia
             logger.info(f"Gemini AI failed, falling back to Wikipedia for artist: {artist_name}")
-            artist_data = get_artist_info_from_wikipedia(artist_name)
+            revalidate = request.args.get('revalidate', 'false').lower() == 'true'
+            artist_data = get_artist_info_from_wikipedia(artist_name, revalidate=revalidate)
             
             if not artist_data:
                 logger.warning(f"No Wikipedia data found for artist: {artist_name}")
@@ -88,11 +98,17 @@ def search_and_generate_sql():
         top_keywords = []
         try:
             if wordcloud_text:
-                wordcloud_image, top_keywords = generate_wordcloud_from_text(wordcloud_text)
+                wordcloud_image, top_keywords = generate_wordcloud_from_text(wordcloud_text, preview=True)
         except Exception as wc_err:
             logger.error(f"Error generating wordcloud: {wc_err}")
             # Non-critical, continue without wordcloud
 
+        # 이미 등록된 아티스트는 수집된 뉴스의 키워드(단어 빈도 테이블)를 우선 사용
+        if existing_artist:
+            news_keywords = get_top_keywords(existing_artist.id, limit=20)
+            if news_keywords:
+                top_keywords = news_keywords
+
         return jsonify({
             'sql_query': sql_query,
             'python_script': python_script,
@@ -313,12 +329,14 @@ def get_dashboard_stats():
 
 @bp.route('/dashboard/channel-performance', methods=['GET'])
 def get_channel_performance():
-    """대시보드 채널 성과 조회"""
-    # Placeholder data for now. In a real scenario, this would query Channel and ChannelStat models.
+    """대시보드 채널 성과 조회 (최근 4주 주간 집계 기준)"""
     return jsonify([
-        {"platform": "Instagram", "growth": "+15%", "posts": 24},
-        {"platform": "YouTube", "growth": "+8%", "posts": 12},
-        {"platform": "TikTok", "growth": "+23%", "posts": 18}
+        {
+            "platform": performance['platform'].capitalize(),
+            "growth": f"{performance['growth_rate']:+.1f}%" if performance['growth_rate'] is not None else "N/A",
+            "posts": performance['post_delta']
+        }
+        for performance in get_platform_performance(days=28)
     ])
 
 @bp.route('/', methods=['POST'])
@@ -411,135 +429,76 @@ def update_artist(artist_id):
 
 @bp.route('/report', methods=['POST'], strict_slashes=False)
 def generate_artist_report():
-    """선택된 아티스트에 대한 보고서 생성"""
+    """선택된 아티스트에 대한 보고서 생성
+
+    아티스트가 많거나 async: true이면 report 작업을 등록하고 202와 상태 조회 URL을 반환한다.
+    """
     try:
         data = request.get_json()
         artist_ids = data.get('artist_ids', [])
         report_format = data.get('report_format', 'pdf') # 'pdf' or 'pptx'
 
-        if not artist_ids:
-            return jsonify({'error': '아티스트 ID가 제공되지 않았습니다.'}), 400
-
-        artists = Artist.query.filter(Artist.id.in_(artist_ids)).all()
-
-        if not artists:
-            return jsonify({'error': '선택된 아티스트를 찾을 수 없습니다.'}), 404
-
-        if report_format == 'pdf':
-            PUPPETEER_SERVICE_URL = "http://localhost:3001/generate-pdf"
-            artist_reports_data = []
-            
-            for artist in artists:
-                # --- Fetch related data for each artist ---
-                artist_channels = Channel.query.filter_by(artist_id=artist.id).all()
-                channel_stats_data = []
-                for channel in artist_channels:
-                    latest_stat = ChannelStat.query.filter_by(channel_id=channel.id).order_by(ChannelStat.stat_date.desc()).first()
-                    if latest_stat:
-                        channel_stats_data.append({
-                            'platform': channel.platform,
-                            'name': channel.channel_name,
-                            'url': channel.channel_url,
-                            'follower_count': latest_stat.follower_count,
-                            'engagement_rate': float(latest_stat.engagement_rate) if latest_stat.engagement_rate else 0.0
-                        })
-                
-                recent_news_articles = News.query.filter_by(artist_id=artist.id).order_by(News.published_at.desc()).limit(4).all()
-                
-                activities_cf = []
-                activities_broadcast = []
-                try:
-                    all_activities = Activity.query.filter_by(artist_id=artist.id).order_by(Activity.start_time.desc()).all()
-                    
-                    # Enhanced filtering for Korean/English activity types
-                    activities_cf = [a for a in all_activities if a.activity_type and any(kw in a.activity_type.upper() for kw in ['CF', 'AD', '광고', 'BRAND'])]
-                    activities_broadcast = [a for a in all_activities if a.activity_type and any(kw in a.activity_type.upper() for kw in ['DRAMA', 'MOVIE', 'TV', '방송', '영화', '드라마'])]
-                except Exception as act_err:
-                    logger.warning(f"Could not fetch activities for artist {artist.name}: {act_err}")
-                    db.session.rollback() # Important: rollback to clear the failed state
-                    # Continue without activities if there's a schema issue
-
-                profile_photo_filename = os.path.basename(artist.profile_photo) if artist.profile_photo else 'default.png'
-                profile_photo_url = url_for('artists.serve_profile_photo', filename=profile_photo_filename, _external=True)
-
-                # Generate word cloud for news analysis
-                wordcloud_base64, top_keywords = generate_wordcloud_for_artist(artist.id)
-
-                artist_reports_data.append({
-                    'artist': artist,
-                    'channel_stats': channel_stats_data,
-                    'news': recent_news_articles,
-                    'activities_cf': activities_cf,
-                    'activities_broadcast': activities_broadcast,
-                    'profile_photo_url': profile_photo_url,
-                    'wordcloud_image': wordcloud_base64,
-                    'top_keywords': top_keywords
-                })
-
-            artist_names_str = ", ".join([a.name for a in artists])
-            
-            rendered_html = render_template(
-                'report_template.html',
-                report_title="Artist Performance Analysis",
-                artist_names_summary=artist_names_str,
-                generation_date=datetime.now().strftime('%Y-%m-%d'),
-                author_name="theProjectCompany STRATEGIC ANALYSIS",
-                css_path=url_for('static', filename='css/report_styles.css', _external=True),
-                artist_reports=artist_reports_data,
-                footer_text="theProjectCompany MANAGEMENT - CONFIDENTIAL"
-            )
+        if should_generate_in_background(artist_ids, bool(data.get('async'))):
+            validate_report_request(artist_ids, report_format)
+            job = news_scheduler.enqueue_job('report', {'artist_ids': artist_ids, 'report_format': report_format})
+            return jsonify({
+                'message': '보고서 생성 작업이 등록되었습니다.',
+                'job': job,
+                'status_url': url_for('artists.get_report_job', job_id=job['id']),
+                'download_url': url_for('artists.download_report_job', job_id=job['id'])
+            }), 202
+
+        content, filename, mimetype = generate_report(artist_ids, report_format)
+        return send_file(BytesIO(content), download_name=filename, mimetype=mimetype)
+
+    except ReportError as e:
+        return jsonify({'error': str(e)}), e.status_code
+    except Exception as e:
+        logger.error(f"Error in generate_artist_report: {e}", exc_info=True)
+        return jsonify({'error': f'보고서 생성 중 시스템 오류가 발생했습니다: {str(e)}'}), 500
 
-            response = requests.post(
-                PUPPETEER_SERVICE_URL,
-                json={'htmlContent': rendered_html},
-                timeout=120
-            )
-            response.raise_for_status()
-            
-            pdf_buffer = BytesIO(response.content)
-            return send_file(
-                pdf_buffer,
-                download_name=f'artist_report_{datetime.now().strftime("%Y%m%d")}.pdf',
-                mimetype='application/pdf'
-            )
+@bp.route('/wordcloud-cache/stats', methods=['GET'])
+def get_wordcloud_cache_stats():
+    """워드클라우드 캐시 통계 조회 (히트/미스, 항목 수, 크기)"""
+    return jsonify(get_wordcloud_cache().stats())
 
-        elif report_format == 'pptx':
-            from pptx import Presentation
-            from pptx.util import Inches, Pt
-            prs = Presentation()
-
-            for artist in artists:
-                # Cover Slide
-                slide = prs.slides.add_slide(prs.slide_layouts[0])
-                slide.shapes.title.text = artist.name
-                slide.placeholders[1].text = "Artist Commercial Proposal"
-
-                if artist.profile_photo:
-                    image_full_path = os.path.join(UPLOAD_FOLDER, os.path.basename(artist.profile_photo))
-                    if os.path.exists(image_full_path):
-                        try:
-                            slide.shapes.add_picture(image_full_path, Inches(3), Inches(3), Inches(4), Inches(4))
-                        except: pass
-
-                # Details Slide
-                slide = prs.slides.add_slide(prs.slide_layouts[5])
-                slide.shapes.title.text = f"{artist.name} - Professional Profile"
-                
-                # Simple bullet points for PPTX
-                txBox = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(6), Inches(4))
-                tf = txBox.text_frame
-                tf.text = f"• Gender: {artist.gender}\n• Nationality: {artist.nationality}\n• Agency: {artist.current_agency_name}\n• Debut: {artist.debut_date}"
-
-            buffer = BytesIO()
-            prs.save(buffer)
-            buffer.seek(0)
-            return send_file(buffer, download_name=f'artist_report_{datetime.now().strftime("%Y%m%d")}.pptx', mimetype='application/vnd.openxmlformats-officedocument.presentationml.presentation')
-
-        return jsonify({'error': '지원되지 않는 보고서 형식입니다.'}), 400
+@bp.route('/wikipedia-cache/stats', methods=['GET'])
+def get_wikipedia_cache_stats():
+    """위키백과 문서 캐시 통계 조회 (히트/미스, 재확인/변경 수, 항목 수)"""
+    return jsonify(get_wikipedia_cache().stats())
 
+@bp.route('/report/pdf-service/health', methods=['GET'])
+def get_pdf_service_health():
+    """PDF 생성(Puppeteer) 서비스 상태 조회"""
+    try:
+        return jsonify(get_puppeteer_health())
     except Exception as e:
-        logger.error(f"Error in generate_artist_report: {e}", exc_info=True)
-        return jsonify({'error': f'보고서 생성 중 시스템 오류가 발생했습니다: {str(e)}'}), 500
+        logger.error(f"PDF 서비스 상태 조회 중 오류: {str(e)}")
+        return jsonify({'status': 'unavailable', 'error': str(e)}), 503
+
+@bp.route('/report/jobs/<int:job_id>', methods=['GET'])
+def get_report_job(job_id):
+    """보고서 작업 상태 조회 (완료되면 download_url 포함)"""
+    job = Job.query.filter_by(id=job_id, job_type='report').first_or_404()
+    result = job.to_dict()
+    if job.status == 'completed':
+        result['download_url'] = url_for('artists.download_report_job', job_id=job.id)
+    return jsonify(result)
+
+@bp.route('/report/jobs/<int:job_id>/download', methods=['GET'])
+def download_report_job(job_id):
+    """완료된 보고서 작업의 결과 파일 다운로드"""
+    job = Job.query.filter_by(id=job_id, job_type='report').first_or_404()
+    if job.status != 'completed':
+        return jsonify({'error': '보고서가 아직 생성되지 않았습니다.', 'status': job.status}), 409
+
+    report = job.get_result().get('items', {}).get('report')
+    if not report:
+        return jsonify({'error': '보고서 파일 정보를 찾을 수 없습니다.'}), 404
+    return send_from_directory(
+        REPORT_OUTPUT_DIR, report['file_name'], mimetype=report['mimetype'],
+        as_attachment=True, download_name=report.get('download_name', report['file_name'])
+    )
 
 @bp.route('/<int:artist_id>', methods=['DELETE'])
 def delete_artist(artist_id):
@@ -626,5 +585,5 @@ def trigger_news_crawl(artist_id):
     artist = Artist.query.get_or_404(artist_id)
     crawler = NewsCrawler()
     news_items = crawler.search_news_for_artist(artist)
-    saved_count = crawler.save_news_to_db(news_items, artist)
-    return jsonify({'message': f'{artist.name}에 대한 {saved_count}개 뉴스 크롤링 및 저장 완료', 'saved_count': saved_count})
\ No newline at end of file
+    saved = crawler.save_news_to_db(news_items, artist)
+    return jsonify({'message': f'{artist.name}에 대한 {saved.inserted}개 뉴스 크롤링 및 저장 완료', 'saved_count': saved.inserted, 'skipped_count': saved.skipped})
\ No newline at end of file
@@ -1,7 +1,15 @@
+import logging
+
 from flask import Blueprint, request, jsonify
 from ..app import db
-from backend.models import Channel, Artist
-from datetime import datetime
+from backend.models import Channel, Artist, ChannelStat
+from backend.services.channel_rollups import get_channel_series, get_growth_by_channel, rebuild_channel_rollups
+from backend.services.channel_stats import record_channel_stats, refresh_latest_stats
+from backend.services.channel_sync import ChannelSyncEngine, get_supported_platforms
+from backend.services.scheduler import news_scheduler
+from datetime import date, timedelta
+
+logger = logging.getLogger(__name__)
 
 bp = Blueprint('channels', __name__)
 
@@ -31,6 +39,66 @@ def get_channels():
         'current_page': page
     })
 
+@bp.route('/latest-stats/refresh', methods=['POST'])
+def refresh_channel_latest_stats():
+    """channel_stats에서 채널별 최신 통계를 다시 계산 (불일치 복구용)"""
+    data = request.get_json(silent=True) or {}
+    updated = refresh_latest_stats(data.get('channel_ids'))
+    db.session.commit()
+    return jsonify({'message': '채널 최신 통계를 갱신했습니다.', 'updated_count': updated})
+
+@bp.route('/rollups/rebuild', methods=['POST'])
+def rebuild_channel_stat_rollups():
+    """channel_stats에서 주/월 집계를 다시 생성"""
+    data = request.get_json(silent=True) or {}
+    row_count = rebuild_channel_rollups(data.get('channel_ids'))
+    return jsonify({'message': '채널 통계 집계를 재생성했습니다.', 'row_count': row_count})
+
+@bp.route('/sync', methods=['POST'])
+def sync_due_channels():
+    """갱신 주기가 지난 채널 일괄 동기화 (platform, force, max_workers, background)"""
+    data = request.get_json(silent=True) or {}
+    platform = data.get('platform')
+    if platform and platform not in get_supported_platforms():
+        return jsonify({'error': f'platform은 {", ".join(get_supported_platforms())} 중 하나여야 합니다.'}), 400
+
+    params = {key: data[key] for key in ('platform', 'force', 'max_workers', 'channel_ids') if data.get(key)}
+    if data.get('background'):
+        job = news_scheduler.enqueue_job('channel_sync', params, trigger='manual')
+        return jsonify({'message': '채널 동기화 작업이 등록되었습니다.', 'job': job}), 202
+
+    try:
+        engine = ChannelSyncEngine(max_workers=params.get('max_workers'))
+        channels = engine.select_channels(
+            channel_ids=params.get('channel_ids'), platform=platform, force=params.get('force', False)
+        )
+        summary = engine.sync_channels(channels)
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"채널 일괄 동기화 중 오류: {str(e)}")
+        return jsonify({'error': f'채널 동기화 중 오류가 발생했습니다: {str(e)}'}), 500
+    return jsonify(dict(summary, message=f"채널 {summary['synced']}개를 동기화했습니다."))
+
+@bp.route('/growth', methods=['GET'])
+def get_channels_growth():
+    """기간 내 전체 채널 성장률 (?from=&to=&bucket=week|month)"""
+    bucket = request.args.get('bucket', 'month')
+    if bucket not in ('week', 'month'):
+        return jsonify({'error': 'bucket은 week, month 중 하나여야 합니다.'}), 400
+    try:
+        date_to = date.fromisoformat(request.args['to']) if request.args.get('to') else date.today()
+        date_from = date.fromisoformat(request.args['from']) if request.args.get('from') else date_to - timedelta(days=365)
+    except ValueError:
+        return jsonify({'error': 'from, to는 YYYY-MM-DD 형식이어야 합니다.'}), 400
+
+    growth = get_growth_by_channel(date_from, date_to, bucket)
+    return jsonify({
+        'from': date_from.isoformat(),
+        'to': date_to.isoformat(),
+        'bucket': bucket,
+        'channels': list(growth.values())
+    })
+
 @bp.route('/<int:channel_id>', methods=['GET'])
 def get_channel(channel_id):
     """특정 채널 조회"""
@@ -91,18 +159,72 @@ def delete_channel(channel_id):
     
     return jsonify({'message': '채널이 삭제되었습니다.'}), 200
 
+@bp.route('/<int:channel_id>/stats', methods=['GET'])
+def get_channel_stats(channel_id):
+    """채널 통계 시계열 조회 (?from=&to=&bucket=day|week|month, 기본 day)"""
+    Channel.query.get_or_404(channel_id)
+    bucket = request.args.get('bucket', 'day')
+    if bucket not in ('day', 'week', 'month'):
+        return jsonify({'error': 'bucket은 day, week, month 중 하나여야 합니다.'}), 400
+    try:
+        date_from = date.fromisoformat(request.args['from']) if request.args.get('from') else None
+        date_to = date.fromisoformat(request.args['to']) if request.args.get('to') else None
+    except ValueError:
+        return jsonify({'error': 'from, to는 YYYY-MM-DD 형식이어야 합니다.'}), 400
+
+    return jsonify({
+        'channel_id': channel_id,
+        'bucket': bucket,
+        'stats': get_channel_series(channel_id, bucket, date_from, date_to)
+    })
+
+@bp.route('/<int:channel_id>/stats', methods=['POST'])
+def create_channel_stat(channel_id):
+    """채널 일별 통계 기록 (새로 만들면 201, 같은 날짜가 있으면 덮어쓰고 200)"""
+    channel = Channel.query.get_or_404(channel_id)
+    data = request.get_json() or {}
+
+    try:
+        stat_date = date.fromisoformat(data['stat_date']) if data.get('stat_date') else date.today()
+    except ValueError:
+        return jsonify({'error': 'stat_date는 YYYY-MM-DD 형식이어야 합니다.'}), 400
+
+    stat = ChannelStat.query.filter_by(channel_id=channel.id, stat_date=stat_date).first()
+    created = stat is None
+    if created:
+        stat = ChannelStat(channel_id=channel.id, stat_date=stat_date)
+        db.session.add(stat)
+    stat.follower_count = data.get('follower_count', stat.follower_count or 0)
+    stat.following_count = data.get('following_count', stat.following_count or 0)
+    stat.post_count = data.get('post_count', stat.post_count or 0)
+    stat.engagement_rate = data.get('engagement_rate', stat.engagement_rate or 0)
+
+    db.session.flush()
+    record_channel_stats([stat])
+    db.session.commit()
+
+    return jsonify(stat.to_dict()), 201 if created else 200
+
 @bp.route('/<int:channel_id>/sync', methods=['POST'])
 def sync_channel_data(channel_id):
-    """채널 데이터 동기화"""
+    """채널 데이터 동기화 (갱신 주기와 관계없이 즉시 외부 API 호출)"""
     channel = Channel.query.get_or_404(channel_id)
-    
-    # TODO: 실제 API 호출 로직 구현
-    # Instagram, YouTube API를 통해 최신 데이터 가져오기
-    
-    channel.last_sync_at = datetime.utcnow()
-    db.session.commit()
-    
+
+    try:
+        summary = ChannelSyncEngine(max_workers=1).sync_channels([channel])
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"채널 {channel_id} 동기화 중 오류: {str(e)}")
+        return jsonify({'error': f'채널 데이터 동기화 중 오류가 발생했습니다: {str(e)}'}), 500
+
+    result = summary['results'][channel.id]
+    if result['status'] != 'synced':
+        # 외부 API 실패는 502, 저장(DB) 실패는 500
+        status_code = 500 if result.get('stage') == 'save' else 502
+        return jsonify({'error': f"채널 데이터 동기화에 실패했습니다: {result['error']}"}), status_code
+
     return jsonify({
         'message': '채널 데이터가 동기화되었습니다.',
-        'last_sync_at': channel.last_sync_at.isoformat()
+        'last_sync_at': channel.last_sync_at.isoformat(),
+        'channel': channel.to_dict()
     })
@@ -1,7 +1,11 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from ..app import db
 from backend.models import Artist, Channel, ChannelStat, News # Assuming these models exist
 from sqlalchemy import func
+from backend.services.channel_analytics import get_channel_analytics
+from backend.services.channel_rollups import get_platform_performance
+from backend.services.channel_stats import get_channels_with_latest_stats
+from backend.services.news_stats import get_total_news_count
 
 def format_number_to_k_m(num):
     if num is None:
@@ -19,7 +23,7 @@ def get_dashboard_stats():
     """대시보드 통계 데이터 제공"""
     total_artists = Artist.query.count()
     total_channels = Channel.query.count()
-    total_news = News.query.count()
+    total_news = get_total_news_count() # news 전체 COUNT 대신 일자별 집계 합계
 
     stats = [
         {"icon": "Users", "color": "from-blue-500 to-cyan-500", "value": str(total_artists), "title": "총 아티스트", "change": "+2%"},
@@ -36,21 +40,18 @@ def get_recent_artists():
     # For now, let's assume 'id' can represent recency if no creation timestamp is available
     artists = Artist.query.order_by(Artist.id.desc()).limit(5).all() # Get up to 5 recent artists
 
+    # 최신 통계는 채널 컬럼에 비정규화되어 있으므로 아티스트 수와 관계없이 쿼리 1회
+    channels_by_artist = get_channels_with_latest_stats(artist.id for artist in artists)
+
     recent_artists_data = []
     for artist in artists:
-        # Fetch associated channels for each artist
-        channels = Channel.query.filter_by(artist_id=artist.id).all()
-        
-        # Aggregate channel info (platform and followers)
-        channel_info = []
-        for channel in channels:
-            # Assuming ChannelStat has 'followers' and is linked to Channel by 'channel_id'
-            latest_stat = ChannelStat.query.filter_by(channel_id=channel.id).order_by(ChannelStat.recorded_date.desc()).first()
-            followers = format_number_to_k_m(latest_stat.follower_count) if latest_stat else "N/A"
-            channel_info.append({
-                "platform": channel.platform, # Assuming 'platform' field exists in Channel model
-                "followers": followers
-            })
+        channel_info = [
+            {
+                "platform": channel.platform,
+                "followers": format_number_to_k_m(channel.follower_count) if channel.latest_stat_date else "N/A"
+            }
+            for channel in channels_by_artist.get(artist.id, [])
+        ]
 
         recent_artists_data.append({
             "name": artist.name,
@@ -62,11 +63,40 @@ def get_recent_artists():
 
 @bp.route('/channel-performance', methods=['GET'], strict_slashes=False)
 def get_channel_performance():
-    """채널 성과 데이터 제공"""
-    # TODO: 실제 채널 성과 데이터 로직 구현
-    # 예시 데이터
+    """채널 성과 데이터 제공 (최근 4주 주간 집계 기준 플랫폼별 팔로워 성장률, 게시물 증가 수)"""
     channel_performance = [
-        {"platform": "Instagram", "growth": "+15%", "posts": "120"},
-        {"platform": "Youtube", "growth": "+10%", "posts": "80"},
+        {
+            "platform": performance['platform'].capitalize(),
+            "growth": f"{performance['growth_rate']:+.1f}%" if performance['growth_rate'] is not None else "N/A",
+            "posts": str(performance['post_delta'])
+        }
+        for performance in get_platform_performance(days=28)
     ]
     return jsonify(channel_performance)
+
+@bp.route('/channel-analytics', methods=['GET'], strict_slashes=False)
+def get_channel_analytics_summary():
+    """전체 채널 성장률/이동 평균/이상치/참여율 백분위 (?days=90&artist_id=)"""
+    days = min(max(request.args.get('days', 90, type=int), 7), 730)
+    artist_id = request.args.get('artist_id', type=int)
+
+    channel_query = db.session.query(Channel.id, Channel.artist_id, Channel.platform, Channel.channel_name)
+    if artist_id:
+        channel_query = channel_query.filter(Channel.artist_id == artist_id)
+    channel_info = {row.id: row for row in channel_query}
+
+    # 아티스트를 지정하면 그 채널만 계산 (참여율 백분위는 전체 채널 분포 기준)
+    analytics = get_channel_analytics(days=days, channel_ids=list(channel_info) if artist_id else None)
+    channels = []
+    for channel_id, metrics in analytics['channels'].items():
+        info = channel_info.get(channel_id)
+        if info is None:
+            continue
+        channels.append(dict(metrics, artist_id=info.artist_id, platform=info.platform, channel_name=info.channel_name))
+
+    return jsonify({
+        'from': analytics['from'],
+        'to': analytics['to'],
+        'engagement_percentiles': analytics['engagement_percentiles'],
+        'channels': channels
+    })
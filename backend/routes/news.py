@@ -1,12 +1,17 @@
 from flask import Blueprint, request, jsonify
 from ..app import db
-from backend.models import News, Artist
+from backend.models import News, Artist, Job
 from backend.services.news_crawler import NewsCrawler
-from backend.services.scheduler import news_scheduler
+from backend.services.news_search import get_news_search_backend, highlight_terms, make_snippet
+from backend.services.news_stats import get_news_stats_summary, rebuild_news_stats, record_news_deleted, record_sentiment_change
+from backend.services.news_terms import get_term_frequencies, rebuild_news_terms, record_news_terms_deleted
+from backend.services.scheduler import news_scheduler, JOB_TYPES
+from backend.services.serpapi_cache import get_serpapi_cache
 from datetime import datetime, timedelta
 import logging
 import traceback # Added import
 from flask_cors import CORS
+from sqlalchemy.orm import contains_eager, joinedload, noload
 
 bp = Blueprint('news', __name__)
 CORS(bp) # Explicitly enable CORS for this blueprint
@@ -14,6 +19,15 @@ logger = logging.getLogger(__name__)
 
 # ... (sample_news_data remains the same)
 
+def _parse_news_cursor(cursor):
+    """'<crawled_at ISO>,<id>' 형식의 커서를 (datetime, id)로 변환"""
+    crawled_at_str, news_id = cursor.rsplit(',', 1)
+    return datetime.fromisoformat(crawled_at_str), int(news_id)
+
+def _encode_news_cursor(article):
+    return f"{article.crawled_at.isoformat()},{article.id}"
+
+
 @bp.route('/', methods=['GET'])
 @bp.route('', methods=['GET'])
 def get_news():
@@ -26,6 +40,9 @@ def get_news():
         sentiment = request.args.get('sentiment')
         days = request.args.get('days', 365, type=int)
         search_query = request.args.get('query')
+        # 커서 모드: ?cursor=<crawled_at,id> (첫 페이지는 빈 값), 전체 개수는 선택
+        cursor = request.args.get('cursor')
+        with_total = request.args.get('with_total', 'true').lower() != 'false'
 
         logger.debug(f"get_news params: artist_id={artist_id}, sentiment={sentiment}, days={days}, query={search_query}, sample={sample_mode}")
 
@@ -39,7 +56,8 @@ def get_news():
 
         # Try to fetch news from the database first
         # Use db.session.query for more explicit control
-        query = db.session.query(News).outerjoin(Artist) 
+        # 이미 조인한 Artist로 News.artist를 채워 to_dict()에서 기사마다 추가 SELECT가 나가지 않도록 함
+        query = db.session.query(News).outerjoin(Artist).options(contains_eager(News.artist))
         
         if artist_id:
             query = query.filter(News.artist_id == artist_id)
@@ -48,12 +66,12 @@ def get_news():
             query = query.filter(News.sentiment == sentiment)
         
         if search_query:
-            search_pattern = f'%{search_query}%'
+            # 제목/본문은 전문 검색 인덱스로, 아티스트 이름은 (작은) Artists 테이블에서만 LIKE 검색
+            matching_artist_ids = db.select(Artist.id).where(Artist.name.ilike(f'%{search_query}%'))
             query = query.filter(
                 db.or_(
-                    News.title.ilike(search_pattern),
-                    News.content.ilike(search_pattern),
-                    Artist.name.ilike(search_pattern)
+                    News.id.in_(get_news_search_backend().match_ids_select(search_query)),
+                    News.artist_id.in_(matching_artist_ids)
                 )
             )
         
@@ -63,9 +81,12 @@ def get_news():
             logger.debug(f"Filtering news since: {start_date}")
             query = query.filter(News.crawled_at >= start_date)
         
+        if cursor is not None:
+            return _get_news_by_cursor(query, cursor, per_page, with_total)
+
         # 최신순 정렬
-        pagination = query.order_by(News.crawled_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
+        pagination = query.order_by(News.crawled_at.desc(), News.id.desc()).paginate(
+            page=page, per_page=per_page, error_out=False, count=with_total
         )
 
         logger.debug(f"News found in DB: {len(pagination.items)} (Total: {pagination.total})")
@@ -97,6 +118,92 @@ def get_news():
         logger.error(traceback.format_exc())
         return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
 
+def _get_news_by_cursor(query, cursor, per_page, with_total):
+    """(crawled_at, id) 복합 인덱스를 따라 seek하는 키셋 페이지네이션 (OFFSET/COUNT 없음)
+
+    crawled_at이 없는 행은 커서로 위치를 표현할 수 없으므로 제외한다. (days 필터를 쓰면
+    어차피 제외되는 행)
+    """
+    query = query.filter(News.crawled_at.isnot(None))
+    total = query.order_by(None).count() if with_total else None
+
+    if cursor:
+        try:
+            cursor_crawled_at, cursor_id = _parse_news_cursor(cursor)
+        except ValueError:
+            return jsonify({'error': '유효하지 않은 cursor 값입니다. (형식: <crawled_at>,<id>)'}), 400
+        query = query.filter(
+            db.or_(
+                News.crawled_at < cursor_crawled_at,
+                db.and_(News.crawled_at == cursor_crawled_at, News.id < cursor_id)
+            )
+        )
+
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    rows = query.order_by(News.crawled_at.desc(), News.id.desc()).limit(per_page + 1).all()
+    has_more = len(rows) > per_page
+    items = rows[:per_page]
+
+    return jsonify({
+        'news': [article.to_dict() for article in items],
+        'next_cursor': _encode_news_cursor(items[-1]) if has_more else None,
+        'has_more': has_more,
+        'total': total
+    })
+
+
+@bp.route('/search', methods=['GET'])
+def search_news():
+    """뉴스 전문 검색 (관련도순, 검색어 강조 스니펫 포함)"""
+    search_query = (request.args.get('q') or request.args.get('query') or '').strip()
+    if not search_query:
+        return jsonify({'error': '검색어(q)가 필요합니다.'}), 400
+
+    artist_id = request.args.get('artist_id', type=int)
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', 10, type=int), 1), 100)
+
+    try:
+        search_backend = get_news_search_backend()
+        ranked = search_backend.search(search_query, artist_id=artist_id, limit=per_page, offset=(page - 1) * per_page)
+        articles = {
+            article.id: article
+            for article in News.query.options(joinedload(News.artist)).filter(News.id.in_([news_id for news_id, _ in ranked])).all()
+        } if ranked else {}
+
+        results = []
+        for news_id, score in ranked:
+            article = articles.get(news_id)
+            if article is None:
+                # 인덱스에만 남아 있는 삭제된 기사
+                continue
+            item = article.to_dict()
+            item['score'] = score
+            item['title_highlight'] = highlight_terms(article.title, search_query)
+            item['snippet'] = make_snippet(article.content, search_query)
+            results.append(item)
+
+        return jsonify({
+            'news': results,
+            'query': search_query,
+            'backend': search_backend.name,
+            'current_page': page,
+            'has_more': len(ranked) == per_page
+        })
+    except Exception as e:
+        logger.error(f"뉴스 검색 중 오류: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/search/reindex', methods=['POST'])
+def reindex_news_search():
+    """전문 검색 인덱스 재생성 (로컬 FTS 인덱스 사용 시)"""
+    try:
+        search_backend = get_news_search_backend()
+        indexed = search_backend.rebuild()
+        return jsonify({'message': '뉴스 검색 인덱스를 재생성했습니다.', 'backend': search_backend.name, 'indexed_count': indexed})
+    except Exception as e:
+        logger.error(f"뉴스 검색 인덱스 재생성 중 오류: {str(e)}")
+        return jsonify({'error': str(e)}), 500
 
 @bp.route('/<int:news_id>', methods=['GET'])
 def get_news_article(news_id):
@@ -113,7 +220,8 @@ def get_news_by_artist(artist_id):
     per_page = request.args.get('per_page', 10, type=int)
     days = request.args.get('days', 30, type=int)
     
-    query = News.query.filter_by(artist_id=artist_id)
+    # 모든 기사가 같은 아티스트이므로 artist 관계는 읽지 않고 이름을 직접 넘김 (기사별 SELECT 방지)
+    query = News.query.options(noload(News.artist)).filter_by(artist_id=artist_id)
     
     # 날짜 필터링
     if days:
@@ -126,7 +234,7 @@ def get_news_by_artist(artist_id):
     
     return jsonify({
         'artist': artist.to_dict(),
-        'news': [article.to_dict() for article in news.items],
+        'news': [article.to_dict(artist_name=artist.name) for article in news.items],
         'total': news.total,
         'pages': news.pages,
         'current_page': page
@@ -137,6 +245,8 @@ def crawl_news():
     """수동으로 뉴스 크롤링 실행"""
     try:
         artist_id = request.json.get('artist_id') if request.json else None
+        max_workers = request.json.get('max_workers') if request.json else None
+        incremental = bool(request.json.get('incremental', False)) if request.json else False
         
         crawler = NewsCrawler()
         
@@ -144,16 +254,17 @@ def crawl_news():
             # 특정 아티스트만 크롤링
             artist = Artist.query.get_or_404(artist_id)
             news_items = crawler.search_news_for_artist(artist)
-            saved_count = crawler.save_news_to_db(news_items, artist)
+            saved = crawler.save_news_to_db(news_items, artist)
             
             return jsonify({
                 'message': f'{artist.name}에 대한 뉴스 크롤링이 완료되었습니다.',
                 'artist_name': artist.name,
-                'saved_count': saved_count
+                'saved_count': saved.inserted,
+                'skipped_count': saved.skipped
             })
         else:
             # 모든 아티스트 크롤링
-            results = crawler.crawl_news_for_all_artists()
+            results = crawler.crawl_news_for_all_artists(max_workers=max_workers, incremental=incremental)
             total_news = sum(results.values())
             
             return jsonify({
@@ -168,10 +279,17 @@ def crawl_news():
 
 @bp.route('/scheduler/status', methods=['GET'])
 def get_scheduler_status():
-    """스케줄러 상태 조회"""
+    """스케줄러 상태 조회 (실행 중/최근 작업 포함)"""
+    active_job_ids = news_scheduler.get_active_job_ids()
+    recent_jobs = Job.query.order_by(Job.id.desc()).limit(10).all()
     return jsonify({
         'is_running': news_scheduler.is_running,
-        'next_run_time': news_scheduler.get_next_run_time()
+        'is_leader': news_scheduler.is_leader,
+        'identity': news_scheduler.identity,
+        'leader': news_scheduler.get_leader_info(),
+        'next_run_time': news_scheduler.get_next_run_time(),
+        'active_jobs': [job.to_dict() for job in Job.query.filter(Job.id.in_(active_job_ids)).all()] if active_job_ids else [],
+        'recent_jobs': [job.to_dict() for job in recent_jobs]
     })
 
 @bp.route('/scheduler/start', methods=['POST'])
@@ -199,61 +317,116 @@ def stop_scheduler():
 
 @bp.route('/scheduler/run', methods=['POST'])
 def run_scheduler_manual():
-    """수동으로 스케줄러 실행"""
+    """수동으로 뉴스 크롤링 작업 실행 (백그라운드)"""
     try:
-        news_scheduler.run_manual_crawl()
-        return jsonify({'message': '수동 뉴스 크롤링이 실행되었습니다.'})
+        params = request.get_json(silent=True) or {}
+        job = news_scheduler.run_manual_crawl(params)
+        return jsonify({'message': '수동 뉴스 크롤링 작업이 등록되었습니다.', 'job': job}), 202
     except Exception as e:
         logger.error(f"수동 크롤링 실행 중 오류: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@bp.route('/scheduler/jobs', methods=['GET'])
+def get_scheduler_jobs():
+    """작업 목록 조회"""
+    limit = request.args.get('limit', 20, type=int)
+    status = request.args.get('status')
+    job_type = request.args.get('job_type')
+
+    query = Job.query
+    if status:
+        query = query.filter(Job.status == status)
+    if job_type:
+        query = query.filter(Job.job_type == job_type)
+
+    jobs = query.order_by(Job.id.desc()).limit(limit).all()
+    return jsonify({'jobs': [job.to_dict() for job in jobs]})
+
+@bp.route('/scheduler/jobs', methods=['POST'])
+def create_scheduler_job():
+    """작업 등록 (news_crawl, instagram_refresh, channel_sync, report)"""
+    data = request.get_json(silent=True) or {}
+    job_type = data.get('job_type')
+    if job_type not in JOB_TYPES:
+        return jsonify({'error': f'job_type은 {", ".join(JOB_TYPES)} 중 하나여야 합니다.'}), 400
+
+    try:
+        job = news_scheduler.enqueue_job(job_type, data.get('params', {}), trigger='manual')
+        return jsonify({'message': '작업이 등록되었습니다.', 'job': job}), 202
+    except Exception as e:
+        logger.error(f"작업 등록 중 오류: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/scheduler/jobs/<int:job_id>', methods=['GET'])
+def get_scheduler_job(job_id):
+    """작업 상태/진행률 조회"""
+    job = Job.query.get_or_404(job_id)
+    return jsonify(job.to_dict())
+
+@bp.route('/serpapi-cache/stats', methods=['GET'])
+def get_serpapi_cache_stats():
+    """SerpAPI 응답 캐시 통계 조회 (히트/미스, 항목 수)"""
+    try:
+        return jsonify(get_serpapi_cache().stats())
+    except Exception as e:
+        logger.error(f"SerpAPI 캐시 통계 조회 중 오류: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @bp.route('/stats', methods=['GET'])
 def get_news_stats():
-    """뉴스 통계 조회"""
+    """뉴스 통계 조회 (news_daily_stats 집계 테이블 사용)"""
     try:
-        # 전체 뉴스 수
-        total_news = News.query.count()
-        
-        # 최근 7일간 뉴스 수
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        recent_news = News.query.filter(News.crawled_at >= week_ago).count()
-        
-        # 아티스트별 뉴스 수
-        artist_news_counts = db.session.query(
-            Artist.id,
-            Artist.name,
-            db.func.count(News.id).label('news_count')
-        ).join(News).group_by(Artist.id, Artist.name).all()
-        
-        # 감정별 뉴스 수
-        sentiment_counts = db.session.query(
-            News.sentiment,
-            db.func.count(News.id).label('count')
-        ).group_by(News.sentiment).all()
-        
-        return jsonify({
-            'total_news': total_news,
-            'recent_news': recent_news,
-            'artist_news_counts': [
-                {'id': artist_id, 'artist_name': name, 'news_count': count} 
-                for artist_id, name, count in artist_news_counts
-            ],
-            'sentiment_counts': [
-                {'sentiment': sentiment, 'count': count} 
-                for sentiment, count in sentiment_counts
-            ]
-        })
-        
+        return jsonify(get_news_stats_summary(recent_days=7))
     except Exception as e:
         logger.error(f"뉴스 통계 조회 중 오류: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@bp.route('/stats/rebuild', methods=['POST'])
+def rebuild_news_stats_rollup():
+    """news 테이블에서 통계 집계를 다시 계산 (불일치 복구용)"""
+    try:
+        row_count = rebuild_news_stats()
+        return jsonify({'message': '뉴스 통계 집계를 재생성했습니다.', 'row_count': row_count})
+    except Exception as e:
+        logger.error(f"뉴스 통계 집계 재생성 중 오류: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/artist/<int:artist_id>/keywords', methods=['GET'])
+def get_artist_keywords(artist_id):
+    """아티스트 뉴스 키워드 빈도 (?days=30&limit=20, days가 없으면 전체 기간)"""
+    Artist.query.get_or_404(artist_id)
+    days = request.args.get('days', type=int)
+    limit = min(request.args.get('limit', 20, type=int), 200)
+    if days is not None and days < 1:
+        return jsonify({'error': 'days는 1 이상이어야 합니다.'}), 400
+
+    frequencies = get_term_frequencies(artist_id, limit=limit, days=days)
+    return jsonify({
+        'artist_id': artist_id,
+        'days': days,
+        'keywords': [{'term': term, 'count': count} for term, count in frequencies.items()]
+    })
+
+@bp.route('/terms/rebuild', methods=['POST'])
+def rebuild_news_term_index():
+    """뉴스 본문에서 아티스트별 단어 빈도를 다시 계산 (초기 생성/불일치 복구용)"""
+    data = request.get_json(silent=True) or {}
+    try:
+        news_count = rebuild_news_terms(data.get('artist_ids'))
+        return jsonify({'message': '뉴스 단어 빈도를 재생성했습니다.', 'news_count': news_count})
+    except Exception as e:
+        logger.error(f"뉴스 단어 빈도 재생성 중 오류: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @bp.route('/<int:news_id>', methods=['DELETE'])
 def delete_news(news_id):
     """뉴스 기사 삭제"""
     article = News.query.get_or_404(news_id)
+    record_news_deleted(article)
+    record_news_terms_deleted(article)
     db.session.delete(article)
     db.session.commit()
+    get_news_search_backend().remove_news(news_id)
     
     return jsonify({'message': '뉴스 기사가 삭제되었습니다.'}), 200
 
@@ -267,6 +440,7 @@ def update_sentiment(news_id):
     if sentiment not in ['positive', 'negative', 'neutral']:
         return jsonify({'error': '유효하지 않은 감정 값입니다.'}), 400
     
+    record_sentiment_change(article, article.sentiment, sentiment)
     article.sentiment = sentiment
     article.relevance_score = data.get('relevance_score', article.relevance_score)
     article.is_processed = True
@@ -6,6 +6,11 @@ from serpapi import GoogleSearch
 
 import pandas as pd
 
+try:
+    from services.serpapi_cache import get_serpapi_cache
+except ImportError:
+    from backend.services.serpapi_cache import get_serpapi_cache
+
 # Optional: natural-language dates like "2 hours ago"
 try:
     import dateparser
@@ -33,7 +38,7 @@ def _parse_date(s: str):
     return pd.NaT
 
 
-def search_news_serpapi(query: str, max_retries: int = 3) -> pd.DataFrame:
+def search_news_serpapi(query: str, max_retries: int = 3, use_cache: bool = True) -> pd.DataFrame:
     if not SERP_API_KEY:
         raise RuntimeError("SERPAPI_API_KEY environment variable is not set.")
 
@@ -48,11 +53,15 @@ def search_news_serpapi(query: str, max_retries: int = 3) -> pd.DataFrame:
 
     results = None
     last_error = None
+    cache = get_serpapi_cache() if use_cache else None
     
     for attempt in range(max_retries):
         try:
             print(f"SerpAPI 요청 시도 {attempt + 1}/{max_retries}")
-            results = GoogleSearch(params).get_dict()
+            if cache:
+                results = cache.get_or_fetch(params, lambda: GoogleSearch(params).get_dict())
+            else:
+                results = GoogleSearch(params).get_dict()
             news_results = results.get('news_results', [])
             if not news_results:
                 print("뉴스 결과를 찾을 수 없습니다.")
@@ -0,0 +1,274 @@
+import logging
+from datetime import date, timedelta
+from typing import Iterable, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from sqlalchemy import func
+
+from backend.app import db
+from backend.models import ChannelStat, ChannelStatRollup
+from backend.services.channel_rollups import period_start
+
+logger = logging.getLogger(__name__)
+
+# 이동 평균/이상치 탐지에 쓰는 기본 창 크기(일)
+DEFAULT_MOVING_AVERAGE_WINDOW = 7
+DEFAULT_ANOMALY_WINDOW = 28
+# 일일 팔로워 증감의 z-score가 이 값을 넘으면 이상치로 표시
+DEFAULT_ANOMALY_Z = 3.0
+ENGAGEMENT_PERCENTILES = (25, 50, 75, 90)
+
+
+class StatMatrix(NamedTuple):
+    """채널 × 일자 열 지향 통계 (통계가 없는 날은 NaN)"""
+    channel_ids: np.ndarray # (C,) 오름차순
+    start_date: date
+    followers: np.ndarray # (C, D) float64
+    engagement: np.ndarray # (C, D) float64
+
+    @property
+    def num_days(self) -> int:
+        return self.followers.shape[1]
+
+
+def build_stat_matrix(channel_ids, day_offsets, followers, engagement, start_date: date, num_days: int) -> StatMatrix:
+    """(channel_id, 시작일 기준 일수, 팔로워, 참여율) 열 배열을 채널 × 일자 행렬로 배치"""
+    channel_ids = np.asarray(channel_ids, dtype=np.int64)
+    if len(channel_ids) and np.all(channel_ids[1:] >= channel_ids[:-1]):
+        # channel_id순으로 정렬된 입력(조회 시 ORDER BY)은 정렬 없이 행 번호 계산
+        boundaries = np.concatenate([[True], channel_ids[1:] != channel_ids[:-1]])
+        unique_ids = channel_ids[boundaries]
+        rows = np.cumsum(boundaries) - 1
+    else:
+        unique_ids, rows = np.unique(channel_ids, return_inverse=True)
+    cols = np.asarray(day_offsets, dtype=np.int64)
+
+    follower_matrix = np.full((len(unique_ids), num_days), np.nan)
+    engagement_matrix = np.full((len(unique_ids), num_days), np.nan)
+    follower_matrix[rows, cols] = np.asarray(followers, dtype=np.float64)
+    engagement_matrix[rows, cols] = np.asarray(engagement, dtype=np.float64)
+    return StatMatrix(unique_ids, start_date, follower_matrix, engagement_matrix)
+
+
+def load_stat_matrix(date_from: date, date_to: date, channel_ids: Optional[Iterable[int]] = None) -> StatMatrix:
+    """channel_stats를 ORM 객체 없이 열 단위로 읽어 StatMatrix 생성 (date_to 포함)"""
+    query = db.session.query(
+        ChannelStat.channel_id, ChannelStat.stat_date, ChannelStat.follower_count, ChannelStat.engagement_rate
+    ).filter(ChannelStat.stat_date >= date_from, ChannelStat.stat_date <= date_to)
+    if channel_ids is not None:
+        query = query.filter(ChannelStat.channel_id.in_(list(channel_ids)))
+    rows = query.order_by(ChannelStat.channel_id).all()
+
+    num_days = (date_to - date_from).days + 1
+    if not rows:
+        return build_stat_matrix([], [], [], [], date_from, num_days)
+
+    ids, stat_dates, followers, engagement = zip(*rows)
+    day_offsets = (np.array(stat_dates, dtype='datetime64[D]') - np.datetime64(date_from, 'D')).astype(np.int64)
+    engagement = [np.nan if value is None else float(value) for value in engagement]
+    followers = [np.nan if value is None else value for value in followers]
+    return build_stat_matrix(ids, day_offsets, followers, engagement, date_from, num_days)
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """행마다 NaN을 직전 값으로 채움 (첫 관측 이전은 NaN 유지)"""
+    mask = np.isnan(values)
+    index = np.where(~mask, np.arange(values.shape[1]), 0)
+    np.maximum.accumulate(index, axis=1, out=index)
+    filled = values[np.arange(values.shape[0])[:, None], index]
+    # 첫 관측 이전 구간은 index가 0이고 값도 NaN이라 그대로 NaN
+    return filled
+
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """NaN을 제외한 후행 이동 평균 (창 안에 값이 없으면 NaN)"""
+    valid = ~np.isnan(values)
+    sums = np.cumsum(np.where(valid, values, 0.0), axis=1)
+    counts = np.cumsum(valid, axis=1)
+    sums[:, window:] = sums[:, window:] - sums[:, :-window]
+    counts[:, window:] = counts[:, window:] - counts[:, :-window]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def trailing_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """마지막 window일의 NaN 제외 평균 (moving_average()의 마지막 열과 같음)"""
+    tail = values[:, -window:]
+    valid = ~np.isnan(tail)
+    counts = valid.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, np.where(valid, tail, 0.0).sum(axis=1) / counts, np.nan)
+
+
+def growth_rates(filled_followers: np.ndarray, days: int) -> np.ndarray:
+    """마지막 날 대비 days일 전 팔로워 성장률(%) (forward_fill()한 행렬을 받음)"""
+    filled = filled_followers
+    end = filled[:, -1]
+    start = filled[:, max(filled.shape[1] - 1 - days, 0)]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(start > 0, (end - start) / start * 100.0, np.nan)
+
+
+def _preceding_window_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """각 열 d에 대해 [d - window, d) 구간 합. 누적합 S(앞에 0 추가)에서 S[d] - S[max(d - window, 0)]"""
+    cumulative = np.zeros((values.shape[0], values.shape[1] + 1))
+    np.cumsum(values, axis=1, out=cumulative[:, 1:])
+    sums = cumulative[:, :-1].copy()
+    if window < values.shape[1]:
+        sums[:, window:] -= cumulative[:, :-1 - window]
+    return sums
+
+
+def anomaly_flags(followers: np.ndarray, window: int = DEFAULT_ANOMALY_WINDOW,
+                  z_threshold: float = DEFAULT_ANOMALY_Z, filled: Optional[np.ndarray] = None) -> np.ndarray:
+    """일일 팔로워 증감이 직전 window일 평균에서 z_threshold 표준편차 이상 벗어난 날 (C, D) bool"""
+    if filled is None:
+        filled = forward_fill(followers)
+    deltas = np.full(filled.shape, np.nan)
+    deltas[:, 1:] = np.diff(filled, axis=1)
+    # 실제로 관측된 날만 평가
+    deltas[np.isnan(followers)] = np.nan
+
+    valid = ~np.isnan(deltas)
+    values = np.where(valid, deltas, 0.0)
+    # 당일을 제외한 직전 window일의 합/제곱합/개수
+    window_sum = _preceding_window_sum(values, window)
+    window_sq = _preceding_window_sum(values * values, window)
+    window_count = _preceding_window_sum(valid.astype(np.float64), window)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = window_sum / window_count
+        variance = np.maximum(window_sq / window_count - mean * mean, 0.0)
+        std = np.sqrt(variance)
+        z = np.abs(deltas - mean) / std
+    # 비교 기준이 부족한 날(관측 2개 미만, 표준편차 0)은 판단하지 않음
+    return valid & (window_count >= 2) & (std > 0) & (z > z_threshold)
+
+
+def engagement_summary(engagement: np.ndarray, percentiles=ENGAGEMENT_PERCENTILES,
+                       population: Optional[np.ndarray] = None):
+    """채널별 평균 참여율, 채널 간 백분위 순위(0~100), 전체 분포의 백분위 값
+
+    population(행렬에 없는 나머지 채널들의 평균 참여율)을 주면 행렬의 채널과 합친 분포 기준으로
+    순위를 매긴다. 일부 채널만 계산할 때 전체 채널 대비 순위를 유지하기 위해 사용한다.
+    """
+    valid = ~np.isnan(engagement)
+    counts = valid.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(counts > 0, np.where(valid, engagement, 0.0).sum(axis=1) / counts, np.nan)
+
+    ranks = np.full(means.shape, np.nan)
+    has_mean = ~np.isnan(means)
+    # 합산 순서에 따른 부동소수 오차로 동점이 갈리지 않도록 반올림한 값으로 순위 계산
+    observed = np.round(means[has_mean], 8)
+    reference = observed
+    if population is not None:
+        reference = np.concatenate([observed, np.round(population[~np.isnan(population)], 8)])
+    if len(reference):
+        # 자신보다 작은 값의 비율 (동점은 절반 반영)
+        sorted_means = np.sort(reference)
+        below = np.searchsorted(sorted_means, observed, side='left')
+        equal = np.searchsorted(sorted_means, observed, side='right') - below
+        ranks[has_mean] = (below + 0.5 * equal) / len(reference) * 100.0
+        distribution = dict(zip(percentiles, np.percentile(reference, percentiles).tolist()))
+    else:
+        distribution = {p: None for p in percentiles}
+    return means, ranks, distribution
+
+
+def load_engagement_population(date_from: date, date_to: date,
+                               exclude_channel_ids: Optional[Sequence[int]] = None) -> np.ndarray:
+    """exclude_channel_ids를 뺀 나머지 채널의 기간 평균 참여율 (주간 집계를 표본 수로 가중 평균)
+
+    channel_stats 일별 원본 대신 채널당 몇 개 행뿐인 집계 테이블을 읽으므로, 일부 채널만
+    분석할 때도 전체 채널 대비 참여율 순위를 싸게 구할 수 있다. 기간 경계 주는 주 전체로 계산된다.
+    """
+    weighted = func.sum(ChannelStatRollup.avg_engagement_rate * ChannelStatRollup.sample_count)
+    rows = db.session.query(
+        (weighted / func.sum(ChannelStatRollup.sample_count)).label('avg_engagement_rate')
+    ).filter(
+        ChannelStatRollup.channel_id.notin_(exclude_channel_ids or []),
+        ChannelStatRollup.bucket == 'week',
+        ChannelStatRollup.period_start >= period_start(date_from, 'week'),
+        ChannelStatRollup.period_start <= date_to,
+        ChannelStatRollup.avg_engagement_rate.isnot(None)
+    ).group_by(ChannelStatRollup.channel_id).all()
+    return np.array([float(value) for (value,) in rows if value is not None], dtype=np.float64)
+
+
+def _clean(value):
+    return None if value is None or np.isnan(value) else round(float(value), 4)
+
+
+def _to_list(values: np.ndarray, decimals: int = 4) -> list:
+    """NaN은 None으로 바꿔 JSON 직렬화 가능한 리스트로 변환 (행마다 round() 호출 없이 일괄 처리)"""
+    result = np.round(values, decimals).astype(object)
+    result[np.isnan(values)] = None
+    return result.tolist()
+
+
+def compute_channel_analytics(matrix: StatMatrix, growth_days=(7, 30),
+                              ma_window: int = DEFAULT_MOVING_AVERAGE_WINDOW,
+                              anomaly_window: int = DEFAULT_ANOMALY_WINDOW,
+                              z_threshold: float = DEFAULT_ANOMALY_Z,
+                              engagement_population: Optional[np.ndarray] = None) -> dict:
+    """StatMatrix의 모든 채널에 대해 성장률, 이동 평균, 이상치, 참여율 백분위를 한 번에 계산
+
+    engagement_population(나머지 채널의 평균 참여율)을 주면 참여율 백분위를 전체 채널 기준으로 계산한다.
+    """
+    if len(matrix.channel_ids) == 0:
+        return {'channels': {}, 'engagement_percentiles': {p: None for p in ENGAGEMENT_PERCENTILES}}
+
+    filled = forward_fill(matrix.followers)
+    growth = {f'{days}d': _to_list(growth_rates(filled, days)) for days in growth_days}
+    follower_ma = _to_list(trailing_mean(matrix.followers, ma_window))
+    engagement_ma = _to_list(trailing_mean(matrix.engagement, ma_window))
+    anomalies = anomaly_flags(matrix.followers, anomaly_window, z_threshold, filled=filled)
+    engagement_means, engagement_ranks, distribution = engagement_summary(
+        matrix.engagement, population=engagement_population
+    )
+    engagement_means, engagement_ranks = _to_list(engagement_means), _to_list(engagement_ranks)
+    latest_followers = _to_list(filled[:, -1], decimals=0)
+
+    day_labels = [(matrix.start_date + timedelta(days=col)).isoformat() for col in range(matrix.num_days)]
+    anomaly_dates = {}
+    for row, col in zip(*(index.tolist() for index in np.nonzero(anomalies))):
+        anomaly_dates.setdefault(row, []).append(day_labels[col])
+
+    channels = {}
+    for row, channel_id in enumerate(matrix.channel_ids.tolist()):
+        channels[channel_id] = {
+            'channel_id': channel_id,
+            'follower_count': None if latest_followers[row] is None else int(latest_followers[row]),
+            'growth_rates': {label: values[row] for label, values in growth.items()},
+            'follower_moving_average': follower_ma[row],
+            'engagement_moving_average': engagement_ma[row],
+            'avg_engagement_rate': engagement_means[row],
+            'engagement_percentile': engagement_ranks[row],
+            'anomaly_dates': anomaly_dates.get(row, [])
+        }
+    return {
+        'channels': channels,
+        'engagement_percentiles': {p: _clean(v) for p, v in distribution.items()}
+    }
+
+
+def get_channel_analytics(days: int = 90, channel_ids: Optional[Iterable[int]] = None,
+                          date_to: Optional[date] = None) -> dict:
+    """최근 days일 통계를 읽어 채널 분석 결과 반환 (대시보드/보고서용)
+
+    channel_ids를 주면 해당 채널의 일별 통계만 읽는다. 이때 나머지 채널의 평균 참여율은
+    주간 집계에서 읽어 참여율 백분위를 전체 채널 기준으로 유지한다.
+    """
+    date_to = date_to or date.today()
+    date_from = date_to - timedelta(days=days - 1)
+    population = None
+    if channel_ids is not None:
+        channel_ids = list(channel_ids)
+        population = load_engagement_population(date_from, date_to, channel_ids)
+    matrix = load_stat_matrix(date_from, date_to, channel_ids)
+    result = compute_channel_analytics(matrix, engagement_population=population)
+    result['from'] = date_from.isoformat()
+    result['to'] = date_to.isoformat()
+    return result
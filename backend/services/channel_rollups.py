@@ -0,0 +1,277 @@
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, insert
+
+from backend.app import db
+from backend.models import Channel, ChannelStat, ChannelStatRollup
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_BUCKETS = ('week', 'month')
+# 전체 재계산 시 한 번에 처리할 채널 수
+REBUILD_CHANNEL_CHUNK = 200
+
+
+def period_start(day: date, bucket: str) -> date:
+    """day가 속한 구간의 시작일 (주: 월요일, 월: 1일)"""
+    if bucket == 'week':
+        return day - timedelta(days=day.weekday())
+    if bucket == 'month':
+        return day.replace(day=1)
+    raise ValueError(f"지원하지 않는 bucket: {bucket}")
+
+
+def next_period_start(start: date, bucket: str) -> date:
+    if bucket == 'week':
+        return start + timedelta(days=7)
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def _load_samples(channel_ids: List[int], date_from: Optional[date] = None, date_to: Optional[date] = None):
+    """(channel_id, stat_date, follower_count, post_count, engagement_rate)를 채널/날짜순으로 조회"""
+    query = db.session.query(
+        ChannelStat.channel_id, ChannelStat.stat_date, ChannelStat.follower_count,
+        ChannelStat.post_count, ChannelStat.engagement_rate
+    ).filter(ChannelStat.channel_id.in_(channel_ids))
+    if date_from:
+        query = query.filter(ChannelStat.stat_date >= date_from)
+    if date_to:
+        query = query.filter(ChannelStat.stat_date < date_to)
+    samples = defaultdict(list)
+    for row in query.order_by(ChannelStat.channel_id, ChannelStat.stat_date):
+        samples[row.channel_id].append(row)
+    return samples
+
+
+def _load_baselines(lower_bounds: Dict[int, date]):
+    """채널별로 lower_bound 직전의 마지막 통계 (첫 구간의 증감 기준값)"""
+    if not lower_bounds:
+        return {}
+    previous_dates = db.session.query(
+        ChannelStat.channel_id.label('channel_id'),
+        func.max(ChannelStat.stat_date).label('stat_date')
+    ).filter(
+        db.or_(*[
+            db.and_(ChannelStat.channel_id == channel_id, ChannelStat.stat_date < lower_bound)
+            for channel_id, lower_bound in lower_bounds.items()
+        ])
+    ).group_by(ChannelStat.channel_id).subquery()
+
+    rows = db.session.query(
+        ChannelStat.channel_id, ChannelStat.stat_date, ChannelStat.follower_count,
+        ChannelStat.post_count, ChannelStat.engagement_rate
+    ).join(
+        previous_dates,
+        db.and_(ChannelStat.channel_id == previous_dates.c.channel_id, ChannelStat.stat_date == previous_dates.c.stat_date)
+    ).all()
+    return {row.channel_id: row for row in rows}
+
+
+def _summarize_periods(channel_id: int, samples, bucket: str, baseline=None) -> List[dict]:
+    """날짜순 통계 목록을 구간별 집계 행으로 변환. baseline은 첫 구간 이전의 마지막 통계"""
+    periods = []
+    groups = defaultdict(list)
+    for sample in samples:
+        groups[period_start(sample.stat_date, bucket)].append(sample)
+
+    previous = baseline
+    for start in sorted(groups):
+        group = groups[start]
+        first, last = group[0], group[-1]
+        reference = previous or first
+        start_followers = reference.follower_count or 0
+        end_followers = last.follower_count or 0
+        delta = end_followers - start_followers
+        engagement = [float(s.engagement_rate) for s in group if s.engagement_rate is not None]
+        periods.append({
+            'channel_id': channel_id,
+            'bucket': bucket,
+            'period_start': start,
+            'first_stat_date': first.stat_date,
+            'last_stat_date': last.stat_date,
+            'start_follower_count': start_followers,
+            'end_follower_count': end_followers,
+            'follower_delta': delta,
+            'growth_rate': round(delta / start_followers * 100, 4) if start_followers else None,
+            'post_delta': (last.post_count or 0) - (reference.post_count or 0),
+            'avg_engagement_rate': round(sum(engagement) / len(engagement), 4) if engagement else None,
+            'sample_count': len(group)
+        })
+        previous = last
+    return periods
+
+
+def _load_next_stat_dates(date_ranges: Dict[int, Tuple[date, date]]) -> Dict[int, date]:
+    """채널별로 high 이후 첫 통계 날짜 (늦게 들어온 통계 다음에 이미 있는 통계)"""
+    rows = db.session.query(ChannelStat.channel_id, func.min(ChannelStat.stat_date)).filter(
+        db.or_(*[
+            db.and_(ChannelStat.channel_id == channel_id, ChannelStat.stat_date > high)
+            for channel_id, (_, high) in date_ranges.items()
+        ])
+    ).group_by(ChannelStat.channel_id).all()
+    return {channel_id: next_date for channel_id, next_date in rows}
+
+
+def update_channel_rollups(stat_dates: Iterable[Tuple[int, date]]) -> int:
+    """새로 기록된 (channel_id, stat_date)가 속한 구간부터, 그 뒤 통계가 있는 첫 구간까지 집계를 다시 계산
+
+    뒤 구간은 기준값(이전 구간 마지막 통계)이 바뀔 수 있어 함께 갱신한다. 바로 다음 달력
+    구간에 통계가 없을 수 있으므로 high 이후 첫 통계가 속한 구간까지 포함한다.
+    커밋은 호출한 쪽에서 한다. 기록된 집계 행 수를 반환한다.
+    """
+    date_ranges = {}
+    for channel_id, stat_date in stat_dates:
+        low, high = date_ranges.get(channel_id, (stat_date, stat_date))
+        date_ranges[channel_id] = (min(low, stat_date), max(high, stat_date))
+    if not date_ranges:
+        return 0
+
+    next_dates = _load_next_stat_dates(date_ranges)
+
+    # 채널별/구간 종류별로 다시 계산할 구간 범위 [first_start, last_start]
+    affected = {}
+    for channel_id, (low, high) in date_ranges.items():
+        for bucket in ROLLUP_BUCKETS:
+            affected[(channel_id, bucket)] = (
+                period_start(low, bucket),
+                period_start(next_dates.get(channel_id, high), bucket)
+            )
+
+    lower_bounds = {
+        channel_id: min(affected[(channel_id, bucket)][0] for bucket in ROLLUP_BUCKETS) for channel_id in date_ranges
+    }
+    upper_bound = max(next_period_start(last_start, bucket) for (_, bucket), (_, last_start) in affected.items())
+
+    samples = _load_samples(list(date_ranges.keys()), min(lower_bounds.values()), upper_bound)
+    baselines = _load_baselines(lower_bounds)
+
+    rows = []
+    for (channel_id, bucket), (first_start, last_start) in affected.items():
+        channel_samples = [s for s in samples.get(channel_id, []) if s.stat_date >= lower_bounds[channel_id]]
+        for period in _summarize_periods(channel_id, channel_samples, bucket, baselines.get(channel_id)):
+            if first_start <= period['period_start'] <= last_start:
+                rows.append(period)
+
+        ChannelStatRollup.query.filter(
+            ChannelStatRollup.channel_id == channel_id,
+            ChannelStatRollup.bucket == bucket,
+            ChannelStatRollup.period_start >= first_start,
+            ChannelStatRollup.period_start <= last_start
+        ).delete(synchronize_session=False)
+
+    if rows:
+        db.session.execute(insert(ChannelStatRollup.__table__), rows)
+    return len(rows)
+
+
+def rebuild_channel_rollups(channel_ids: Iterable[int] = None) -> int:
+    """channel_stats 전체에서 주/월 집계를 다시 생성하고 커밋. 생성된 행 수 반환"""
+    if channel_ids is None:
+        channel_ids = [channel_id for (channel_id,) in db.session.query(Channel.id).order_by(Channel.id)]
+    channel_ids = list(channel_ids)
+
+    total = 0
+    try:
+        for start in range(0, len(channel_ids), REBUILD_CHANNEL_CHUNK):
+            chunk = channel_ids[start:start + REBUILD_CHANNEL_CHUNK]
+            samples = _load_samples(chunk)
+            rows = [
+                period
+                for channel_id, channel_samples in samples.items()
+                for bucket in ROLLUP_BUCKETS
+                for period in _summarize_periods(channel_id, channel_samples, bucket)
+            ]
+            ChannelStatRollup.query.filter(ChannelStatRollup.channel_id.in_(chunk)).delete(synchronize_session=False)
+            if rows:
+                db.session.execute(insert(ChannelStatRollup.__table__), rows)
+            db.session.commit()
+            total += len(rows)
+    except Exception:
+        db.session.rollback()
+        raise
+    logger.info(f"채널 통계 집계를 재생성했습니다. (채널 {len(channel_ids)}개, {total}개 행)")
+    return total
+
+
+def get_channel_series(channel_id: int, bucket: str, date_from: Optional[date] = None,
+                       date_to: Optional[date] = None) -> List[dict]:
+    """채널 통계 시계열. day는 일별 원본, week/month는 집계 테이블에서 조회 (date_to 포함)"""
+    if bucket == 'day':
+        query = ChannelStat.query.filter(ChannelStat.channel_id == channel_id)
+        if date_from:
+            query = query.filter(ChannelStat.stat_date >= date_from)
+        if date_to:
+            query = query.filter(ChannelStat.stat_date <= date_to)
+        return [stat.to_dict() for stat in query.order_by(ChannelStat.stat_date)]
+
+    query = ChannelStatRollup.query.filter(
+        ChannelStatRollup.channel_id == channel_id,
+        ChannelStatRollup.bucket == bucket
+    )
+    if date_from:
+        query = query.filter(ChannelStatRollup.period_start >= period_start(date_from, bucket))
+    if date_to:
+        query = query.filter(ChannelStatRollup.period_start <= date_to)
+    return [rollup.to_dict() for rollup in query.order_by(ChannelStatRollup.period_start)]
+
+
+def get_growth_by_channel(date_from: date, date_to: date, bucket: str = 'month') -> Dict[int, dict]:
+    """기간 내 채널별 팔로워 증감/성장률/게시물 증감 (집계 테이블 한 번 조회)"""
+    rows = db.session.query(
+        ChannelStatRollup.channel_id,
+        ChannelStatRollup.end_follower_count,
+        ChannelStatRollup.follower_delta,
+        ChannelStatRollup.post_delta,
+        ChannelStatRollup.avg_engagement_rate
+    ).filter(
+        ChannelStatRollup.bucket == bucket,
+        ChannelStatRollup.period_start >= period_start(date_from, bucket),
+        ChannelStatRollup.period_start <= date_to
+    ).order_by(ChannelStatRollup.channel_id, ChannelStatRollup.period_start).all()
+
+    growth = {}
+    for row in rows:
+        entry = growth.setdefault(row.channel_id, {
+            'channel_id': row.channel_id, 'follower_delta': 0, 'post_delta': 0, '_engagement': []
+        })
+        entry['follower_delta'] += row.follower_delta or 0
+        entry['post_delta'] += row.post_delta or 0
+        entry['end_follower_count'] = row.end_follower_count
+        if row.avg_engagement_rate is not None:
+            entry['_engagement'].append(row.avg_engagement_rate)
+
+    for entry in growth.values():
+        engagement = entry.pop('_engagement')
+        entry['start_follower_count'] = (entry['end_follower_count'] or 0) - entry['follower_delta']
+        entry['growth_rate'] = (
+            round(entry['follower_delta'] / entry['start_follower_count'] * 100, 2) if entry['start_follower_count'] else None
+        )
+        entry['avg_engagement_rate'] = round(sum(engagement) / len(engagement), 2) if engagement else None
+    return growth
+
+
+def get_platform_performance(days: int = 28) -> List[dict]:
+    """최근 days일 주간 집계를 플랫폼별로 합산 (대시보드 채널 성과)"""
+    date_to = date.today()
+    growth = get_growth_by_channel(date_to - timedelta(days=days), date_to, bucket='week')
+    platforms = dict(db.session.query(Channel.id, Channel.platform).filter(Channel.id.in_(list(growth.keys())))) if growth else {}
+
+    totals = {}
+    for channel_id, entry in growth.items():
+        platform = platforms.get(channel_id)
+        if platform is None:
+            continue
+        total = totals.setdefault(platform, {'platform': platform, 'follower_delta': 0, 'start_follower_count': 0, 'post_delta': 0})
+        total['follower_delta'] += entry['follower_delta']
+        total['start_follower_count'] += entry['start_follower_count']
+        total['post_delta'] += entry['post_delta']
+
+    for total in totals.values():
+        start = total['start_follower_count']
+        total['growth_rate'] = round(total['follower_delta'] / start * 100, 2) if start else None
+    return sorted(totals.values(), key=lambda t: t['platform'])
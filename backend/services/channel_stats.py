@@ -0,0 +1,98 @@
+import logging
+from typing import Dict, Iterable, List
+
+from sqlalchemy import func
+
+from backend.app import db
+from backend.models import Channel, ChannelStat
+from backend.services.channel_rollups import update_channel_rollups
+
+logger = logging.getLogger(__name__)
+
+
+def get_latest_stats_by_channel(channel_ids: Iterable[int]) -> Dict[int, ChannelStat]:
+    """채널별 가장 최근 ChannelStat을 한 번의 쿼리로 조회 (채널별 MAX(stat_date) 서브쿼리와 조인)"""
+    channel_ids = list(channel_ids)
+    if not channel_ids:
+        return {}
+
+    latest_dates = db.session.query(
+        ChannelStat.channel_id.label('channel_id'),
+        func.max(ChannelStat.stat_date).label('max_date')
+    ).filter(ChannelStat.channel_id.in_(channel_ids)).group_by(ChannelStat.channel_id).subquery()
+
+    # (channel_id, stat_date)는 unique_channel_date로 유일하므로 채널당 한 행
+    latest_stats = ChannelStat.query.join(
+        latest_dates,
+        db.and_(
+            ChannelStat.channel_id == latest_dates.c.channel_id,
+            ChannelStat.stat_date == latest_dates.c.max_date
+        )
+    ).all()
+    return {stat.channel_id: stat for stat in latest_stats}
+
+
+def record_channel_stats(stats: Iterable[ChannelStat]) -> int:
+    """새로 저장한 ChannelStat을 채널의 최신 통계 컬럼과 주/월 집계에 반영 (커밋은 호출한 쪽에서)
+
+    ChannelStat을 ORM으로 추가한 뒤 flush 이후에 호출한다. 최신 통계가 갱신된 채널 수를 반환한다.
+    """
+    stats = list(stats)
+    update_channel_rollups((stat.channel_id, stat.stat_date) for stat in stats)
+
+    newest = {}
+    for stat in stats:
+        current = newest.get(stat.channel_id)
+        if current is None or stat.stat_date >= current.stat_date:
+            newest[stat.channel_id] = stat
+    if not newest:
+        return 0
+
+    updated = 0
+    for channel in Channel.query.filter(Channel.id.in_(list(newest.keys()))).all():
+        if channel.apply_latest_stat(newest[channel.id]):
+            updated += 1
+    return updated
+
+
+def refresh_latest_stats(channel_ids: Iterable[int] = None) -> int:
+    """channel_stats에서 최신 통계를 다시 찾아 채널 컬럼을 재설정 (벌크 저장 후 또는 불일치 복구용)
+
+    channel_ids가 없으면 전체 채널 대상. 커밋은 호출한 쪽에서 한다. 갱신된 채널 수 반환.
+    """
+    query = Channel.query
+    if channel_ids is not None:
+        channel_ids = list(channel_ids)
+        if not channel_ids:
+            return 0
+        query = query.filter(Channel.id.in_(channel_ids))
+    channels = query.all()
+
+    latest_stats = get_latest_stats_by_channel(channel.id for channel in channels)
+    updated = 0
+    for channel in channels:
+        stat = latest_stats.get(channel.id)
+        if stat is None:
+            continue
+        # 재계산이므로 기존 값보다 오래된 날짜로도 되돌릴 수 있도록 먼저 초기화
+        channel.latest_stat_date = None
+        channel.apply_latest_stat(stat)
+        updated += 1
+    return updated
+
+
+def get_channels_with_latest_stats(artist_ids: Iterable[int]) -> Dict[int, List[Channel]]:
+    """아티스트별 채널 목록 (최신 통계는 채널 컬럼에 비정규화되어 있어 쿼리 1회)
+
+    대시보드 최근 아티스트 목록과 보고서 생성에서 함께 사용한다. 통계가 한 번도
+    기록되지 않은 채널은 latest_stat_date가 None이다.
+    """
+    artist_ids = list(artist_ids)
+    result = {artist_id: [] for artist_id in artist_ids}
+    if not artist_ids:
+        return result
+
+    channels = Channel.query.filter(Channel.artist_id.in_(artist_ids)).order_by(Channel.artist_id, Channel.id).all()
+    for channel in channels:
+        result.setdefault(channel.artist_id, []).append(channel)
+    return result
@@ -0,0 +1,284 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from backend.app import db
+from backend.models import Channel, ChannelStat
+from backend.services.channel_rollups import update_channel_rollups
+from backend.services.channel_stats import refresh_latest_stats
+from backend.services.generic_upsert import select_then_upsert
+from backend.services.request_budget import RequestBudget
+
+logger = logging.getLogger(__name__)
+
+# 마지막 동기화 후 이 시간이 지난 채널만 일괄 동기화 대상
+CHANNEL_SYNC_INTERVAL_HOURS = int(os.getenv('CHANNEL_SYNC_INTERVAL_HOURS', '24'))
+# 동시에 외부 API를 호출하는 워커 수
+CHANNEL_SYNC_MAX_WORKERS = int(os.getenv('CHANNEL_SYNC_MAX_WORKERS', '4'))
+# 1회 동기화 실행당 API 최대 요청 수 / 초당 요청 수 (미설정 시 제한 없음)
+CHANNEL_SYNC_REQUEST_BUDGET = int(os.getenv('CHANNEL_SYNC_REQUEST_BUDGET', '0')) or None
+RAPIDAPI_REQUESTS_PER_SECOND = float(os.getenv('RAPIDAPI_REQUESTS_PER_SECOND', '0')) or None
+# 가져온 통계를 몇 채널씩 모아 한 번에 저장할지
+SYNC_SAVE_BATCH_SIZE = 200
+
+
+class ChannelSyncError(Exception):
+    """채널 통계 조회 실패"""
+
+
+class ChannelSnapshot(NamedTuple):
+    """외부 API에서 가져온 채널 현재 상태 (모르는 값은 None)"""
+    follower_count: int
+    following_count: Optional[int] = None
+    post_count: Optional[int] = None
+    engagement_rate: Optional[float] = None
+    is_verified: Optional[bool] = None
+    channel_name: Optional[str] = None
+
+
+class ChannelTarget(NamedTuple):
+    """워커 스레드에 넘기는 채널 정보 (ORM 객체는 스레드 간에 공유하지 않음)"""
+    id: int
+    platform: str
+    channel_id: str
+
+
+class ChannelStatsFetcher:
+    """플랫폼별 채널 통계 조회기. fetch()는 워커 스레드에서 호출되므로 DB를 사용하지 않는다."""
+
+    platform = None
+
+    def fetch(self, channel: ChannelTarget) -> ChannelSnapshot:
+        raise NotImplementedError
+
+
+class InstagramStatsFetcher(ChannelStatsFetcher):
+    """RapidAPI InstagramAPIClient로 팔로워/팔로잉/게시물 수 조회 (channel_id = Instagram 사용자명)"""
+
+    platform = 'instagram'
+
+    def __init__(self, client=None):
+        if client is None:
+            from backend.config.instagram_config import InstagramAPIConfig
+            from backend.routes.instagram import InstagramAPIClient
+            client = InstagramAPIClient(InstagramAPIConfig())
+        self.client = client
+
+    def fetch(self, channel: ChannelTarget) -> ChannelSnapshot:
+        username = channel.channel_id.lstrip('@')
+        api_response = self.client.search_instagram_user(username)
+        if not api_response:
+            raise ChannelSyncError('Instagram API 호출 실패')
+
+        users = [result['user'] for result in api_response.get('result', []) if 'user' in result]
+        user = next((u for u in users if (u.get('username') or '').lower() == username.lower()), None)
+        if user is None:
+            raise ChannelSyncError(f'Instagram 사용자를 찾을 수 없습니다: {username}')
+
+        return ChannelSnapshot(
+            follower_count=user.get('follower_count', 0),
+            following_count=user.get('following_count'),
+            post_count=user.get('media_count'),
+            is_verified=user.get('is_verified'),
+            channel_name=user.get('full_name') or None
+        )
+
+
+# 플랫폼 -> 조회기 생성 함수. 다른 플랫폼은 register_fetcher()로 추가
+_fetcher_factories: Dict[str, Callable[[], ChannelStatsFetcher]] = {
+    'instagram': InstagramStatsFetcher,
+}
+
+
+def register_fetcher(platform: str, factory: Callable[[], ChannelStatsFetcher]):
+    _fetcher_factories[platform] = factory
+
+
+def get_supported_platforms():
+    return sorted(_fetcher_factories.keys())
+
+
+class ChannelSyncEngine:
+    """여러 채널의 통계를 동시에 가져와 channel_stats에 일괄 저장
+
+    워커 스레드는 외부 API 호출만 하고, 저장은 호출한 스레드에서 배치 단위로
+    channel_stats (channel_id, stat_date) 유니크 키에 대한 upsert 한 번으로 처리한다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, request_budget: Optional[RequestBudget] = None,
+                 fetchers: Optional[Dict[str, ChannelStatsFetcher]] = None):
+        self.max_workers = max_workers or CHANNEL_SYNC_MAX_WORKERS
+        self.request_budget = request_budget or RequestBudget(
+            'channel_sync',
+            max_requests=CHANNEL_SYNC_REQUEST_BUDGET,
+            requests_per_second=RAPIDAPI_REQUESTS_PER_SECOND
+        )
+        self.fetchers = dict(fetchers or {})
+
+    def _get_fetcher(self, platform: str) -> Optional[ChannelStatsFetcher]:
+        if platform not in self.fetchers:
+            factory = _fetcher_factories.get(platform)
+            try:
+                self.fetchers[platform] = factory() if factory else None
+            except Exception as e:
+                # API 키 미설정 등: 해당 플랫폼은 이번 실행에서 건너뜀
+                logger.error(f"{platform} 조회기 생성 실패: {str(e)}")
+                self.fetchers[platform] = None
+        return self.fetchers[platform]
+
+    def select_channels(self, channel_ids: Optional[Iterable[int]] = None, platform: Optional[str] = None,
+                        force: bool = False, now: Optional[datetime] = None) -> List[Channel]:
+        """동기화 대상 채널. force가 아니면 마지막 동기화 후 갱신 주기가 지난(또는 한 번도 동기화하지 않은) 채널만"""
+        query = Channel.query
+        if channel_ids:
+            query = query.filter(Channel.id.in_(list(channel_ids)))
+        if platform:
+            query = query.filter(Channel.platform == platform)
+        if not force:
+            threshold = (now or datetime.utcnow()) - timedelta(hours=CHANNEL_SYNC_INTERVAL_HOURS)
+            query = query.filter(db.or_(Channel.last_sync_at.is_(None), Channel.last_sync_at <= threshold))
+        return query.order_by(Channel.id).all()
+
+    def _fetch(self, target: ChannelTarget):
+        fetcher = self._get_fetcher(target.platform)
+        if fetcher is None:
+            return 'skipped', f'{target.platform} 플랫폼 동기화를 지원하지 않습니다.'
+        if not self.request_budget.acquire():
+            return 'skipped', '요청 예산이 소진되었습니다.'
+        try:
+            return 'synced', fetcher.fetch(target)
+        except Exception as e:
+            return 'failed', str(e)
+
+    def sync_channels(self, channels: Iterable[Channel], stat_date: Optional[date] = None,
+                      on_channel_done: Optional[Callable[[int, dict], None]] = None) -> dict:
+        """채널 목록을 동기화하고 {synced, failed, skipped, results} 반환"""
+        stat_date = stat_date or date.today()
+        channels = {channel.id: channel for channel in channels}
+        # 플랫폼 조회기는 워커에서 동시에 만들지 않도록 미리 생성
+        for platform in {channel.platform for channel in channels.values()}:
+            self._get_fetcher(platform)
+
+        targets = [ChannelTarget(c.id, c.platform, c.channel_id) for c in channels.values()]
+        summary = {'synced': 0, 'failed': 0, 'skipped': 0, 'results': {}}
+        pending = {}
+
+        def flush():
+            if not pending:
+                return
+            save_errors = self._save_snapshots(channels, pending, stat_date)
+            for channel_id, error in save_errors.items():
+                summary['synced'] -= 1
+                summary['failed'] += 1
+                summary['results'][channel_id] = {'status': 'failed', 'stage': 'save', 'error': error}
+            # 저장이 끝난 뒤에 완료 처리해야 작업 재개 시 저장되지 않은 채널을 건너뛰지 않음
+            if on_channel_done:
+                for channel_id in pending:
+                    on_channel_done(channel_id, summary['results'][channel_id])
+            pending.clear()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='channel-sync') as executor:
+            futures = {executor.submit(self._fetch, target): target for target in targets}
+            for future in as_completed(futures):
+                target = futures[future]
+                status, payload = future.result()
+                summary[status] += 1
+                if status == 'synced':
+                    pending[target.id] = payload
+                    item = {'status': status, 'follower_count': payload.follower_count}
+                else:
+                    logger.warning(f"채널 {target.id} ({target.platform}/{target.channel_id}) 동기화 {status}: {payload}")
+                    item = {'status': status, 'error': payload}
+                summary['results'][target.id] = item
+
+                if status != 'synced' and on_channel_done:
+                    on_channel_done(target.id, item)
+                if len(pending) >= SYNC_SAVE_BATCH_SIZE:
+                    flush()
+        flush()
+
+        summary['request_budget'] = self.request_budget.to_dict()
+        logger.info(f"채널 동기화 완료: 성공 {summary['synced']}, 실패 {summary['failed']}, 건너뜀 {summary['skipped']}")
+        return summary
+
+    def _save_snapshots(self, channels: Dict[int, Channel], snapshots: Dict[int, ChannelSnapshot],
+                        stat_date: date) -> Dict[int, str]:
+        """스냅샷을 배치로 저장하고 저장에 실패한 채널의 {channel_id: 오류 메시지} 반환
+
+        배치 저장이 실패하면 롤백한 뒤 채널별로 다시 저장해, 한 채널의 DB 오류가
+        같은 배치의 다른 채널이나 나머지 동기화를 막지 않도록 한다.
+        """
+        try:
+            self._save_batch(channels, snapshots, stat_date)
+            return {}
+        except Exception as e:
+            db.session.rollback()
+            if len(snapshots) == 1:
+                logger.error(f"채널 {next(iter(snapshots))} 통계 저장 중 오류: {str(e)}")
+                return {channel_id: str(e) for channel_id in snapshots}
+            logger.warning(f"채널 통계 일괄 저장 실패, 채널별로 다시 저장합니다: {str(e)}")
+
+        errors = {}
+        for channel_id, snapshot in snapshots.items():
+            try:
+                self._save_batch(channels, {channel_id: snapshot}, stat_date)
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"채널 {channel_id} 통계 저장 중 오류: {str(e)}")
+                errors[channel_id] = str(e)
+        return errors
+
+    def _save_batch(self, channels: Dict[int, Channel], snapshots: Dict[int, ChannelSnapshot], stat_date: date):
+        """스냅샷을 channel_stats에 upsert하고 채널 최신 통계/집계/동기화 시각 갱신 후 커밋 (실패 시 예외)"""
+        now = datetime.utcnow()
+        rows = []
+        for channel_id, snapshot in snapshots.items():
+            channel = channels[channel_id]
+            rows.append({
+                'channel_id': channel_id,
+                'stat_date': stat_date,
+                'follower_count': snapshot.follower_count,
+                'following_count': snapshot.following_count if snapshot.following_count is not None else channel.following_count or 0,
+                'post_count': snapshot.post_count if snapshot.post_count is not None else channel.post_count or 0,
+                # 참여율을 주지 않는 API는 직전 값을 유지
+                'engagement_rate': snapshot.engagement_rate if snapshot.engagement_rate is not None else channel.engagement_rate or 0,
+                'created_at': now
+            })
+
+        self._upsert_rows(rows)
+
+        for channel_id, snapshot in snapshots.items():
+            channel = channels[channel_id]
+            channel.last_sync_at = now
+            if snapshot.is_verified is not None:
+                channel.is_verified = snapshot.is_verified
+            if snapshot.channel_name and not channel.channel_name:
+                channel.channel_name = snapshot.channel_name
+
+        refresh_latest_stats(snapshots.keys())
+        update_channel_rollups((channel_id, stat_date) for channel_id in snapshots)
+        db.session.commit()
+
+    def _upsert_rows(self, rows):
+        """(channel_id, stat_date) 유니크 키 기준 다중 행 upsert (같은 날 다시 동기화하면 덮어씀)"""
+        table = ChannelStat.__table__
+        updated_columns = ('follower_count', 'following_count', 'post_count', 'engagement_rate')
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'mysql':
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+            stmt = mysql_insert(table).values(rows)
+            db.session.execute(stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in updated_columns}))
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+            stmt = sqlite_insert(table).values(rows)
+            db.session.execute(stmt.on_conflict_do_update(
+                index_elements=['channel_id', 'stat_date'],
+                set_={column: stmt.excluded[column] for column in updated_columns}
+            ))
+        else:
+            select_then_upsert(
+                table, ['channel_id', 'stat_date'], rows,
+                merge=lambda current, row: {column: row[column] for column in updated_columns}
+            )
@@ -0,0 +1,58 @@
+import logging
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
+
+from sqlalchemy import and_, insert, or_, select, update
+
+from backend.app import db
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 조회할 키 개수 (키마다 OR 조건이 하나씩 붙음)
+GENERIC_UPSERT_CHUNK_SIZE = 100
+
+MergeFunction = Callable[[Mapping, dict], Optional[dict]]
+
+
+def _key_condition(table, key_columns: Sequence[str], key: tuple):
+    return and_(*[table.c[column] == value for column, value in zip(key_columns, key)])
+
+
+def select_then_upsert(table, key_columns: Sequence[str], rows: List[dict], merge: MergeFunction) -> int:
+    """DB 전용 upsert 구문(MySQL ON DUPLICATE KEY, SQLite ON CONFLICT)이 없을 때 쓰는 일반 upsert
+
+    키로 기존 행을 조회(FOR UPDATE)한 뒤, 있으면 merge(기존 행, 새 행)가 돌려준 값으로 갱신하고
+    없으면 삽입한다. merge가 None을 돌려주면 기존 행을 그대로 둔다(insert ignore). 같은 키가
+    rows에 여러 번 나오면 앞의 결과에 차례로 merge한다. 호출한 쪽의 트랜잭션 안에서 실행되며
+    커밋하지 않는다. 삽입한 행 수를 반환한다.
+    """
+    inserted = 0
+    for start in range(0, len(rows), GENERIC_UPSERT_CHUNK_SIZE):
+        chunk = rows[start:start + GENERIC_UPSERT_CHUNK_SIZE]
+        keys = list(dict.fromkeys(tuple(row[column] for column in key_columns) for row in chunk))
+        existing_rows = db.session.execute(
+            select(table).where(or_(*[_key_condition(table, key_columns, key) for key in keys])).with_for_update()
+        ).mappings()
+        existing = {tuple(row[column] for column in key_columns): dict(row) for row in existing_rows}
+
+        updates: Dict[tuple, dict] = {}
+        inserts: Dict[tuple, dict] = {}
+        for row in chunk:
+            key = tuple(row[column] for column in key_columns)
+            if key in inserts:
+                values = merge(inserts[key], row)
+                if values:
+                    inserts[key].update(values)
+            elif key in existing:
+                values = merge(existing[key], row)
+                if values:
+                    existing[key].update(values)
+                    updates.setdefault(key, {}).update(values)
+            else:
+                inserts[key] = dict(row)
+
+        for key, values in updates.items():
+            db.session.execute(update(table).where(_key_condition(table, key_columns, key)).values(values))
+        if inserts:
+            db.session.execute(insert(table), list(inserts.values()))
+            inserted += len(inserts)
+    return inserted
@@ -0,0 +1,247 @@
+# backend/services/leader_election.py
+
+import json
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+# 리더 heartbeat가 이 시간(초)보다 오래되면 상태 조회에서 stale로 표시
+SCHEDULER_LEADER_TTL = int(os.getenv('SCHEDULER_LEADER_TTL', '60'))
+DEFAULT_LOCK_FILE = os.getenv(
+    'SCHEDULER_LOCK_FILE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cache', 'scheduler_leader.lock')
+)
+
+
+def make_process_identity() -> str:
+    """hostname:pid:랜덤 접미사 (같은 PID 재사용과 구분)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderElector:
+    """여러 백엔드 프로세스 중 하나만 예약 작업을 실행하도록 리더 선출
+
+    try_acquire()를 주기적으로 호출하면 리더가 아닐 때는 락 획득을 시도하고, 리더일
+    때는 락이 아직 유효한지 확인하며 heartbeat를 갱신한다. 리더 프로세스가 죽으면
+    락이 해제되어 다음 호출에서 다른 프로세스가 리더가 된다.
+    """
+
+    backend = None
+
+    def __init__(self, name: str, identity: str = None):
+        self.name = name
+        self.identity = identity or make_process_identity()
+        self.is_leader = False
+        self.acquired_at = None
+
+    def try_acquire(self) -> bool:
+        raise NotImplementedError
+
+    def release(self):
+        raise NotImplementedError
+
+    def get_leader_info(self) -> dict:
+        raise NotImplementedError
+
+    def _leader_info(self, holder, acquired_at, heartbeat_at) -> dict:
+        stale = heartbeat_at is None or datetime.utcnow() - heartbeat_at > timedelta(seconds=SCHEDULER_LEADER_TTL)
+        return {
+            'backend': self.backend,
+            'holder': holder,
+            'acquired_at': acquired_at.isoformat() if acquired_at else None,
+            'heartbeat_at': heartbeat_at.isoformat() if heartbeat_at else None,
+            'is_stale': stale,
+            'is_self': holder == self.identity
+        }
+
+
+class MySQLLockLeaderElector(LeaderElector):
+    """MySQL GET_LOCK 기반 리더 선출
+
+    락은 전용 DB 커넥션에 묶여 있어 프로세스가 죽거나 커넥션이 끊기면 MySQL이 즉시
+    해제한다. 현재 리더 표시는 scheduler_leases 테이블의 heartbeat로 한다.
+    """
+
+    backend = 'mysql_get_lock'
+
+    def __init__(self, name: str, identity: str = None):
+        super().__init__(name, identity)
+        self._lock_conn = None
+
+    @property
+    def lock_name(self):
+        return f"first_ent:{self.name}"
+
+    def try_acquire(self) -> bool:
+        from sqlalchemy import text
+        from backend.app import db
+
+        try:
+            if self._lock_conn is None:
+                self._lock_conn = db.engine.connect()
+                acquired = self._lock_conn.execute(
+                    text("SELECT GET_LOCK(:name, 0)"), {'name': self.lock_name}
+                ).scalar() == 1
+                if not acquired:
+                    self._close_lock_conn()
+            else:
+                # 커넥션이 살아 있고 락을 여전히 이 커넥션이 가지고 있는지 확인
+                acquired = self._lock_conn.execute(
+                    text("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"), {'name': self.lock_name}
+                ).scalar() == 1
+                if not acquired:
+                    self._close_lock_conn()
+        except Exception as e:
+            logger.warning(f"리더 락 확인 중 오류: {str(e)}")
+            # 커넥션이 락을 아직 가지고 있을 수 있으므로 풀에 돌려주지 않고 끊음
+            self._close_lock_conn(invalidate=True)
+            acquired = False
+
+        self._set_leader(acquired)
+        if acquired:
+            self._write_heartbeat()
+        return acquired
+
+    def _set_leader(self, acquired):
+        if acquired and not self.is_leader:
+            self.acquired_at = datetime.utcnow()
+            logger.info(f"스케줄러 리더가 되었습니다: {self.identity}")
+        elif not acquired and self.is_leader:
+            logger.warning(f"스케줄러 리더 지위를 잃었습니다: {self.identity}")
+        self.is_leader = acquired
+
+    def _write_heartbeat(self):
+        from backend.app import db
+        from backend.models import SchedulerLease
+
+        try:
+            lease = db.session.get(SchedulerLease, self.name)
+            if lease is None:
+                lease = SchedulerLease(name=self.name)
+                db.session.add(lease)
+            if lease.holder != self.identity:
+                lease.holder = self.identity
+                lease.acquired_at = self.acquired_at
+            lease.heartbeat_at = datetime.utcnow()
+            db.session.commit()
+        except Exception as e:
+            logger.warning(f"리더 heartbeat 기록 중 오류: {str(e)}")
+            db.session.rollback()
+
+    def _close_lock_conn(self, invalidate: bool = False):
+        """락 커넥션 정리
+
+        GET_LOCK은 MySQL 세션에 묶이므로, 락을 가지고 있을 수 있는 커넥션은 invalidate=True로
+        DB 연결 자체를 끊어 MySQL이 락을 해제하게 한다. 그냥 close()하면 락을 쥔 채 풀로
+        돌아가 커넥션이 재활용될 때까지 어떤 프로세스도 리더가 되지 못한다.
+        """
+        if self._lock_conn is not None:
+            try:
+                if invalidate:
+                    self._lock_conn.invalidate()
+                self._lock_conn.close()
+            except Exception:
+                pass
+            self._lock_conn = None
+
+    def release(self):
+        from sqlalchemy import text
+
+        released = False
+        if self._lock_conn is not None:
+            try:
+                self._lock_conn.execute(text("SELECT RELEASE_LOCK(:name)"), {'name': self.lock_name})
+                released = True
+            except Exception as e:
+                logger.warning(f"리더 락 해제 중 오류: {str(e)}")
+        self._close_lock_conn(invalidate=not released)
+        self._set_leader(False)
+
+    def get_leader_info(self) -> dict:
+        from backend.app import db
+        from backend.models import SchedulerLease
+
+        lease = db.session.get(SchedulerLease, self.name)
+        if lease is None:
+            return self._leader_info(None, None, None)
+        return self._leader_info(lease.holder, lease.acquired_at, lease.heartbeat_at)
+
+
+class FileLockLeaderElector(LeaderElector):
+    """락 파일(flock) 기반 리더 선출 (MySQL 이외 DB, 단일 호스트용)
+
+    flock은 프로세스가 죽으면 OS가 해제한다. 파일 내용에 리더 정보와 heartbeat를 기록한다.
+    """
+
+    backend = 'file_lock'
+
+    def __init__(self, name: str, identity: str = None, path: str = DEFAULT_LOCK_FILE):
+        super().__init__(name, identity)
+        self.path = os.path.abspath(path)
+        self._lock_file = None
+
+    def try_acquire(self) -> bool:
+        import fcntl
+
+        if self._lock_file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            lock_file = open(self.path, 'a+')
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return False
+            self._lock_file = lock_file
+            self.is_leader = True
+            self.acquired_at = datetime.utcnow()
+            logger.info(f"스케줄러 리더가 되었습니다: {self.identity}")
+
+        self._write_heartbeat()
+        return True
+
+    def _write_heartbeat(self):
+        self._lock_file.seek(0)
+        self._lock_file.truncate()
+        self._lock_file.write(json.dumps({
+            'holder': self.identity,
+            'acquired_at': self.acquired_at.isoformat(),
+            'heartbeat_at': datetime.utcnow().isoformat()
+        }))
+        self._lock_file.flush()
+
+    def release(self):
+        import fcntl
+
+        if self._lock_file is not None:
+            try:
+                self._lock_file.seek(0)
+                self._lock_file.truncate()
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+            finally:
+                self._lock_file.close()
+                self._lock_file = None
+        self.is_leader = False
+
+    def get_leader_info(self) -> dict:
+        try:
+            with open(self.path) as f:
+                data = json.loads(f.read() or '{}')
+        except (OSError, ValueError):
+            data = {}
+        return self._leader_info(
+            data.get('holder'),
+            datetime.fromisoformat(data['acquired_at']) if data.get('acquired_at') else None,
+            datetime.fromisoformat(data['heartbeat_at']) if data.get('heartbeat_at') else None
+        )
+
+
+def create_leader_elector(app, name: str) -> LeaderElector:
+    """DB가 MySQL이면 GET_LOCK, 아니면 락 파일 방식 사용"""
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI') or ''
+    if uri.startswith('mysql'):
+        return MySQLLockLeaderElector(name)
+    return FileLockLeaderElector(name)
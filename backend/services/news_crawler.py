@@ -1,17 +1,49 @@
 import requests
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Callable, Iterable, List, Dict, NamedTuple, Optional
+from sqlalchemy import insert
 from backend.app import db
-from backend.models import News, Artist, APIKey
+from backend.models import News, Artist, APIKey, NewsCrawlState
+from backend.services.generic_upsert import select_then_upsert
+from backend.services.news_search import get_news_search_backend
+from backend.services.news_stats import record_news_inserted
+from backend.services.news_terms import rebuild_news_terms, record_news_terms
+from backend.services.request_budget import RequestBudget
+from backend.services.serpapi_cache import get_serpapi_cache
+from backend.utils.url_utils import compute_url_hash
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 전체 크롤링 시 동시에 SerpAPI를 호출하는 워커 수
+DEFAULT_CRAWL_MAX_WORKERS = int(os.getenv('NEWS_CRAWL_MAX_WORKERS', '4'))
+# 1회 크롤링 실행당 SerpAPI 최대 요청 수 (미설정 시 제한 없음)
+DEFAULT_SERPAPI_REQUEST_BUDGET = int(os.getenv('SERPAPI_REQUEST_BUDGET', '0')) or None
+# SerpAPI 초당 요청 수 제한 (미설정 시 제한 없음)
+DEFAULT_SERPAPI_REQUESTS_PER_SECOND = float(os.getenv('SERPAPI_REQUESTS_PER_SECOND', '0')) or None
+# save_news_to_db에서 IN 조회/다중 INSERT 한 번에 처리할 항목 수
+SAVE_BATCH_SIZE = 500
+# 증분 크롤링: 새 기사가 연속 N회 없으면 크롤링 주기를 늘림
+NEWS_CRAWL_BACKOFF_AFTER = int(os.getenv('NEWS_CRAWL_BACKOFF_AFTER', '2'))
+# 증분 크롤링: 기본 크롤링 주기(시간)와 최대 백오프 단계 (주기 = 기본 * 2^단계)
+NEWS_CRAWL_BASE_INTERVAL_HOURS = int(os.getenv('NEWS_CRAWL_BASE_INTERVAL_HOURS', '24'))
+NEWS_CRAWL_MAX_BACKOFF_STEPS = int(os.getenv('NEWS_CRAWL_MAX_BACKOFF_STEPS', '3'))
+
+
+class SaveResult(NamedTuple):
+    """save_news_to_db 결과 (저장된 건수, 중복 등으로 건너뛴 건수, DB 오류로 저장하지 못한 건수)"""
+    inserted: int
+    skipped: int
+    failed: int = 0
+
+
 class NewsCrawler:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.serpapi_api_key = os.getenv('SERPAPI_API_KEY') # Assuming SERPAPI API key is in .env
+        self.cache = get_serpapi_cache() if use_cache else None
         
     def get_serpapi_api_key(self) -> Optional[str]:
         """SERP API 키를 DB에서 가져오기"""
@@ -32,11 +64,28 @@ class NewsCrawler:
         if not api_key:
             logger.error("SERP API 키를 찾을 수 없습니다.")
             return []
-        
+
+        results = self._fetch_serpapi_news(artist.name, api_key)
+        if results is None:
+            return []
+
+        if "news_results" in results:
+            return self._parse_serpapi_response(results['news_results'], artist)
+        else:
+            logger.warning(f"No news results found for {artist.name}")
+            return []
+
+    def _fetch_serpapi_news(self, artist_name: str, api_key: str, sort_by_date: bool = False,
+                            acquire_request: Optional[Callable[[], bool]] = None) -> Optional[Dict]:
+        """SERP API 호출만 수행 (DB 접근 없음, 워커 스레드에서 안전하게 호출 가능)
+
+        acquire_request(요청 예산 확인)는 캐시에 없어 실제로 API를 호출할 때만 부르며,
+        False를 반환하면 호출하지 않고 None을 반환한다.
+        """
         from serpapi import GoogleSearch
 
         # 검색 쿼리 구성
-        query = f"{artist.name}"
+        query = f"{artist_name}"
         
         params = {
             "api_key": api_key,
@@ -47,19 +96,23 @@ class NewsCrawler:
             "hl": "ko",
             "num": 10
         }
+        if sort_by_date:
+            # 최신순 정렬: 증분 크롤링에서 이미 본 기사가 나오면 그 뒤는 모두 이전 기사
+            params["tbs"] = "sbd:1"
+
+        def request():
+            if acquire_request and not acquire_request():
+                logger.warning(f"SerpAPI 요청 예산 소진으로 {artist_name} 크롤링을 건너뜁니다.")
+                return None
+            return GoogleSearch(params).get_dict()
 
         try:
-            search = GoogleSearch(params)
-            results = search.get_dict()
-            
-            if "news_results" in results:
-                return self._parse_serpapi_response(results['news_results'], artist)
-            else:
-                logger.warning(f"No news results found for {artist.name}")
-                return []
+            if self.cache:
+                return self.cache.get_or_fetch(params, request)
+            return request()
         except Exception as e:
             logger.error(f"SERP API 요청 중 오류 발생: {str(e)}")
-            return []
+            return None
     
     def _parse_serpapi_response(self, response_data: List[Dict], artist: Artist) -> List[Dict]:
         """SERP API 응답을 파싱하여 뉴스 데이터 추출"""
@@ -153,66 +206,277 @@ class NewsCrawler:
             logger.error(f"Error parsing date_str '{date_str}': {e}", exc_info=True)
             return None
     
-    def save_news_to_db(self, news_items: List[Dict], artist: Artist) -> int:
-        """뉴스를 데이터베이스에 저장"""
-        saved_count = 0
-        
-        for item in news_items:
-            try:
-                # 중복 확인 (URL 기준)
-                existing_news = News.query.filter_by(
-                    artist_id=artist.id,
-                    url=item['url']
-                ).first()
-                
-                if existing_news:
+    def save_news_to_db(self, news_items: List[Dict], artist: Artist) -> SaveResult:
+        """뉴스를 데이터베이스에 저장
+
+        배치마다 IN 쿼리 한 번으로 기존 URL 해시를 조회해 중복을 거르고, 남은 항목은
+        다중 행 INSERT 한 번으로 저장한다. (inserted, skipped, failed) 건수를 반환한다.
+        """
+        inserted_count = 0
+        skipped_count = 0
+        failed_count = 0
+        # 일부 행이 INSERT IGNORE로 무시되면 어떤 행이 저장됐는지 알 수 없으므로 단어 빈도를 다시 계산
+        terms_need_rebuild = False
+
+        for start in range(0, len(news_items), SAVE_BATCH_SIZE):
+            batch = news_items[start:start + SAVE_BATCH_SIZE]
+
+            # 배치 내 중복 및 URL 없는 항목 제거 (정규화 URL 해시 기준)
+            unique_items = {}
+            for item in batch:
+                url_hash = compute_url_hash(item.get('url'))
+                if not url_hash or url_hash in unique_items:
+                    skipped_count += 1
                     continue
-                
-                news = News(
-                    artist_id=artist.id,
-                    title=item['title'],
-                    content=item['content'],
-                    url=item['url'],
-                    source=item.get('source', ''),
-                    published_at=item['published_at'],
-                    keywords=item.get('keywords', []),
-                    thumbnail=item.get('thumbnail', ''),
-                    media_name=item.get('media_name', '')
-                )
-                
-                db.session.add(news)
-                saved_count += 1
-                
-            except Exception as e:
-                logger.error(f"뉴스 저장 중 오류: {str(e)}")
+                unique_items[url_hash] = item
+
+            if not unique_items:
                 continue
-        
+
+            try:
+                # 중복 확인 ((artist_id, url_hash) 유니크 인덱스 사용, 배치당 1회 조회)
+                existing_hashes = {
+                    url_hash for (url_hash,) in db.session.query(News.url_hash).filter(
+                        News.artist_id == artist.id,
+                        News.url_hash.in_(list(unique_items.keys()))
+                    )
+                }
+
+                crawled_at = datetime.utcnow()
+                rows = [
+                    {
+                        'artist_id': artist.id,
+                        'title': item['title'],
+                        'content': item['content'],
+                        'url': item['url'],
+                        'url_hash': url_hash,
+                        'source': item.get('source', ''),
+                        'published_at': item['published_at'],
+                        'keywords': item.get('keywords', []),
+                        'thumbnail': item.get('thumbnail', ''),
+                        'media_name': item.get('media_name', ''),
+                        'crawled_at': crawled_at
+                    }
+                    for url_hash, item in unique_items.items() if url_hash not in existing_hashes
+                ]
+                skipped_count += len(unique_items) - len(rows)
+
+                if rows:
+                    # INSERT IGNORE로 무시된 행(동시 크롤링 등으로 생긴 중복)은 skipped로 집계
+                    batch_inserted = self._insert_ignore_rows(rows)
+                    inserted_count += batch_inserted
+                    skipped_count += len(rows) - batch_inserted
+                    # 통계 집계도 같은 트랜잭션에서 갱신 (새 기사의 감정 기본값은 neutral)
+                    record_news_inserted(artist.id, crawled_at, batch_inserted)
+                    if batch_inserted == len(rows):
+                        record_news_terms(rows)
+                    else:
+                        terms_need_rebuild = True
+
+                db.session.commit()
+
+                if rows:
+                    self._index_saved_news(artist, [row['url_hash'] for row in rows])
+            except Exception as e:
+                logger.error(f"데이터베이스 커밋 중 오류: {str(e)}")
+                db.session.rollback()
+                failed_count += len(unique_items)
+
+        if terms_need_rebuild:
+            try:
+                rebuild_news_terms([artist.id])
+            except Exception as e:
+                logger.warning(f"{artist.name} 단어 빈도 재계산 중 오류: {str(e)}")
+
+        logger.info(f"{artist.name}에 대한 {inserted_count}개의 뉴스가 저장되었습니다. (중복 {skipped_count}개 제외)")
+        if failed_count:
+            logger.warning(f"{artist.name}: DB 오류로 {failed_count}개의 뉴스를 저장하지 못했습니다.")
+        return SaveResult(inserted=inserted_count, skipped=skipped_count, failed=failed_count)
+
+    def _index_saved_news(self, artist: Artist, url_hashes: List[str]):
+        """방금 저장한 뉴스를 전문 검색 인덱스에 반영 (MySQL FULLTEXT는 자동 갱신되므로 생략)"""
+        search_backend = get_news_search_backend()
+        if search_backend.auto_indexed:
+            return
         try:
-            db.session.commit()
-            logger.info(f"{artist.name}에 대한 {saved_count}개의 뉴스가 저장되었습니다.")
+            saved = db.session.query(News.id, News.artist_id, News.title, News.content).filter(
+                News.artist_id == artist.id,
+                News.url_hash.in_(url_hashes)
+            ).all()
+            search_backend.index_news([
+                {'id': r.id, 'artist_id': r.artist_id, 'title': r.title, 'content': r.content} for r in saved
+            ])
         except Exception as e:
-            logger.error(f"데이터베이스 커밋 중 오류: {str(e)}")
-            db.session.rollback()
-            saved_count = 0
-        
-        return saved_count
+            # 인덱싱 실패가 저장 결과에 영향을 주지 않도록 로그만 남김 (reindex로 복구 가능)
+            logger.warning(f"뉴스 검색 인덱스 갱신 중 오류: {str(e)}")
+
+    def _insert_ignore_rows(self, rows: List[Dict]) -> int:
+        """(artist_id, url_hash)가 이미 있는 행은 무시하고 삽입한 뒤 삽입된 행 수 반환 (MySQL: INSERT IGNORE)"""
+        dialect = db.session.get_bind().dialect.name
+        if dialect not in ('mysql', 'sqlite'):
+            return select_then_upsert(News.__table__, ['artist_id', 'url_hash'], rows, merge=lambda current, row: None)
+
+        stmt = insert(News.__table__).prefix_with('IGNORE' if dialect == 'mysql' else 'OR IGNORE')
+        result = db.session.execute(stmt, rows)
+        return result.rowcount if result.rowcount is not None and result.rowcount >= 0 else len(rows)
     
-    def crawl_news_for_all_artists(self) -> Dict[str, int]:
-        """모든 활성 아티스트에 대한 뉴스 크롤링"""
+    def _filter_unseen_items(self, news_items: List[Dict], state: NewsCrawlState) -> List[Dict]:
+        """최신순 결과에서 이미 본 기사(해시 일치 또는 워터마크 이전 발행)가 나오면 거기서 중단"""
+        seen_hashes = set(state.get_recent_url_hashes())
+        unseen = []
+        for item in news_items:
+            if compute_url_hash(item.get('url')) in seen_hashes:
+                break
+            published_at = item.get('published_at')
+            # 발행일은 '3시간 전' 같은 상대 표기로 오기도 하므로 날짜 단위로만 비교
+            if published_at and state.last_published_at and published_at.date() < state.last_published_at.date():
+                break
+            unseen.append(item)
+        return unseen
+
+    def _update_crawl_state(self, state: NewsCrawlState, news_items: List[Dict], inserted: int):
+        """크롤링 결과로 워터마크와 다음 크롤링 시각 갱신"""
+        now = datetime.utcnow()
+        state.remember_url_hashes([h for h in (compute_url_hash(item.get('url')) for item in news_items) if h])
+
+        published = [item['published_at'] for item in news_items if item.get('published_at')]
+        if published and (state.last_published_at is None or max(published) > state.last_published_at):
+            state.last_published_at = max(published)
+
+        state.empty_streak = 0 if inserted else (state.empty_streak or 0) + 1
+        state.last_crawled_at = now
+        if state.empty_streak < NEWS_CRAWL_BACKOFF_AFTER:
+            state.next_crawl_at = None
+        else:
+            steps = min(state.empty_streak - NEWS_CRAWL_BACKOFF_AFTER + 1, NEWS_CRAWL_MAX_BACKOFF_STEPS)
+            # 1시간 여유를 두어 매일 같은 시각에 도는 스케줄이 경계에서 하루 밀리지 않게 함
+            state.next_crawl_at = now + timedelta(hours=NEWS_CRAWL_BASE_INTERVAL_HOURS * (2 ** steps) - 1)
+
+    def crawl_news_for_all_artists(self, max_workers: Optional[int] = None,
+                                   request_budget: Optional[RequestBudget] = None,
+                                   incremental: bool = True,
+                                   exclude_artist_ids: Optional[Iterable[int]] = None,
+                                   on_start: Optional[Callable[[int], None]] = None,
+                                   on_artist_done: Optional[Callable[[int, str, int, str], None]] = None) -> Dict[str, int]:
+        """모든 활성 아티스트에 대한 뉴스 크롤링
+
+        SerpAPI 호출은 제한된 워커 풀에서 병렬로 실행하고, DB 저장은 호출한 스레드
+        하나에서만 수행하여 Flask-SQLAlchemy 세션을 스레드 간에 공유하지 않는다.
+
+        incremental=True이면 아티스트별 워터마크(NewsCrawlState)를 사용해 이미 본
+        기사에서 처리를 멈추고, 최근 새 기사가 없던 아티스트는 크롤링 주기를 늘린다.
+
+        exclude_artist_ids는 이미 처리한 아티스트(작업 재개 시)를 제외한다. on_start(대상 수)와
+        on_artist_done(artist_id, artist_name, saved_count, status)는 저장 스레드에서 호출된다.
+        on_artist_done은 대상 아티스트마다 한 번씩 호출되며 status는 'saved'(저장 완료),
+        'skipped'(요청 예산 소진/API 키 없음/응답 없음), 'failed'(처리 중 오류) 중 하나다.
+        """
         results = {}
         
         # 활성 상태인 아티스트들 조회
         active_artists = Artist.query.filter_by(status='active').all()
-        
-        for artist in active_artists:
-            try:
-                logger.info(f"{artist.name}에 대한 뉴스 크롤링 시작...")
-                news_items = self.search_news_for_artist(artist)
-                saved_count = self.save_news_to_db(news_items, artist)
-                results[artist.name] = saved_count
-                logger.info(f"{artist.name}: {saved_count}개 뉴스 저장 완료")
-            except Exception as e:
-                logger.error(f"{artist.name} 뉴스 크롤링 중 오류: {str(e)}")
+        if exclude_artist_ids:
+            excluded = set(exclude_artist_ids)
+            active_artists = [artist for artist in active_artists if artist.id not in excluded]
+        if not active_artists:
+            if on_start:
+                on_start(0)
+            return results
+
+        crawl_states = {}
+        if incremental:
+            crawl_states = {
+                state.artist_id: state
+                for state in NewsCrawlState.query.filter(
+                    NewsCrawlState.artist_id.in_([artist.id for artist in active_artists])
+                )
+            }
+            for artist in active_artists:
+                if artist.id not in crawl_states:
+                    crawl_states[artist.id] = NewsCrawlState(artist_id=artist.id, empty_streak=0)
+                    db.session.add(crawl_states[artist.id])
+            db.session.commit()
+
+            now = datetime.utcnow()
+            due_artists = [artist for artist in active_artists if crawl_states[artist.id].is_due(now)]
+            if len(due_artists) < len(active_artists):
+                logger.info(f"증분 크롤링: 최근 새 기사가 없는 {len(active_artists) - len(due_artists)}명의 아티스트는 이번 실행에서 건너뜁니다.")
+            active_artists = due_artists
+            if not active_artists:
+                if on_start:
+                    on_start(0)
+                return results
+
+        api_key = self.get_serpapi_api_key()
+        if not api_key:
+            logger.error("SERP API 키를 찾을 수 없습니다.")
+            if on_start:
+                on_start(len(active_artists))
+            for artist in active_artists:
                 results[artist.name] = 0
-        
+                if on_artist_done:
+                    on_artist_done(artist.id, artist.name, 0, 'skipped')
+            return results
+
+        if request_budget is None:
+            request_budget = RequestBudget(
+                'serpapi',
+                max_requests=DEFAULT_SERPAPI_REQUEST_BUDGET,
+                requests_per_second=DEFAULT_SERPAPI_REQUESTS_PER_SECOND
+            )
+        max_workers = max(1, max_workers or DEFAULT_CRAWL_MAX_WORKERS)
+        if on_start:
+            on_start(len(active_artists))
+
+        # 워커 스레드에는 ORM 객체 대신 (id, name)만 전달
+        artists_by_id = {artist.id: artist for artist in active_artists}
+        targets = [(artist.id, artist.name) for artist in active_artists]
+
+        def fetch(artist_name):
+            logger.info(f"{artist_name}에 대한 뉴스 크롤링 시작...")
+            # 캐시 히트는 요청 예산을 쓰지 않음
+            return self._fetch_serpapi_news(
+                artist_name, api_key, sort_by_date=incremental, acquire_request=request_budget.acquire
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='news-crawl') as executor:
+            futures = {executor.submit(fetch, name): (artist_id, name) for artist_id, name in targets}
+
+            # 단일 writer: 완료된 순서대로 현재 스레드에서 저장
+            for future in as_completed(futures):
+                artist_id, artist_name = futures[future]
+                artist = artists_by_id[artist_id]
+                results[artist_name] = 0
+                status = 'failed'
+                try:
+                    response = future.result()
+                    if response is None:
+                        # 요청 예산 소진 또는 API 오류: 워터마크는 갱신하지 않음
+                        status = 'skipped'
+                        continue
+                    if "news_results" not in response:
+                        logger.warning(f"No news results found for {artist_name}")
+                    news_items = self._parse_serpapi_response(response.get('news_results', []), artist)
+                    if incremental:
+                        state = crawl_states[artist_id]
+                        unseen_items = self._filter_unseen_items(news_items, state)
+                        saved = self.save_news_to_db(unseen_items, artist)
+                        # 저장하지 못한 기사가 있으면 다음 크롤링에서 다시 받도록 워터마크를 그대로 둠
+                        if not saved.failed:
+                            self._update_crawl_state(state, unseen_items, saved.inserted)
+                            db.session.commit()
+                    else:
+                        saved = self.save_news_to_db(news_items, artist)
+                    results[artist_name] = saved.inserted
+                    status = 'failed' if saved.failed else 'saved'
+                    logger.info(f"{artist_name}: {saved.inserted}개 뉴스 저장 완료 (중복 {saved.skipped}개)")
+                except Exception as e:
+                    logger.error(f"{artist_name} 뉴스 크롤링 중 오류: {str(e)}")
+                    db.session.rollback()
+                finally:
+                    # 건너뛴/실패한 아티스트도 작업 진행률과 결과에 남김
+                    if on_artist_done:
+                        on_artist_done(artist_id, artist_name, results[artist_name], status)
+
+        logger.info(f"SerpAPI 요청 사용량: {request_budget.to_dict()}")
         return results
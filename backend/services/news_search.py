@@ -0,0 +1,257 @@
+import html
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.app import db
+from backend.models import News
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FTS_PATH = os.getenv(
+    'NEWS_FTS_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cache', 'news_fts.sqlite3')
+)
+# 메인 DB가 SQLite일 때 로컬 인덱스 파일을 ATTACH할 스키마 이름
+FTS_ATTACH_SCHEMA = 'news_fts_db'
+SNIPPET_LENGTH = 120
+
+
+def highlight_terms(text: Optional[str], query_text: str) -> str:
+    """HTML 이스케이프한 text에서 검색어를 <mark>로 강조"""
+    escaped = html.escape(text or '')
+    for term in sorted({t for t in query_text.split() if t}, key=len, reverse=True):
+        escaped = re.sub(re.escape(html.escape(term)), lambda m: f"<mark>{m.group(0)}</mark>", escaped, flags=re.IGNORECASE)
+    return escaped
+
+
+def make_snippet(text: Optional[str], query_text: str, length: int = SNIPPET_LENGTH) -> str:
+    """검색어가 처음 나오는 위치 주변을 length 글자로 잘라 강조한 HTML 조각 반환"""
+    if not text:
+        return ''
+    lowered = text.lower()
+    positions = [lowered.find(t.lower()) for t in query_text.split() if t]
+    positions = [p for p in positions if p >= 0]
+    start = max(min(positions) - length // 3, 0) if positions else 0
+    prefix = '…' if start > 0 else ''
+    suffix = '…' if start + length < len(text) else ''
+    return f"{prefix}{highlight_terms(text[start:start + length], query_text)}{suffix}"
+
+
+class NewsSearchBackend:
+    """뉴스 제목/본문 전문 검색 백엔드 인터페이스"""
+
+    name = None
+    # True면 DB가 INSERT 시 인덱스를 직접 갱신하므로 index_news() 호출이 필요 없음
+    auto_indexed = False
+
+    def match_ids_select(self, query_text: str):
+        """검색어와 일치하는 News.id를 반환하는 selectable 또는 id 리스트 (News.id.in_()에 사용)"""
+        raise NotImplementedError
+
+    def search(self, query_text: str, artist_id: Optional[int] = None,
+               limit: int = 20, offset: int = 0) -> List[Tuple[int, float]]:
+        """관련도순 (news_id, score) 목록"""
+        raise NotImplementedError
+
+    def index_news(self, rows: Iterable[Dict]):
+        """새로 저장된 뉴스({id, artist_id, title, content})를 인덱스에 반영"""
+
+    def remove_news(self, news_id: int):
+        """삭제된 뉴스를 인덱스에서 제거"""
+
+    def rebuild(self) -> int:
+        return 0
+
+
+class MySQLFulltextSearch(NewsSearchBackend):
+    """MySQL FULLTEXT(ngram) 인덱스 기반 검색. 인덱스는 INSERT 시 MySQL이 자동 갱신한다."""
+
+    name = 'mysql_fulltext'
+    auto_indexed = True
+    MATCH_COLUMNS = 'news.title, news.content'
+
+    @staticmethod
+    def _phrase(query_text: str) -> str:
+        # ngram 파서에서 "..." 구문 검색은 부분 문자열 검색과 비슷하게 동작
+        return '"' + query_text.replace('"', ' ').strip() + '"'
+
+    def _match(self, mode: str, query_text: str):
+        return db.text(f"MATCH({self.MATCH_COLUMNS}) AGAINST (:fts_query IN {mode})").bindparams(fts_query=query_text)
+
+    def match_ids_select(self, query_text: str):
+        return db.select(News.id).where(self._match('BOOLEAN MODE', self._phrase(query_text)))
+
+    def search(self, query_text, artist_id=None, limit=20, offset=0):
+        score = self._match('NATURAL LANGUAGE MODE', query_text)
+        query = db.session.query(News.id, score.label('score')).filter(
+            self._match('BOOLEAN MODE', self._phrase(query_text))
+        )
+        if artist_id:
+            query = query.filter(News.artist_id == artist_id)
+        rows = query.order_by(db.text('score DESC'), News.id.desc()).limit(limit).offset(offset).all()
+        return [(news_id, float(score or 0)) for news_id, score in rows]
+
+
+class SQLiteFTSSearch(NewsSearchBackend):
+    """로컬 SQLite FTS5(trigram) 역색인 기반 검색 (MySQL이 아닌 개발 환경용)
+
+    별도 파일에 인덱스를 두며, 크롤러가 뉴스를 저장할 때 index_news()로 갱신한다. 뉴스 id를
+    FTS rowid로 사용하므로 갱신/삭제가 rowid 조회 한 번으로 끝난다.
+    trigram 토크나이저는 3글자 미만 검색어를 MATCH로 찾지 못하므로 LIKE로 대체한다.
+    메인 DB도 SQLite이면 인덱스 파일을 세션 커넥션에 ATTACH해 필터를 서브쿼리로 만든다.
+    """
+
+    name = 'sqlite_fts5'
+
+    def __init__(self, path: str = DEFAULT_FTS_PATH):
+        self.path = os.path.abspath(path)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self):
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            columns = [row[1] for row in conn.execute('PRAGMA table_info(news_fts)')]
+            if 'news_id' in columns:
+                # 이전 형식(news_id 컬럼)은 rowid로 삭제할 수 없으므로 새로 만들고 재색인 필요
+                logger.warning("이전 형식의 뉴스 검색 인덱스를 삭제합니다. POST /api/news/search/reindex로 다시 생성하세요.")
+                conn.execute('DROP TABLE news_fts')
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5("
+                "title, content, artist_id UNINDEXED, tokenize='trigram')"
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def _where(self, query_text: str, artist_id: Optional[int]) -> Tuple[str, Dict]:
+        """news_fts 검색 조건과 이름 있는 파라미터 (sqlite3와 SQLAlchemy text()에서 같이 사용)"""
+        if len(query_text) >= 3:
+            clause, params = 'news_fts MATCH :fts_query', {'fts_query': '"' + query_text.replace('"', '""') + '"'}
+        else:
+            clause, params = '(title LIKE :fts_pattern OR content LIKE :fts_pattern)', {'fts_pattern': f"%{query_text}%"}
+        if artist_id:
+            clause += ' AND artist_id = :fts_artist_id'
+            params['fts_artist_id'] = str(artist_id)
+        return clause, params
+
+    def _attach_to_session(self) -> bool:
+        """현재 세션 커넥션(SQLite)에 인덱스 파일을 ATTACH. 이미 되어 있으면 그대로 사용"""
+        if db.session.get_bind().dialect.name != 'sqlite':
+            return False
+        with self._lock:
+            # 인덱스 파일과 테이블이 없으면 먼저 생성
+            self._connect().close()
+        conn = db.session.connection()
+        attached = {row[1] for row in conn.exec_driver_sql('PRAGMA database_list')}
+        if FTS_ATTACH_SCHEMA not in attached:
+            try:
+                conn.exec_driver_sql(f"ATTACH DATABASE ? AS {FTS_ATTACH_SCHEMA}", (self.path,))
+            except Exception as e:
+                # 트랜잭션 도중에는 ATTACH할 수 없음
+                logger.debug(f"뉴스 검색 인덱스 ATTACH 실패: {str(e)}")
+                return False
+        return True
+
+    def match_ids_select(self, query_text: str):
+        clause, params = self._where(query_text, None)
+        if self._attach_to_session():
+            return db.text(
+                f"SELECT rowid FROM {FTS_ATTACH_SCHEMA}.news_fts WHERE {clause}"
+            ).bindparams(**params).columns(db.column('rowid', db.Integer))
+
+        # 메인 DB가 다른 DB이면 일치하는 id를 모두 가져옴 (관련도 순위/개수 제한 없음)
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(f"SELECT rowid FROM news_fts WHERE {clause}", params).fetchall()
+            finally:
+                conn.close()
+        return [news_id for (news_id,) in rows]
+
+    def search(self, query_text, artist_id=None, limit=20, offset=0):
+        clause, params = self._where(query_text, artist_id)
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    f"SELECT rowid, bm25(news_fts) FROM news_fts WHERE {clause} "
+                    f"ORDER BY bm25(news_fts), rowid DESC LIMIT :limit OFFSET :offset",
+                    dict(params, limit=limit, offset=offset)
+                ).fetchall()
+            finally:
+                conn.close()
+        # bm25는 작을수록 관련도가 높으므로 부호를 바꿔 반환
+        return [(news_id, -float(score)) for news_id, score in rows]
+
+    def index_news(self, rows):
+        rows = list(rows)
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.executemany('DELETE FROM news_fts WHERE rowid = ?', [(r['id'],) for r in rows])
+                conn.executemany(
+                    'INSERT INTO news_fts (rowid, title, content, artist_id) VALUES (?, ?, ?, ?)',
+                    [(r['id'], r['title'] or '', r['content'] or '', str(r['artist_id'])) for r in rows]
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+    def remove_news(self, news_id: int):
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute('DELETE FROM news_fts WHERE rowid = ?', (news_id,))
+                conn.commit()
+            finally:
+                conn.close()
+
+    def rebuild(self, chunk_size: int = 1000) -> int:
+        """DB의 모든 뉴스로 인덱스를 다시 생성"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute('DELETE FROM news_fts')
+                conn.commit()
+            finally:
+                conn.close()
+
+        total = 0
+        last_id = 0
+        while True:
+            chunk = db.session.query(News.id, News.artist_id, News.title, News.content).filter(
+                News.id > last_id
+            ).order_by(News.id).limit(chunk_size).all()
+            if not chunk:
+                break
+            self.index_news([
+                {'id': r.id, 'artist_id': r.artist_id, 'title': r.title, 'content': r.content} for r in chunk
+            ])
+            total += len(chunk)
+            last_id = chunk[-1].id
+        return total
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_news_search_backend() -> NewsSearchBackend:
+    """DB가 MySQL이면 FULLTEXT, 아니면 로컬 FTS5 인덱스 사용"""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            if db.engine.dialect.name == 'mysql':
+                _backend = MySQLFulltextSearch()
+            else:
+                _backend = SQLiteFTSSearch()
+        return _backend
@@ -0,0 +1,145 @@
+import logging
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import func, insert
+
+from backend.app import db
+from backend.models import Artist, News, NewsDailyStat
+from backend.services.generic_upsert import select_then_upsert
+
+logger = logging.getLogger(__name__)
+
+StatKey = Tuple[date, int, str]
+
+
+def _upsert_deltas(deltas: Dict[StatKey, int]):
+    """(일자, 아티스트, 감정) 행이 있으면 news_count에 delta를 더하고 없으면 생성"""
+    table = NewsDailyStat.__table__
+    now = datetime.utcnow()
+    rows = [
+        {'stat_date': stat_date, 'artist_id': artist_id, 'sentiment': sentiment, 'news_count': delta, 'updated_at': now}
+        for (stat_date, artist_id, sentiment), delta in deltas.items()
+    ]
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+        stmt = mysql_insert(table).values(rows)
+        db.session.execute(stmt.on_duplicate_key_update(
+            news_count=table.c.news_count + stmt.inserted.news_count,
+            updated_at=stmt.inserted.updated_at
+        ))
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        stmt = sqlite_insert(table).values(rows)
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=['stat_date', 'artist_id', 'sentiment'],
+            set_={
+                'news_count': table.c.news_count + stmt.excluded.news_count,
+                'updated_at': stmt.excluded.updated_at
+            }
+        ))
+    else:
+        select_then_upsert(
+            table, ['stat_date', 'artist_id', 'sentiment'], rows,
+            merge=lambda current, row: {
+                'news_count': current['news_count'] + row['news_count'],
+                'updated_at': row['updated_at']
+            }
+        )
+
+
+def apply_news_stat_deltas(deltas: Dict[StatKey, int]):
+    """집계 테이블에 건수 변화량 반영 (호출한 쪽의 트랜잭션에서 함께 커밋됨)"""
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if deltas:
+        _upsert_deltas(deltas)
+
+
+def record_news_inserted(artist_id: int, crawled_at: datetime, count: int, sentiment: str = 'neutral'):
+    """새로 저장된 뉴스 건수 반영 (크롤러에서 호출)"""
+    apply_news_stat_deltas({(crawled_at.date(), artist_id, sentiment): count})
+
+
+def record_sentiment_change(article: News, old_sentiment: Optional[str], new_sentiment: str):
+    """기사 감정 변경 시 이전 감정 -1, 새 감정 +1"""
+    if old_sentiment == new_sentiment or article.crawled_at is None:
+        return
+    day = article.crawled_at.date()
+    apply_news_stat_deltas({
+        (day, article.artist_id, old_sentiment or 'neutral'): -1,
+        (day, article.artist_id, new_sentiment): 1
+    })
+
+
+def record_news_deleted(article: News):
+    if article.crawled_at is None:
+        return
+    apply_news_stat_deltas({(article.crawled_at.date(), article.artist_id, article.sentiment or 'neutral'): -1})
+
+
+def rebuild_news_stats() -> int:
+    """news 테이블 전체를 다시 집계해 집계 테이블을 재생성 (불일치 복구용). 생성된 행 수 반환"""
+    stat_date = func.date(News.crawled_at)
+    sentiment = func.coalesce(News.sentiment, 'neutral')
+    grouped = db.session.query(
+        stat_date, News.artist_id, sentiment, func.count(News.id)
+    ).filter(News.crawled_at.isnot(None)).group_by(stat_date, News.artist_id, sentiment).all()
+
+    deltas = Counter()
+    for day, artist_id, sentiment_value, count in grouped:
+        # SQLite의 DATE()는 문자열을 반환
+        if isinstance(day, str):
+            day = date.fromisoformat(day)
+        deltas[(day, artist_id, sentiment_value)] += count
+
+    try:
+        NewsDailyStat.query.delete()
+        apply_news_stat_deltas(deltas)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    logger.info(f"뉴스 통계 집계를 재생성했습니다. ({len(deltas)}개 행)")
+    return len(deltas)
+
+
+def get_total_news_count() -> int:
+    return int(db.session.query(func.coalesce(func.sum(NewsDailyStat.news_count), 0)).scalar())
+
+
+def get_news_stats_summary(recent_days: int = 7) -> dict:
+    """/api/news/stats 응답 구성 (집계 테이블만 조회)"""
+    total_news = get_total_news_count()
+
+    since = (datetime.utcnow() - timedelta(days=recent_days)).date()
+    recent_news = int(db.session.query(func.coalesce(func.sum(NewsDailyStat.news_count), 0)).filter(
+        NewsDailyStat.stat_date >= since
+    ).scalar())
+
+    artist_news_counts = db.session.query(
+        Artist.id,
+        Artist.name,
+        func.sum(NewsDailyStat.news_count).label('news_count')
+    ).join(NewsDailyStat, NewsDailyStat.artist_id == Artist.id).group_by(Artist.id, Artist.name).having(
+        func.sum(NewsDailyStat.news_count) > 0
+    ).all()
+
+    sentiment_counts = db.session.query(
+        NewsDailyStat.sentiment,
+        func.sum(NewsDailyStat.news_count).label('count')
+    ).group_by(NewsDailyStat.sentiment).having(func.sum(NewsDailyStat.news_count) > 0).all()
+
+    return {
+        'total_news': total_news,
+        'recent_news': recent_news,
+        'artist_news_counts': [
+            {'id': artist_id, 'artist_name': name, 'news_count': int(count)}
+            for artist_id, name, count in artist_news_counts
+        ],
+        'sentiment_counts': [
+            {'sentiment': sentiment, 'count': int(count)}
+            for sentiment, count in sentiment_counts
+        ]
+    }
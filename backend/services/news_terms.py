@@ -0,0 +1,232 @@
+import logging
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+
+from backend.app import db
+from backend.models import ArtistTerm, ArtistTermDaily, News
+from backend.services.generic_upsert import select_then_upsert
+from backend.utils.text_terms import count_terms, get_tokenizer
+
+logger = logging.getLogger(__name__)
+
+# 한 번의 다중 행 upsert에 넣을 최대 행 수
+UPSERT_CHUNK_SIZE = 1000
+# 전체 재계산 시 한 번에 읽을 뉴스 수
+REBUILD_NEWS_CHUNK = 500
+
+DailyKey = Tuple[int, date, str]
+
+
+class TermDeltas:
+    """(아티스트, 단어) 누적 변화량과 (아티스트, 일자, 단어) 일별 변화량"""
+
+    def __init__(self):
+        self.totals: Dict[Tuple[int, str], int] = Counter()
+        self.daily: Dict[DailyKey, int] = Counter()
+        self.last_seen: Dict[Tuple[int, str], datetime] = {}
+
+    def add_article(self, artist_id: int, content: Optional[str], seen_at: datetime, sign: int = 1):
+        for term, count in count_terms(content).items():
+            self.totals[(artist_id, term)] += sign * count
+            self.daily[(artist_id, seen_at.date(), term)] += sign * count
+            if sign > 0:
+                previous = self.last_seen.get((artist_id, term))
+                if previous is None or seen_at > previous:
+                    self.last_seen[(artist_id, term)] = seen_at
+
+    def __bool__(self):
+        return bool(self.totals)
+
+
+def _article_seen_at(published_at: Optional[datetime], crawled_at: Optional[datetime]) -> datetime:
+    """단어 일자 버킷 기준 시각: 기사 발행일, 없으면 수집일"""
+    return published_at or crawled_at or datetime.utcnow()
+
+
+def _merge_term_row(current, row):
+    """일반 upsert용: count는 더하고 last_seen은 더 최근 값 (NULL은 무시)"""
+    values = {'count': current['count'] + row['count']}
+    if 'last_seen' in row:
+        candidates = [value for value in (current.get('last_seen'), row['last_seen']) if value is not None]
+        values['last_seen'] = max(candidates) if candidates else None
+    return values
+
+
+def _upsert_rows(table, key_columns: List[str], rows: List[dict], last_seen: bool):
+    """count는 기존 값에 더하고, last_seen은 더 최근 값으로 갱신하는 다중 행 upsert"""
+    dialect = db.session.get_bind().dialect.name
+    if dialect not in ('mysql', 'sqlite'):
+        select_then_upsert(table, key_columns, rows, merge=_merge_term_row)
+        return
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        chunk = rows[start:start + UPSERT_CHUNK_SIZE]
+        if dialect == 'mysql':
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+            stmt = mysql_insert(table).values(chunk)
+            updates = {'count': table.c.count + stmt.inserted['count']}
+            if last_seen:
+                updates['last_seen'] = func.greatest(
+                    func.coalesce(table.c.last_seen, stmt.inserted.last_seen),
+                    func.coalesce(stmt.inserted.last_seen, table.c.last_seen)
+                )
+            db.session.execute(stmt.on_duplicate_key_update(updates))
+        else:
+            from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+            stmt = sqlite_insert(table).values(chunk)
+            updates = {'count': table.c.count + stmt.excluded['count']}
+            if last_seen:
+                # SQLite의 다중 인자 MAX()는 NULL이 있으면 NULL이므로 COALESCE로 보정
+                updates['last_seen'] = func.max(
+                    func.coalesce(table.c.last_seen, stmt.excluded.last_seen),
+                    func.coalesce(stmt.excluded.last_seen, table.c.last_seen)
+                )
+            db.session.execute(stmt.on_conflict_do_update(index_elements=key_columns, set_=updates))
+
+
+def apply_term_deltas(deltas: TermDeltas):
+    """단어 빈도 변화량을 누적/일별 테이블에 반영 (호출한 쪽의 트랜잭션에서 함께 커밋됨)"""
+    if not deltas:
+        return
+
+    total_rows = [
+        {'artist_id': artist_id, 'term': term, 'count': delta, 'last_seen': deltas.last_seen.get((artist_id, term))}
+        for (artist_id, term), delta in deltas.totals.items() if delta
+    ]
+    daily_rows = [
+        {'artist_id': artist_id, 'term_date': term_date, 'term': term, 'count': delta}
+        for (artist_id, term_date, term), delta in deltas.daily.items() if delta
+    ]
+    _upsert_rows(ArtistTerm.__table__, ['artist_id', 'term'], total_rows, last_seen=True)
+    _upsert_rows(ArtistTermDaily.__table__, ['artist_id', 'term_date', 'term'], daily_rows, last_seen=False)
+
+    # 삭제로 0 이하가 된 행 정리
+    if any(delta < 0 for delta in deltas.totals.values()):
+        artist_ids = {artist_id for artist_id, _ in deltas.totals}
+        ArtistTerm.query.filter(ArtistTerm.artist_id.in_(artist_ids), ArtistTerm.count <= 0).delete(synchronize_session=False)
+        ArtistTermDaily.query.filter(
+            ArtistTermDaily.artist_id.in_(artist_ids), ArtistTermDaily.count <= 0
+        ).delete(synchronize_session=False)
+
+
+def record_news_terms(rows: Iterable[dict]):
+    """새로 저장한 뉴스 행(artist_id, content, published_at, crawled_at)의 단어 빈도 반영 (크롤러에서 호출)"""
+    deltas = TermDeltas()
+    for row in rows:
+        deltas.add_article(row['artist_id'], row.get('content'), _article_seen_at(row.get('published_at'), row.get('crawled_at')))
+    apply_term_deltas(deltas)
+
+
+def record_news_terms_deleted(article: News):
+    """기사 삭제 시 해당 본문의 단어 빈도를 뺌 (last_seen은 되돌리지 않음)"""
+    deltas = TermDeltas()
+    deltas.add_article(article.artist_id, article.content, _article_seen_at(article.published_at, article.crawled_at), sign=-1)
+    apply_term_deltas(deltas)
+
+
+def rebuild_news_terms(artist_ids: Optional[Iterable[int]] = None) -> int:
+    """news 본문을 다시 분석해 단어 빈도 테이블을 재생성 (초기 생성/불일치 복구용)
+
+    아티스트 단위로 지우고 다시 채운 뒤 커밋한다. 처리한 뉴스 수를 반환한다.
+    """
+    if artist_ids is None:
+        artist_ids = [artist_id for (artist_id,) in db.session.query(News.artist_id).distinct().order_by(News.artist_id)]
+    artist_ids = list(artist_ids)
+
+    total = 0
+    try:
+        for artist_id in artist_ids:
+            ArtistTerm.query.filter_by(artist_id=artist_id).delete(synchronize_session=False)
+            ArtistTermDaily.query.filter_by(artist_id=artist_id).delete(synchronize_session=False)
+
+            deltas = TermDeltas()
+            query = db.session.query(News.content, News.published_at, News.crawled_at).filter(
+                News.artist_id == artist_id, News.content.isnot(None)
+            ).execution_options(yield_per=REBUILD_NEWS_CHUNK)
+            for content, published_at, crawled_at in query:
+                deltas.add_article(artist_id, content, _article_seen_at(published_at, crawled_at))
+                total += 1
+            apply_term_deltas(deltas)
+            db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    logger.info(f"뉴스 단어 빈도를 재생성했습니다. (아티스트 {len(artist_ids)}명, 뉴스 {total}건)")
+    return total
+
+
+def stream_term_counts(artist_ids: Iterable[int], chunk_size: int = REBUILD_NEWS_CHUNK) -> Dict[int, Counter]:
+    """뉴스 본문에서 아티스트별 단어 빈도를 직접 계산 (단어 빈도 테이블이 아직 없는 아티스트용)
+
+    본문 컬럼만 yield_per로 나눠 읽고 chunk_size건씩 토큰화해 누적하므로, 기사 수와
+    관계없이 메모리에는 한 묶음의 본문과 단어별 카운터만 남는다.
+    """
+    artist_ids = list(artist_ids)
+    counts = {artist_id: Counter() for artist_id in artist_ids}
+    if not artist_ids:
+        return counts
+
+    tokenizer = get_tokenizer()
+    result = db.session.execute(
+        select(News.artist_id, News.content).where(
+            News.artist_id.in_(artist_ids), News.content.isnot(None)
+        ).execution_options(yield_per=chunk_size)
+    )
+    for partition in result.partitions():
+        chunk = defaultdict(list)
+        for artist_id, content in partition:
+            chunk[artist_id].append(content)
+        for artist_id, contents in chunk.items():
+            counts[artist_id].update(tokenizer.count_many(contents))
+    return counts
+
+
+def get_term_frequencies(artist_id: int, limit: int = 200, days: Optional[int] = None,
+                         today: Optional[date] = None) -> Dict[str, int]:
+    """아티스트의 상위 단어 빈도 {term: count}. days가 있으면 최근 days일 일별 버킷 합산"""
+    return get_term_frequencies_by_artist([artist_id], limit, days, today).get(artist_id, {})
+
+
+def get_term_frequencies_by_artist(artist_ids: Iterable[int], limit: int = 200, days: Optional[int] = None,
+                                   today: Optional[date] = None) -> Dict[int, Dict[str, int]]:
+    """아티스트별 상위 limit개 단어 빈도를 한 번의 쿼리로 조회 (ROW_NUMBER() 윈도 함수)"""
+    artist_ids = list(artist_ids)
+    result = {artist_id: {} for artist_id in artist_ids}
+    if not artist_ids:
+        return result
+
+    if days is None:
+        counts = db.session.query(
+            ArtistTerm.artist_id.label('artist_id'), ArtistTerm.term.label('term'), ArtistTerm.count.label('count')
+        ).filter(ArtistTerm.artist_id.in_(artist_ids), ArtistTerm.count > 0)
+    else:
+        since = (today or datetime.utcnow().date()) - timedelta(days=days - 1)
+        counts = db.session.query(
+            ArtistTermDaily.artist_id.label('artist_id'),
+            ArtistTermDaily.term.label('term'),
+            func.sum(ArtistTermDaily.count).label('count')
+        ).filter(
+            ArtistTermDaily.artist_id.in_(artist_ids), ArtistTermDaily.term_date >= since
+        ).group_by(ArtistTermDaily.artist_id, ArtistTermDaily.term).having(func.sum(ArtistTermDaily.count) > 0)
+    counts = counts.subquery()
+
+    ranked = db.session.query(
+        counts.c.artist_id, counts.c.term, counts.c.count,
+        func.row_number().over(
+            partition_by=counts.c.artist_id, order_by=(counts.c.count.desc(), counts.c.term)
+        ).label('term_rank')
+    ).subquery()
+    rows = db.session.query(ranked.c.artist_id, ranked.c.term, ranked.c.count).filter(
+        ranked.c.term_rank <= limit
+    ).order_by(ranked.c.artist_id, ranked.c.term_rank)
+
+    for artist_id, term, count in rows:
+        result[artist_id][term] = int(count)
+    return result
+
+
+def get_top_keywords(artist_id: int, limit: int = 20, days: Optional[int] = None) -> List[str]:
+    """아티스트 뉴스의 상위 키워드 (빈도순)"""
+    return list(get_term_frequencies(artist_id, limit=limit, days=days).keys())
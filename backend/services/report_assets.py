@@ -0,0 +1,200 @@
+import base64
+import logging
+import mimetypes
+import os
+import re
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+REPORT_STYLESHEET_PATH = os.path.join(BACKEND_DIR, 'static', 'css', 'report_styles.css')
+# 보고서 프로필 사진 최대 크기(px). 원본(수 MB PNG)을 그대로 넣으면 HTML이 커짐
+REPORT_PROFILE_PHOTO_MAX_SIZE = int(os.getenv('REPORT_PROFILE_PHOTO_MAX_SIZE', '600'))
+# 외부 @import(Google Fonts의 Inter 등)를 뺄지. 빼면 네트워크 요청이 없어지지만 로컬 NanumGothic으로 대체됨
+REPORT_DROP_REMOTE_CSS_IMPORTS = os.getenv('REPORT_DROP_REMOTE_CSS_IMPORTS', 'false').lower() == 'true'
+# 보고서별 글꼴 서브셋 캐시 항목 수
+REPORT_FONT_SUBSET_CACHE_SIZE = int(os.getenv('REPORT_FONT_SUBSET_CACHE_SIZE', '32'))
+
+_CSS_URL_PATTERN = re.compile(r"url\(\s*(['\"]?)([^'\")]+)\1\s*\)")
+_REMOTE_IMPORT_PATTERN = re.compile(r"@import\s+url\(\s*['\"]?https?://[^)]*\)\s*;\s*")
+_EXTRA_MIMETYPES = {'.ttf': 'font/ttf', '.otf': 'font/otf', '.woff': 'font/woff', '.woff2': 'font/woff2'}
+_SUBSETTABLE_FONT_EXTENSIONS = ('.ttf', '.otf')
+# 본문 글자 외에 항상 넣는 글자 (text-transform: uppercase 등으로 바뀌는 ASCII)
+_BASE_SUBSET_CHARS = frozenset(chr(code) for code in range(0x20, 0x7f))
+
+_cache: Dict[tuple, Tuple[tuple, str]] = {}
+_cache_lock = threading.Lock()
+_subset_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+def _file_signature(path: str) -> tuple:
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _cached(key: tuple, signature: tuple, build):
+    """signature(파일 mtime/크기)가 같으면 이전에 만든 값을 재사용"""
+    with _cache_lock:
+        entry = _cache.get(key)
+    if entry and entry[0] == signature:
+        return entry[1]
+    value = build()
+    with _cache_lock:
+        _cache[key] = (signature, value)
+    return value
+
+
+def clear_report_asset_cache():
+    with _cache_lock:
+        _cache.clear()
+        _subset_cache.clear()
+
+
+def _guess_mimetype(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    return _EXTRA_MIMETYPES.get(extension) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def _to_data_uri(content: bytes, mimetype: str) -> str:
+    return f"data:{mimetype};base64,{base64.b64encode(content).decode('ascii')}"
+
+
+def file_data_uri(path: str) -> str:
+    """파일을 data URI로 변환 (mtime 기준 캐시)"""
+    path = os.path.abspath(path)
+
+    def build():
+        with open(path, 'rb') as f:
+            return _to_data_uri(f.read(), _guess_mimetype(path))
+
+    return _cached(('file', path), _file_signature(path), build)
+
+
+def font_subset_data_uri(path: str, chars: frozenset) -> Optional[str]:
+    """글꼴을 chars에 필요한 글리프만 남긴 data URI로 변환. fontTools가 없으면 None
+
+    NanumGothic 한 벌이 약 4MB라 통째로 넣으면 HTML이 10MB를 넘는다. 보고서 본문 글자만 남기면
+    수십 KB로 줄어든다. 최근 결과는 (파일, 글자 집합) 기준으로 REPORT_FONT_SUBSET_CACHE_SIZE개까지 보관한다.
+    """
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        return None
+
+    path = os.path.abspath(path)
+    key = (path, _file_signature(path), chars)
+    with _cache_lock:
+        if key in _subset_cache:
+            _subset_cache.move_to_end(key)
+            return _subset_cache[key]
+
+    options = subset.Options()
+    options.hinting = False
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=''.join(sorted(chars)))
+    with TTFont(path) as font:
+        subsetter.subset(font)
+        buffer = BytesIO()
+        font.save(buffer)
+    value = _to_data_uri(buffer.getvalue(), _guess_mimetype(path))
+
+    with _cache_lock:
+        _subset_cache[key] = value
+        while len(_subset_cache) > REPORT_FONT_SUBSET_CACHE_SIZE:
+            _subset_cache.popitem(last=False)
+    return value
+
+
+def has_remote_imports(css: str) -> bool:
+    """스타일시트에 외부 @import가 남아 있는지 (렌더링 시 네트워크 대기가 필요한지)"""
+    return bool(_REMOTE_IMPORT_PATTERN.search(css))
+
+
+def inline_stylesheet(css_path: str = REPORT_STYLESHEET_PATH, text: Optional[str] = None) -> str:
+    """CSS의 상대 경로 url()(폰트, 이미지)을 data URI로 바꾼 스타일시트 본문
+
+    text(보고서 HTML)를 주면 글꼴은 그 글자만 담은 서브셋으로 넣는다. fontTools가 없으면
+    글꼴 전체를 넣는다. CSS와 참조 파일 중 하나라도 바뀌면 다시 만든다.
+    """
+    css_path = os.path.abspath(css_path)
+    with open(css_path, 'r', encoding='utf-8') as f:
+        css = f.read()
+
+    css_dir = os.path.dirname(css_path)
+    local_files = {}
+    for _, url in _CSS_URL_PATTERN.findall(css):
+        if url.startswith(('data:', 'http://', 'https://', '//')):
+            continue
+        asset_path = os.path.normpath(os.path.join(css_dir, url.split('?')[0].split('#')[0]))
+        if os.path.exists(asset_path):
+            local_files[url] = asset_path
+        else:
+            logger.warning(f"보고서 CSS에서 참조한 파일을 찾을 수 없습니다: {asset_path}")
+
+    signature = (_file_signature(css_path),) + tuple(
+        (url, _file_signature(path)) for url, path in sorted(local_files.items())
+    )
+
+    chars = _BASE_SUBSET_CHARS | frozenset(text) if text is not None else None
+
+    def build():
+        def replace(match):
+            url = match.group(2)
+            if url not in local_files:
+                return match.group(0)
+            path = local_files[url]
+            data_uri = None
+            if chars is not None and path.lower().endswith(_SUBSETTABLE_FONT_EXTENSIONS):
+                data_uri = font_subset_data_uri(path, chars)
+                if data_uri is None:
+                    logger.warning("fontTools가 없어 보고서 글꼴 전체를 포함합니다 (pip install fonttools)")
+            return f"url('{data_uri or file_data_uri(path)}')"
+
+        inlined = _CSS_URL_PATTERN.sub(replace, css)
+        if REPORT_DROP_REMOTE_CSS_IMPORTS:
+            # 외부 웹폰트는 글꼴 목록의 다음 순서(로컬 NanumGothic)로 대체됨
+            inlined = _REMOTE_IMPORT_PATTERN.sub('', inlined)
+        return inlined
+
+    if chars is not None:
+        # 서브셋은 보고서마다 다르므로 font_subset_data_uri의 LRU에만 보관
+        return build()
+    return _cached(('stylesheet', css_path), signature, build)
+
+
+def resized_image_data_uri(path: str, max_size: int = REPORT_PROFILE_PHOTO_MAX_SIZE) -> str:
+    """이미지를 max_size 이내로 줄여 data URI로 변환 (mtime 기준 캐시)"""
+    path = os.path.abspath(path)
+
+    def build():
+        from PIL import Image
+
+        with Image.open(path) as image:
+            if max(image.size) <= max_size:
+                return file_data_uri(path)
+            image.thumbnail((max_size, max_size))
+            buffer = BytesIO()
+            if image.mode in ('RGBA', 'LA', 'P'):
+                image.save(buffer, format='PNG', optimize=True)
+                return _to_data_uri(buffer.getvalue(), 'image/png')
+            image.convert('RGB').save(buffer, format='JPEG', quality=85)
+            return _to_data_uri(buffer.getvalue(), 'image/jpeg')
+
+    return _cached(('image', path, max_size), _file_signature(path), build)
+
+
+def profile_photo_data_uri(photo_folder: str, filename: str) -> Optional[str]:
+    """프로필 사진 data URI. 파일이 없거나 읽을 수 없으면 None"""
+    path = os.path.join(photo_folder, os.path.basename(filename))
+    if not os.path.exists(path):
+        return None
+    try:
+        return resized_image_data_uri(path)
+    except Exception as e:
+        logger.warning(f"프로필 사진을 보고서에 포함하지 못했습니다 ({path}): {str(e)}")
+        return None
@@ -0,0 +1,402 @@
+import os
+import logging
+import multiprocessing
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from flask import render_template, url_for
+from sqlalchemy import func
+from sqlalchemy.orm import noload
+
+from backend.app import db
+from backend.models import Artist, Channel, News, Activity
+from backend.services.channel_analytics import get_channel_analytics
+from backend.services.channel_stats import get_channels_with_latest_stats
+from backend.services.report_assets import has_remote_imports, inline_stylesheet, profile_photo_data_uri
+from backend.services.wordcloud_cache import get_news_fingerprints, get_wordcloud_cache
+from backend.services.news_terms import get_term_frequencies_by_artist, stream_term_counts
+from backend.utils.wordcloud_generator import (
+    WORDCLOUD_FULL_SCALE, get_wordcloud_renderer, png_to_data_uri, render_wordcloud_from_frequencies
+)
+
+logger = logging.getLogger(__name__)
+
+PUPPETEER_SERVICE_URL = os.getenv('PUPPETEER_SERVICE_URL', "http://localhost:3001/generate-pdf")
+# (연결, 응답) 타임아웃(초). 응답은 서비스의 렌더링 대기열 시간을 포함
+PUPPETEER_TIMEOUT = (5, int(os.getenv('PUPPETEER_TIMEOUT_SECONDS', '120')))
+PROFILE_PHOTO_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'frontend', 'public', 'images', 'artists', 'profile')
+# 백그라운드 보고서 작업 결과 파일 저장 위치
+REPORT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'response', 'report')
+
+# 아티스트가 이 수보다 많으면 요청 스레드에서 만들지 않고 백그라운드 작업으로 생성
+REPORT_SYNC_MAX_ARTISTS = int(os.getenv('REPORT_SYNC_MAX_ARTISTS', '3'))
+# 워드클라우드 렌더링 프로세스 수 (0이면 CPU 수 기준)
+REPORT_WORDCLOUD_PROCESSES = int(os.getenv('REPORT_WORDCLOUD_PROCESSES', '0')) or min(4, os.cpu_count() or 1)
+RECENT_NEWS_PER_ARTIST = 4
+WORDCLOUD_NUM_WORDS = 100
+# 워드클라우드에 쓰는 아티스트별 상위 단어 수 (그려지는 단어는 WORDCLOUD_NUM_WORDS개)
+WORDCLOUD_TERM_LIMIT = 200
+
+CF_ACTIVITY_KEYWORDS = ['CF', 'AD', '광고', 'BRAND']
+BROADCAST_ACTIVITY_KEYWORDS = ['DRAMA', 'MOVIE', 'TV', '방송', '영화', '드라마']
+
+REPORT_MIMETYPES = {
+    'pdf': 'application/pdf',
+    'pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+}
+
+
+class ReportError(Exception):
+    """보고서 생성 요청 오류 (status_code로 HTTP 응답 코드 전달)"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+_puppeteer_session = None
+_puppeteer_session_lock = threading.Lock()
+
+
+def get_puppeteer_session() -> requests.Session:
+    """Puppeteer 서비스용 keep-alive 세션 (요청마다 TCP 연결을 새로 맺지 않도록 재사용)"""
+    global _puppeteer_session
+    with _puppeteer_session_lock:
+        if _puppeteer_session is None:
+            session = requests.Session()
+            # 백그라운드 작업과 요청 스레드가 동시에 보고서를 만들 수 있으므로 연결 여러 개 유지
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _puppeteer_session = session
+        return _puppeteer_session
+
+
+def get_puppeteer_health() -> dict:
+    """Puppeteer 서비스 상태 (대기열 길이, 렌더링 지연 시간, 브라우저 풀)"""
+    health_url = PUPPETEER_SERVICE_URL.rsplit('/', 1)[0] + '/health'
+    response = get_puppeteer_session().get(health_url, timeout=5)
+    response.raise_for_status()
+    return response.json()
+
+
+def get_recent_news_by_artist(artist_ids: List[int], limit: int = RECENT_NEWS_PER_ARTIST) -> Dict[int, List[News]]:
+    """아티스트별 최신 뉴스 limit건을 한 번의 쿼리로 조회 (ROW_NUMBER() 윈도 함수)"""
+    result = {artist_id: [] for artist_id in artist_ids}
+    if not artist_ids:
+        return result
+
+    ranked = db.session.query(
+        News.id.label('id'),
+        func.row_number().over(partition_by=News.artist_id, order_by=News.published_at.desc()).label('news_rank')
+    ).filter(News.artist_id.in_(artist_ids)).subquery()
+
+    news_items = News.query.options(noload(News.artist)).join(ranked, News.id == ranked.c.id).filter(
+        ranked.c.news_rank <= limit
+    ).order_by(News.artist_id, ranked.c.news_rank).all()
+    for news in news_items:
+        result[news.artist_id].append(news)
+    return result
+
+
+def get_activities_by_artist(artist_ids: List[int]) -> Dict[int, List[Activity]]:
+    """아티스트별 활동 목록 (최신순)을 한 번의 쿼리로 조회"""
+    result = {artist_id: [] for artist_id in artist_ids}
+    if not artist_ids:
+        return result
+    try:
+        activities = Activity.query.options(noload(Activity.artist)).filter(
+            Activity.artist_id.in_(artist_ids)
+        ).order_by(Activity.artist_id, Activity.start_time.desc()).all()
+    except Exception as act_err:
+        logger.warning(f"Could not fetch activities for artists {artist_ids}: {act_err}")
+        db.session.rollback() # Important: rollback to clear the failed state
+        # Continue without activities if there's a schema issue
+        return result
+
+    for activity in activities:
+        result[activity.artist_id].append(activity)
+    return result
+
+
+def _filter_activities(activities: List[Activity], keywords: List[str]) -> List[Activity]:
+    return [a for a in activities if a.activity_type and any(kw in a.activity_type.upper() for kw in keywords)]
+
+
+_wordcloud_pool = None
+_wordcloud_pool_lock = threading.Lock()
+
+
+def _get_wordcloud_pool() -> ProcessPoolExecutor:
+    """워드클라우드 렌더링용 프로세스 풀 (처음 사용할 때 생성해 재사용)
+
+    Flask 앱의 스레드/DB 연결을 복제하지 않도록 spawn으로 띄운다. 워커는 텍스트만 받아
+    이미지를 렌더링하고 DB에 접근하지 않는다. 워커는 시작할 때 렌더러(글꼴, 컬러맵)를 만들어 둔다.
+    """
+    global _wordcloud_pool
+    with _wordcloud_pool_lock:
+        if _wordcloud_pool is None:
+            _wordcloud_pool = ProcessPoolExecutor(
+                max_workers=REPORT_WORDCLOUD_PROCESSES,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=get_wordcloud_renderer
+            )
+        return _wordcloud_pool
+
+
+def _reset_wordcloud_pool():
+    global _wordcloud_pool
+    with _wordcloud_pool_lock:
+        if _wordcloud_pool is not None:
+            _wordcloud_pool.shutdown(wait=False, cancel_futures=True)
+        _wordcloud_pool = None
+
+
+def _render_pngs(inputs: Dict[int, dict]) -> Dict[int, Tuple[Optional[bytes], list]]:
+    """아티스트별 단어 빈도로 워드클라우드 PNG 렌더링. 여러 명이면 프로세스 풀에서 병렬 렌더링"""
+    if len(inputs) > 1 and REPORT_WORDCLOUD_PROCESSES > 1:
+        try:
+            pool = _get_wordcloud_pool()
+            futures = {
+                artist_id: pool.submit(render_wordcloud_from_frequencies, word_freq, WORDCLOUD_NUM_WORDS)
+                for artist_id, word_freq in inputs.items()
+            }
+            return {artist_id: future.result() for artist_id, future in futures.items()}
+        except BrokenProcessPool as e:
+            # 워커 프로세스가 죽은 경우 풀을 다시 만들도록 비우고 현재 프로세스에서 렌더링
+            logger.error(f"워드클라우드 프로세스 풀 오류, 현재 프로세스에서 생성합니다: {str(e)}")
+            _reset_wordcloud_pool()
+
+    return {
+        artist_id: render_wordcloud_from_frequencies(word_freq, WORDCLOUD_NUM_WORDS)
+        for artist_id, word_freq in inputs.items()
+    }
+
+
+def render_wordclouds(artist_ids: List[int]) -> Dict[int, Tuple[Optional[str], list]]:
+    """아티스트별 (워드클라우드 base64, 상위 키워드)
+
+    뉴스 집합이 이전과 같은 아티스트는 디스크 캐시에서 가져오고, 나머지만 단어 빈도 테이블에서
+    빈도를 읽어 렌더링한다. 단어 빈도가 아직 없는 아티스트는 뉴스 본문을 분석한다.
+    """
+    results = {artist_id: (None, []) for artist_id in artist_ids}
+    fingerprints = get_news_fingerprints(artist_ids)
+    cache = get_wordcloud_cache()
+    keys = {
+        artist_id: cache.make_key(artist_id, fingerprint, WORDCLOUD_NUM_WORDS, WORDCLOUD_FULL_SCALE)
+        for artist_id, fingerprint in fingerprints.items()
+    }
+
+    try:
+        cached = cache.get_many(keys)
+    except sqlite3.Error as e:
+        logger.warning(f"워드클라우드 캐시 조회 실패, 캐시 없이 진행합니다: {e}")
+        cached = {}
+
+    misses = [artist_id for artist_id in keys if artist_id not in cached]
+    frequencies = {
+        artist_id: word_freq
+        for artist_id, word_freq in get_term_frequencies_by_artist(misses, limit=WORDCLOUD_TERM_LIMIT).items() if word_freq
+    }
+    unindexed = [artist_id for artist_id in misses if artist_id not in frequencies]
+    for artist_id, word_freq in stream_term_counts(unindexed).items():
+        if word_freq:
+            frequencies[artist_id] = word_freq
+    rendered = _render_pngs(frequencies)
+    for artist_id in misses:
+        png, keywords = rendered.get(artist_id, (None, []))
+        cached[artist_id] = (png, keywords)
+        try:
+            cache.set(artist_id, keys[artist_id], png, keywords, fingerprints[artist_id])
+        except sqlite3.Error as e:
+            logger.warning(f"워드클라우드 캐시 저장 실패: {e}")
+
+    for artist_id, (png, keywords) in cached.items():
+        results[artist_id] = (png_to_data_uri(png), keywords)
+    return results
+
+
+def build_artist_report_data(artist: Artist, channels: Optional[List[Channel]] = None,
+                             channel_analytics: Optional[dict] = None,
+                             recent_news: Optional[List[News]] = None,
+                             activities: Optional[List[Activity]] = None,
+                             wordcloud: Optional[Tuple[Optional[str], list]] = None) -> dict:
+    """아티스트 한 명의 보고서 데이터 구성 (채널 통계, 뉴스, 활동, 워드클라우드)
+
+    여러 아티스트를 만들 때는 build_report_data()가 각 항목을 미리 일괄 조회해 넘긴다.
+    넘기지 않은 항목은 이 아티스트만 대상으로 조회한다.
+    """
+    if channels is None:
+        channels = get_channels_with_latest_stats([artist.id])[artist.id]
+    if channel_analytics is None:
+        channel_analytics = get_channel_analytics(channel_ids=[channel.id for channel in channels])
+    if recent_news is None:
+        recent_news = get_recent_news_by_artist([artist.id])[artist.id]
+    if activities is None:
+        activities = get_activities_by_artist([artist.id])[artist.id]
+    if wordcloud is None:
+        wordcloud = render_wordclouds([artist.id])[artist.id]
+
+    channel_stats_data = []
+    for channel in channels:
+        # 최신 통계가 기록된 채널만 표시
+        if channel.latest_stat_date:
+            analytics = channel_analytics['channels'].get(channel.id, {})
+            channel_stats_data.append({
+                'platform': channel.platform,
+                'name': channel.channel_name,
+                'url': channel.channel_url,
+                'follower_count': channel.follower_count,
+                'engagement_rate': float(channel.engagement_rate) if channel.engagement_rate else 0.0,
+                'growth_30d': analytics.get('growth_rates', {}).get('30d'),
+                'engagement_percentile': analytics.get('engagement_percentile')
+            })
+
+    profile_photo_filename = os.path.basename(artist.profile_photo) if artist.profile_photo else 'default.png'
+    # 사진을 HTML에 포함해 Puppeteer가 Flask로 다시 요청하지 않도록 함 (없으면 URL로 대체)
+    profile_photo_url = profile_photo_data_uri(PROFILE_PHOTO_FOLDER, profile_photo_filename) or url_for(
+        'artists.serve_profile_photo', filename=profile_photo_filename, _external=True
+    )
+
+    wordcloud_base64, top_keywords = wordcloud
+
+    return {
+        'artist': artist,
+        'channel_stats': channel_stats_data,
+        'news': recent_news,
+        'activities_cf': _filter_activities(activities, CF_ACTIVITY_KEYWORDS),
+        'activities_broadcast': _filter_activities(activities, BROADCAST_ACTIVITY_KEYWORDS),
+        'profile_photo_url': profile_photo_url,
+        'wordcloud_image': wordcloud_base64,
+        'top_keywords': top_keywords
+    }
+
+
+def build_report_data(artists: List[Artist]) -> List[dict]:
+    """선택된 아티스트 전체의 보고서 데이터를 항목별 일괄 쿼리로 구성 (아티스트 수와 무관한 쿼리 수)"""
+    artist_ids = [artist.id for artist in artists]
+    channels_by_artist = get_channels_with_latest_stats(artist_ids)
+    # 선택된 아티스트의 채널만 계산 (참여율 순위는 집계 테이블의 전체 채널 분포 기준)
+    channel_analytics = get_channel_analytics(
+        channel_ids=[channel.id for artist_id in artist_ids for channel in channels_by_artist[artist_id]]
+    )
+    news_by_artist = get_recent_news_by_artist(artist_ids)
+    activities_by_artist = get_activities_by_artist(artist_ids)
+    wordclouds = render_wordclouds(artist_ids)
+
+    return [
+        build_artist_report_data(
+            artist,
+            channels=channels_by_artist[artist.id],
+            channel_analytics=channel_analytics,
+            recent_news=news_by_artist[artist.id],
+            activities=activities_by_artist[artist.id],
+            wordcloud=wordclouds[artist.id]
+        )
+        for artist in artists
+    ]
+
+
+def render_pdf_report(artists: List[Artist]) -> bytes:
+    """보고서 HTML을 렌더링하고 Puppeteer 서비스로 PDF 변환"""
+    artist_reports_data = build_report_data(artists)
+    artist_names_str = ", ".join([a.name for a in artists])
+
+    template_context = dict(
+        report_title="Artist Performance Analysis",
+        artist_names_summary=artist_names_str,
+        generation_date=datetime.now().strftime('%Y-%m-%d'),
+        author_name="theProjectCompany STRATEGIC ANALYSIS",
+        artist_reports=artist_reports_data,
+        footer_text="theProjectCompany MANAGEMENT - CONFIDENTIAL"
+    )
+    # 본문을 먼저 렌더링해 실제 쓰인 글자만 담은 글꼴 서브셋으로 스타일시트를 포함
+    body_html = render_template('report_template.html', inline_css='', **template_context)
+    inline_css = inline_stylesheet(text=body_html)
+    rendered_html = render_template('report_template.html', inline_css=inline_css, **template_context)
+
+    # 모든 자원이 HTML 안에 있으면 네트워크 유휴 대기(networkidle0) 없이 load 시점에 렌더링
+    fully_inlined = not has_remote_imports(inline_css) and all(
+        report['profile_photo_url'].startswith('data:') for report in artist_reports_data
+    )
+    response = get_puppeteer_session().post(
+        PUPPETEER_SERVICE_URL,
+        json={'htmlContent': rendered_html, 'waitUntil': 'load' if fully_inlined else 'networkidle0'},
+        timeout=PUPPETEER_TIMEOUT
+    )
+    if response.status_code == 503:
+        raise ReportError('PDF 생성 서비스가 혼잡합니다. 잠시 후 다시 시도해주세요.', 503)
+    response.raise_for_status()
+    return response.content
+
+
+def render_pptx_report(artists: List[Artist]) -> bytes:
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+    prs = Presentation()
+
+    for artist in artists:
+        # Cover Slide
+        slide = prs.slides.add_slide(prs.slide_layouts[0])
+        slide.shapes.title.text = artist.name
+        slide.placeholders[1].text = "Artist Commercial Proposal"
+
+        if artist.profile_photo:
+            image_full_path = os.path.join(PROFILE_PHOTO_FOLDER, os.path.basename(artist.profile_photo))
+            if os.path.exists(image_full_path):
+                try:
+                    slide.shapes.add_picture(image_full_path, Inches(3), Inches(3), Inches(4), Inches(4))
+                except: pass
+
+        # Details Slide
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"{artist.name} - Professional Profile"
+
+        # Simple bullet points for PPTX
+        txBox = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(6), Inches(4))
+        tf = txBox.text_frame
+        tf.text = f"• Gender: {artist.gender}\n• Nationality: {artist.nationality}\n• Agency: {artist.current_agency_name}\n• Debut: {artist.debut_date}"
+
+    buffer = BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def validate_report_request(artist_ids: List[int], report_format: str):
+    """보고서 요청 검증 (잘못되면 ReportError)"""
+    if not artist_ids:
+        raise ReportError('아티스트 ID가 제공되지 않았습니다.', 400)
+    if report_format not in REPORT_MIMETYPES:
+        raise ReportError('지원되지 않는 보고서 형식입니다.', 400)
+
+
+def should_generate_in_background(artist_ids: List[int], requested_async: bool = False) -> bool:
+    """요청 스레드를 오래 붙잡지 않도록 큰 보고서는 백그라운드 작업으로 생성"""
+    return requested_async or len(artist_ids) > REPORT_SYNC_MAX_ARTISTS
+
+
+def generate_report(artist_ids: List[int], report_format: str = 'pdf') -> Tuple[bytes, str, str]:
+    """선택된 아티스트 보고서 생성. (파일 내용, 파일명, MIME 타입) 반환
+
+    url_for(_external=True)를 사용하므로 요청 컨텍스트 안에서 호출해야 한다.
+    """
+    validate_report_request(artist_ids, report_format)
+
+    artists = Artist.query.filter(Artist.id.in_(artist_ids)).all()
+    if not artists:
+        raise ReportError('선택된 아티스트를 찾을 수 없습니다.', 404)
+
+    if report_format == 'pdf':
+        content = render_pdf_report(artists)
+    else:
+        content = render_pptx_report(artists)
+
+    filename = f'artist_report_{datetime.now().strftime("%Y%m%d")}.{report_format}'
+    return content, filename, REPORT_MIMETYPES[report_format]
@@ -0,0 +1,50 @@
+import threading
+import time
+from typing import Optional
+
+
+class RequestBudget:
+    """외부 API(Provider)별 요청 예산 관리
+
+    한 번의 실행(run) 동안 허용되는 최대 요청 수와 요청 간 최소 간격(초당 요청 수)을
+    스레드 안전하게 관리한다. 여러 워커 스레드가 같은 인스턴스를 공유한다.
+    """
+
+    def __init__(self, provider: str, max_requests: Optional[int] = None,
+                 requests_per_second: Optional[float] = None):
+        self.provider = provider
+        self.max_requests = max_requests
+        self.min_interval = (1.0 / requests_per_second) if requests_per_second else 0.0
+        self.used = 0
+        self._next_allowed_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """요청 1건을 소비. 예산이 소진되었으면 False 반환"""
+        with self._lock:
+            if self.max_requests is not None and self.used >= self.max_requests:
+                return False
+            self.used += 1
+            now = time.monotonic()
+            wait = self._next_allowed_at - now
+            self._next_allowed_at = max(now, self._next_allowed_at) + self.min_interval
+
+        # 락 밖에서 대기하여 다른 워커의 예산 확인을 막지 않음
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    @property
+    def remaining(self) -> Optional[int]:
+        if self.max_requests is None:
+            return None
+        with self._lock:
+            return max(self.max_requests - self.used, 0)
+
+    def to_dict(self):
+        return {
+            'provider': self.provider,
+            'max_requests': self.max_requests,
+            'used': self.used,
+            'remaining': self.remaining
+        }
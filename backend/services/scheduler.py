@@ -3,58 +3,481 @@
 import schedule
 import threading
 import time
+import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from backend.services.leader_election import create_leader_elector
 
 logger = logging.getLogger(__name__)
 
+# 동시에 실행할 수 있는 작업 수
+SCHEDULER_MAX_WORKERS = int(os.getenv('SCHEDULER_MAX_WORKERS', '2'))
+# 매일 실행 시각 (HH:MM)
+NEWS_CRAWL_SCHEDULE_TIME = os.getenv('NEWS_CRAWL_SCHEDULE_TIME', '05:00')
+INSTAGRAM_REFRESH_SCHEDULE_TIME = os.getenv('INSTAGRAM_REFRESH_SCHEDULE_TIME', '06:00')
+CHANNEL_SYNC_SCHEDULE_TIME = os.getenv('CHANNEL_SYNC_SCHEDULE_TIME', '07:00')
+# 스케줄 확인 주기 (초)
+SCHEDULER_POLL_SECONDS = 10
+# 실행 중인 작업의 heartbeat 갱신 주기 / 이 시간(초) 동안 갱신이 없으면 다른 프로세스가 작업을 회수
+JOB_HEARTBEAT_SECONDS = int(os.getenv('JOB_HEARTBEAT_SECONDS', '30'))
+JOB_LEASE_SECONDS = int(os.getenv('JOB_LEASE_SECONDS', '120'))
+
+JOB_TYPES = ('news_crawl', 'instagram_refresh', 'channel_sync', 'report')
+
+
 class NewsScheduler:
+    """스케줄 기반 백그라운드 작업 실행기
+
+    작업은 jobs 테이블에 기록되고 워커 풀에서 실행된다. 항목별 결과를 진행 중에
+    커밋하므로, 프로세스가 재시작되면 끝나지 않은 작업을 이어서 실행할 수 있다.
+
+    여러 프로세스(gunicorn 워커 등)에서 스케줄러가 시작되어도 리더로 선출된 하나만
+    예약 작업을 등록하고 대기 중인 작업을 실행한다.
+    """
+
     def __init__(self):
         self.app = None
+        self.elector = None
         self.is_running = False
         self.scheduler_thread = None
+        self.executor = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._active_job_ids = set()
+        self.job_handlers = {
+            'news_crawl': self._run_news_crawl,
+            'instagram_refresh': self._run_instagram_refresh,
+            'channel_sync': self._run_channel_sync,
+            'report': self._run_report,
+        }
 
     def init_app(self, app):
         """Flask 앱을 외부에서 주입받음"""
         self.app = app
+        self.elector = create_leader_elector(app, 'news_scheduler')
+
+    @property
+    def is_leader(self):
+        return bool(self.elector and self.elector.is_leader)
+
+    @property
+    def identity(self):
+        return self.elector.identity if self.elector else None
+
+    def register_job_handler(self, job_type, handler):
+        """작업 타입별 실행 함수 등록 (handler(job)는 앱 컨텍스트 안에서 호출됨)"""
+        self.job_handlers[job_type] = handler
+
+    # ------------------------------------------------------------------
+    # 작업 등록 / 실행
+    # ------------------------------------------------------------------
+
+    def _get_executor(self):
+        with self._lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=SCHEDULER_MAX_WORKERS, thread_name_prefix='job-worker')
+            return self.executor
+
+    def enqueue_job(self, job_type, params=None, trigger='manual'):
+        """작업을 jobs 테이블에 기록하고 워커 풀에 제출. 생성된 Job 반환"""
+        if job_type not in self.job_handlers:
+            raise ValueError(f"알 수 없는 작업 타입입니다: {job_type}")
+        if not self.app:
+            raise RuntimeError("Flask app is not initialized in NewsScheduler.")
+
+        from backend.app import db
+        from backend.models import Job
+
+        with self.app.app_context():
+            job = Job(job_type=job_type, params=params or {}, trigger=trigger, status='pending')
+            db.session.add(job)
+            db.session.commit()
+            job_id = job.id
+            job_data = job.to_dict()
+
+        # 스케줄러가 돌고 있는데 리더가 아니면 리더 프로세스가 가져가도록 대기열에 둠
+        if self.is_leader or not self.is_running:
+            self._submit(job_id)
+        return job_data
+
+    def _submit(self, job_id):
+        with self._lock:
+            if job_id in self._active_job_ids:
+                return
+            self._active_job_ids.add(job_id)
+        self._get_executor().submit(self._execute_job, job_id)
+
+    def _execute_job(self, job_id):
+        from backend.app import db
+        from backend.models import Job
+
+        try:
+            with self.app.app_context():
+                # pending -> running 원자적 전환: 다른 프로세스가 이미 가져간 작업이면 건너뜀
+                claimed = Job.query.filter(Job.id == job_id, Job.status == 'pending').update({
+                    'status': 'running',
+                    'worker_id': self.identity,
+                    'heartbeat_at': datetime.utcnow(),
+                    'attempts': db.func.coalesce(Job.attempts, 0) + 1,
+                    'started_at': db.func.coalesce(Job.started_at, datetime.utcnow()),
+                    'error': None
+                }, synchronize_session=False)
+                db.session.commit()
+                if not claimed:
+                    return
+
+                job = db.session.get(Job, job_id)
+                job_type = job.job_type
+                logger.info(f"[스케줄러] 작업 시작: #{job.id} {job_type} (시도 {job.attempts})")
+
+                stop_heartbeat = threading.Event()
+                heartbeat_thread = threading.Thread(
+                    target=self._heartbeat_job, args=(job_id, stop_heartbeat),
+                    name=f'job-heartbeat-{job_id}', daemon=True
+                )
+                heartbeat_thread.start()
+                try:
+                    self.job_handlers[job_type](job)
+                    final_values = {
+                        'status': 'completed',
+                        'result': job.result,
+                        'progress_total': job.progress_total,
+                        'progress_done': job.progress_done
+                    }
+                    # 핸들러가 job에 남긴 변경은 아래 조건부 UPDATE로만 기록
+                    db.session.expunge(job)
+                except Exception as e:
+                    logger.error(f"[스케줄러] 작업 #{job_id} 실패: {str(e)}", exc_info=True)
+                    db.session.rollback()
+                    final_values = {'status': 'failed', 'error': str(e)}
+                finally:
+                    stop_heartbeat.set()
+                    heartbeat_thread.join()
+
+                # 실행 중 lease가 만료되어 다른 프로세스가 가져간 작업이면 그쪽 기록을 덮어쓰지 않음
+                final_values['finished_at'] = datetime.utcnow()
+                finished = Job.query.filter(
+                    Job.id == job_id, Job.worker_id == self.identity, Job.status == 'running'
+                ).update(final_values, synchronize_session=False)
+                if not finished:
+                    db.session.rollback()
+                    logger.warning(f"[스케줄러] 작업 #{job_id}의 소유권이 다른 프로세스로 넘어가 결과({final_values['status']})를 기록하지 않습니다.")
+                    return
+                db.session.commit()
+                logger.info(f"[스케줄러] 작업 종료: #{job_id} {job_type} -> {final_values['status']}")
+        finally:
+            with self._lock:
+                self._active_job_ids.discard(job_id)
+
+    def _heartbeat_job(self, job_id, stop_event):
+        """작업이 끝날 때까지 JOB_HEARTBEAT_SECONDS마다 heartbeat_at 갱신 (별도 스레드)"""
+        from backend.app import db
+        from backend.models import Job
+
+        with self.app.app_context():
+            while not stop_event.wait(JOB_HEARTBEAT_SECONDS):
+                try:
+                    updated = Job.query.filter(
+                        Job.id == job_id, Job.status == 'running', Job.worker_id == self.identity
+                    ).update({'heartbeat_at': datetime.utcnow()}, synchronize_session=False)
+                    db.session.commit()
+                    if not updated:
+                        logger.warning(f"[스케줄러] 작업 #{job_id}의 소유권이 다른 프로세스로 넘어갔습니다.")
+                        return
+                except Exception as e:
+                    db.session.rollback()
+                    logger.error(f"[스케줄러] 작업 #{job_id} heartbeat 갱신 실패: {str(e)}")
+            db.session.remove()
+
+    def _reclaim_expired_jobs(self):
+        """소유 프로세스의 lease가 만료된 실행 중 작업을 pending으로 되돌리고 그 id 목록 반환
+
+        heartbeat가 JOB_LEASE_SECONDS 넘게 갱신되지 않았거나, 이 프로세스가 소유자로 기록되어
+        있지만 실제로는 실행하고 있지 않은 작업만 회수한다. 다른 프로세스가 실행 중인 작업은 그대로 둔다.
+        """
+        from backend.app import db
+        from backend.models import Job
+
+        threshold = datetime.utcnow() - timedelta(seconds=JOB_LEASE_SECONDS)
+        conditions = [
+            Job.status == 'running',
+            db.or_(Job.heartbeat_at.is_(None), Job.heartbeat_at < threshold, Job.worker_id == self.identity)
+        ]
+        active = self.get_active_job_ids()
+        if active:
+            conditions.append(Job.id.notin_(active))
+
+        expired = Job.query.filter(*conditions).with_entities(Job.id, Job.worker_id, Job.heartbeat_at).all()
+        if not expired:
+            return []
+        # 조회와 갱신 사이에 heartbeat가 들어온 작업은 같은 조건으로 다시 걸러짐
+        Job.query.filter(Job.id.in_([job_id for job_id, _, _ in expired]), *conditions).update(
+            {'status': 'pending'}, synchronize_session=False
+        )
+        db.session.commit()
+        for job_id, worker_id, heartbeat_at in expired:
+            logger.info(f"[스케줄러] lease 만료 작업 회수: #{job_id} (소유자 {worker_id}, heartbeat {heartbeat_at})")
+        return [job_id for job_id, _, _ in expired]
+
+    def resume_unfinished_jobs(self):
+        """대기 작업과 lease가 만료된 실행 중 작업을 다시 제출 (리더가 될 때 호출). 제출한 작업 id 반환"""
+        if not self.app:
+            return []
+
+        from backend.models import Job
+
+        with self.app.app_context():
+            self._reclaim_expired_jobs()
+            active = set(self.get_active_job_ids())
+            job_ids = [
+                job_id for (job_id,) in Job.query.filter(Job.status == 'pending').with_entities(Job.id).order_by(Job.id)
+                if job_id not in active
+            ]
+
+        for job_id in job_ids:
+            logger.info(f"[스케줄러] 미완료 작업 재개: #{job_id}")
+            self._submit(job_id)
+        return job_ids
+
+    def _submit_pending_jobs(self):
+        """다른 프로세스에서 등록한 대기 작업을 리더가 가져와 실행"""
+        from backend.models import Job
+
+        active = set(self.get_active_job_ids())
+        pending_ids = [job_id for (job_id,) in Job.query.filter(Job.status == 'pending').with_entities(Job.id).order_by(Job.id)]
+        for job_id in pending_ids:
+            if job_id not in active:
+                self._submit(job_id)
+
+    # ------------------------------------------------------------------
+    # 작업 핸들러
+    # ------------------------------------------------------------------
+
+    def _run_news_crawl(self, job):
+        from backend.app import db
+        from backend.services.news_crawler import NewsCrawler
+
+        params = job.get_params()
+        # 건너뛴 아티스트는 작업을 재개할 때 다시 시도
+        items = job.get_result().get('items', {})
+        done_artist_ids = [int(key) for key, item in items.items() if item.get('status') != 'skipped']
+        skipped_before = len(items) - len(done_artist_ids)
+
+        def on_start(total):
+            # 다시 시도할 이전 건너뜀 항목은 완료 수(progress_done)에 이미 포함돼 있음
+            job.progress_total = len(done_artist_ids) + max(total, skipped_before)
+            db.session.commit()
+
+        def on_artist_done(artist_id, artist_name, saved_count, status):
+            job.record_item_result(artist_id, {'artist_name': artist_name, 'saved_count': saved_count, 'status': status})
+            db.session.commit()
+
+        crawler = NewsCrawler()
+        crawler.crawl_news_for_all_artists(
+            max_workers=params.get('max_workers'),
+            incremental=params.get('incremental', True),
+            exclude_artist_ids=done_artist_ids,
+            on_start=on_start,
+            on_artist_done=on_artist_done
+        )
+        items = job.get_result().get('items', {})
+        job.set_result_value('total_news', sum(item['saved_count'] for item in items.values()))
+        job.set_result_value('skipped_artists', sorted(
+            item['artist_name'] for item in items.values() if item.get('status') == 'skipped'
+        ))
+        job.set_result_value('failed_artists', sorted(
+            item['artist_name'] for item in items.values() if item.get('status') == 'failed'
+        ))
+
+    def _run_instagram_refresh(self, job):
+        from backend.app import db
+        from backend.models import InstagramUser
+        from backend.config.instagram_config import InstagramAPIConfig
+        from backend.routes.instagram import InstagramAPIClient
+        from backend.services.instagram_service import InstagramService
+
+        params = job.get_params()
+        query = InstagramUser.query
+        if params.get('usernames'):
+            query = query.filter(InstagramUser.username.in_(params['usernames']))
+        usernames = [username for (username,) in query.with_entities(InstagramUser.username).order_by(InstagramUser.id)]
+
+        done = job.get_done_item_keys()
+        job.progress_total = len(usernames)
+        db.session.commit()
+
+        client = InstagramAPIClient(InstagramAPIConfig())
+        service = InstagramService(db.session)
+
+        for username in usernames:
+            if username in done:
+                continue
+            item_result = {'updated': False}
+            try:
+                api_response = client.search_instagram_user(username)
+                for result in (api_response or {}).get('result', []):
+                    if 'user' in result:
+                        user = service.get_instagram_user(username)
+                        updated_user = service._update_instagram_user(user, result['user'])
+                        item_result = {'updated': True, 'follower_count': updated_user.follower_count}
+                        break
+            except Exception as e:
+                logger.error(f"Instagram 사용자 {username} 갱신 중 오류: {str(e)}")
+                db.session.rollback()
+                item_result = {'updated': False, 'error': str(e)}
+
+            job.record_item_result(username, item_result)
+            db.session.commit()
+
+    def _run_channel_sync(self, job):
+        from backend.app import db
+        from backend.services.channel_sync import ChannelSyncEngine
+
+        params = job.get_params()
+        done_channel_ids = {int(key) for key in job.get_done_item_keys()}
+
+        engine = ChannelSyncEngine(max_workers=params.get('max_workers'))
+        channels = engine.select_channels(
+            channel_ids=params.get('channel_ids'),
+            platform=params.get('platform'),
+            force=params.get('force', False)
+        )
+        channels = [channel for channel in channels if channel.id not in done_channel_ids]
+        job.progress_total = len(done_channel_ids) + len(channels)
+        db.session.commit()
+
+        def on_channel_done(channel_id, item_result):
+            job.record_item_result(channel_id, item_result)
+            db.session.commit()
+
+        summary = engine.sync_channels(channels, on_channel_done=on_channel_done)
+        job.set_result_value('request_budget', summary['request_budget'])
+
+    def _run_report(self, job):
+        from backend.services.report_service import generate_report, REPORT_OUTPUT_DIR
+
+        params = job.get_params()
+        artist_ids = params.get('artist_ids', [])
+        report_format = params.get('report_format', 'pdf')
+        job.progress_total = 1
+
+        # 보고서 템플릿이 url_for(_external=True)를 사용하므로 요청 컨텍스트를 만들어 실행
+        base_url = os.getenv('REPORT_BASE_URL', 'http://localhost:5002')
+        with self.app.test_request_context(base_url=base_url):
+            content, filename, mimetype = generate_report(artist_ids, report_format)
+
+        os.makedirs(REPORT_OUTPUT_DIR, exist_ok=True)
+        output_name = f"job_{job.id}_{filename}"
+        output_path = os.path.join(REPORT_OUTPUT_DIR, output_name)
+        with open(output_path, 'wb') as f:
+            f.write(content)
+
+        job.record_item_result('report', {
+            'file_name': output_name, 'download_name': filename, 'mimetype': mimetype, 'size_bytes': len(content)
+        })
+
+    # ------------------------------------------------------------------
+    # 스케줄 루프
+    # ------------------------------------------------------------------
 
     def crawl_news_job(self):
         if not self.app:
             logger.error("Flask app is not initialized in NewsScheduler.")
-            return
+            return None
 
+        logger.info("[스케줄러] 뉴스 크롤링 작업 등록...")
+        return self.enqueue_job('news_crawl', {'incremental': True}, trigger='schedule')
+
+    def instagram_refresh_job(self):
+        if not self.app:
+            logger.error("Flask app is not initialized in NewsScheduler.")
+            return None
+
+        logger.info("[스케줄러] Instagram 정보 갱신 작업 등록...")
+        return self.enqueue_job('instagram_refresh', {}, trigger='schedule')
+
+    def channel_sync_job(self):
+        if not self.app:
+            logger.error("Flask app is not initialized in NewsScheduler.")
+            return None
+
+        logger.info("[스케줄러] 채널 통계 동기화 작업 등록...")
+        return self.enqueue_job('channel_sync', {}, trigger='schedule')
+
+    def _register_schedule(self):
+        schedule.clear('background-jobs')
+        schedule.every().day.at(NEWS_CRAWL_SCHEDULE_TIME).do(self.crawl_news_job).tag('background-jobs')
+        schedule.every().day.at(INSTAGRAM_REFRESH_SCHEDULE_TIME).do(self.instagram_refresh_job).tag('background-jobs')
+        schedule.every().day.at(CHANNEL_SYNC_SCHEDULE_TIME).do(self.channel_sync_job).tag('background-jobs')
+
+    def _on_became_leader(self):
+        # 다음 실행 시각을 지금 기준으로 다시 계산: 이전 리더가 이미 실행한 지난 예약을 다시 돌지 않음
+        self._register_schedule()
+        self.resume_unfinished_jobs()
+
+    def _on_lost_leadership(self):
+        schedule.clear('background-jobs')
+
+    def _tick(self):
+        """리더 확인(heartbeat) 후 리더일 때만 예약 작업과 대기 작업 실행"""
         with self.app.app_context():
-            logger.info("[스케줄러] 뉴스 크롤링 시작...")
-            # 실제 뉴스 크롤링 함수 호출
-            # e.g., fetch_news_for_all_artists()
-            logger.info("[스케줄러] 뉴스 크롤링 완료.")
+            was_leader = self.is_leader
+            is_leader = self.elector.try_acquire()
+
+            if is_leader and not was_leader:
+                self._on_became_leader()
+            elif was_leader and not is_leader:
+                self._on_lost_leadership()
+
+            if is_leader:
+                schedule.run_pending()
+                # 리더가 된 뒤에 죽은 프로세스의 작업도 lease가 만료되면 회수
+                self._reclaim_expired_jobs()
+                self._submit_pending_jobs()
 
     def start_scheduler(self):
         if self.is_running:
             logger.warning("스케줄러가 이미 실행 중입니다.")
             return
-
-        schedule.every().day.at("05:00").do(self.crawl_news_job)
+        if not self.app:
+            raise RuntimeError("Flask app is not initialized in NewsScheduler.")
 
         self.is_running = True
+        self._stop_event.clear()
 
         def run_scheduler():
-            logger.info("뉴스 크롤링 스케줄러 실행 시작 (백그라운드)")
-            while self.is_running:
-                schedule.run_pending()
-                time.sleep(60)
+            logger.info(f"뉴스 크롤링 스케줄러 실행 시작 (백그라운드, {self.identity})")
+            while not self._stop_event.is_set():
+                try:
+                    self._tick()
+                except Exception as e:
+                    logger.error(f"스케줄러 루프 오류: {str(e)}", exc_info=True)
+                self._stop_event.wait(SCHEDULER_POLL_SECONDS)
 
         self.scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
         self.scheduler_thread.start()
 
     def stop_scheduler(self):
         self.is_running = False
+        self._stop_event.set()
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
+        schedule.clear('background-jobs')
+        if self.elector and self.elector.is_leader:
+            with self.app.app_context():
+                self.elector.release()
         logger.info("스케줄러가 중지되었습니다.")
 
-    def run_manual_crawl(self):
-        logger.info("수동 뉴스 크롤링 실행...")
-        self.crawl_news_job()
+    def get_leader_info(self):
+        if not self.elector:
+            return None
+        return self.elector.get_leader_info()
+
+    def run_manual_crawl(self, params=None):
+        logger.info("수동 뉴스 크롤링 작업 등록...")
+        return self.enqueue_job('news_crawl', params or {}, trigger='manual')
 
     def get_next_run_time(self):
         """다음 스케줄된 실행 시간을 반환합니다."""
@@ -62,5 +485,9 @@ class NewsScheduler:
             return schedule.next_run().strftime("%Y-%m-%d %H:%M:%S")
         return "N/A"
 
+    def get_active_job_ids(self):
+        with self._lock:
+            return sorted(self._active_job_ids)
+
 # 전역 인스턴스
-news_scheduler = NewsScheduler()
\ No newline at end of file
+news_scheduler = NewsScheduler()
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Callable, Dict, Optional
+
+# search_news.py가 backend/에서 실행될 때(services.serpapi_cache)도 import되도록 상대 경로 사용
+from .sqlite_cache import SharedCache, SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.getenv(
+    'SERPAPI_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cache', 'serpapi_cache.sqlite3')
+)
+DEFAULT_CACHE_TTL = int(os.getenv('SERPAPI_CACHE_TTL', '1800'))  # 초
+DEFAULT_CACHE_MAX_ENTRIES = int(os.getenv('SERPAPI_CACHE_MAX_ENTRIES', '2000'))
+
+# 캐시 키 계산에서 제외할 파라미터 (결과에 영향 없음)
+IGNORED_PARAMS = {'api_key', 'no_cache', 'async', 'output'}
+
+
+class SerpAPICache(SQLiteCache):
+    """SerpAPI 응답 로컬 캐시 (SQLite)
+
+    정규화된 요청 파라미터를 키로 응답 JSON을 저장한다. TTL이 지난 항목은 미스로
+    처리하고, 항목 수가 max_entries를 넘으면 마지막 접근 시각이 오래된 순(LRU)으로
+    삭제한다. 히트/미스 횟수는 프로세스 간에 공유되도록 같은 DB에 기록한다.
+    """
+
+    entries_table = 'responses'
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: int = DEFAULT_CACHE_TTL,
+                 max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        super().__init__(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def _create_schema(self, conn):
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            ' cache_key TEXT PRIMARY KEY,'
+            ' params TEXT NOT NULL,'
+            ' response TEXT NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' last_access_at REAL NOT NULL)'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access_at)')
+
+    @staticmethod
+    def make_key(params: Dict) -> str:
+        """요청 파라미터 정규화 후 해시 (api_key 등 결과와 무관한 값 제외)"""
+        normalized = {
+            str(key): str(value).strip().lower() if key == 'q' else str(value)
+            for key, value in params.items()
+            if key not in IGNORED_PARAMS and value is not None
+        }
+        payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def get(self, params: Dict) -> Optional[Dict]:
+        key = self.make_key(params)
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                'SELECT response, created_at FROM responses WHERE cache_key = ?', (key,)
+            ).fetchone()
+            if row and now - row[1] <= self.ttl:
+                conn.execute('UPDATE responses SET last_access_at = ? WHERE cache_key = ?', (now, key))
+                self._increment(conn, 'hits')
+                return json.loads(row[0])
+
+            if row:
+                conn.execute('DELETE FROM responses WHERE cache_key = ?', (key,))
+            self._increment(conn, 'misses')
+            return None
+
+    def set(self, params: Dict, response: Dict):
+        key = self.make_key(params)
+        now = time.time()
+        safe_params = {k: v for k, v in params.items() if k not in IGNORED_PARAMS}
+        with self._transaction() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO responses (cache_key, params, response, created_at, last_access_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, json.dumps(safe_params, ensure_ascii=False), json.dumps(response, ensure_ascii=False), now, now)
+            )
+            # 크기 제한 초과분은 LRU 순으로 삭제
+            conn.execute(
+                'DELETE FROM responses WHERE cache_key IN ('
+                ' SELECT cache_key FROM responses ORDER BY last_access_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+
+    def get_or_fetch(self, params: Dict, fetch: Callable[[], Dict]) -> Dict:
+        """캐시에 있으면 반환, 없으면 fetch() 결과를 저장 후 반환 (오류 응답은 저장하지 않음)"""
+        try:
+            cached = self.get(params)
+        except sqlite3.Error as e:
+            logger.warning(f"SerpAPI 캐시 조회 실패, 캐시 없이 진행합니다: {e}")
+            return fetch()
+
+        if cached is not None:
+            logger.debug(f"SerpAPI cache hit: q={params.get('q')}")
+            return cached
+
+        response = fetch()
+        if isinstance(response, dict) and 'error' not in response:
+            try:
+                self.set(params, response)
+            except sqlite3.Error as e:
+                logger.warning(f"SerpAPI 캐시 저장 실패: {e}")
+        return response
+
+    def _extra_stats(self, conn, counters):
+        return {'max_entries': self.max_entries, 'ttl_seconds': self.ttl}
+
+
+_default_cache = SharedCache(SerpAPICache, DEFAULT_CACHE_PATH)
+
+
+def get_serpapi_cache() -> SerpAPICache:
+    """프로세스 공용 캐시 인스턴스 반환 (캐시 디렉터리가 없으면 생성)"""
+    return _default_cache.get()
@@ -0,0 +1,98 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Generic, TypeVar
+
+
+class SQLiteCache:
+    """SQLite 파일 기반 로컬 캐시 공통 부분
+
+    연결(WAL, 스키마는 처음 연결할 때 한 번 생성), 프로세스 간에 공유되는 히트/미스 등
+    카운터, stats()/clear()를 제공한다. 하위 클래스는 entries_table과 _create_schema(),
+    필요하면 _extra_stats()를 정의한다.
+    """
+
+    # 캐시 항목 테이블 (clear()와 stats()의 entries 계산에 사용)
+    entries_table = None
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        raise NotImplementedError
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._create_schema(conn)
+            conn.execute('CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """잠금을 잡고 연결을 열어 블록이 정상 종료되면 커밋 (연결은 항상 닫음)"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                yield conn
+                conn.commit()
+            finally:
+                conn.close()
+
+    @staticmethod
+    def _increment(conn: sqlite3.Connection, name: str, amount: int = 1):
+        if amount:
+            conn.execute(
+                'INSERT INTO counters (name, value) VALUES (?, ?) '
+                'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value',
+                (name, amount)
+            )
+
+    def _extra_stats(self, conn: sqlite3.Connection, counters: Dict[str, int]) -> Dict:
+        """stats()에 덧붙일 캐시별 값 (크기 제한, TTL 등)"""
+        return {}
+
+    def stats(self) -> Dict:
+        with self._transaction() as conn:
+            counters = dict(conn.execute('SELECT name, value FROM counters').fetchall())
+            entries = conn.execute(f'SELECT COUNT(*) FROM {self.entries_table}').fetchone()[0]
+            extra = self._extra_stats(conn, counters)
+        hits = counters.get('hits', 0)
+        misses = counters.get('misses', 0)
+        return dict({
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            'entries': entries
+        }, **extra)
+
+    def clear(self):
+        with self._transaction() as conn:
+            conn.execute(f'DELETE FROM {self.entries_table}')
+            conn.execute('DELETE FROM counters')
+
+
+CacheType = TypeVar('CacheType', bound=SQLiteCache)
+
+
+class SharedCache(Generic[CacheType]):
+    """프로세스 공용 캐시 인스턴스 (처음 get() 할 때 캐시 디렉터리를 만들고 생성)"""
+
+    def __init__(self, factory: Callable[[], CacheType], path: str):
+        self.factory = factory
+        self.path = path
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def get(self) -> CacheType:
+        with self._lock:
+            if self._instance is None:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._instance = self.factory()
+            return self._instance
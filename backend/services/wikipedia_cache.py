@@ -0,0 +1,135 @@
+import json
+import logging
+import os
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from backend.services.sqlite_cache import SharedCache, SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.getenv(
+    'WIKIPEDIA_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cache', 'wikipedia_cache.sqlite3')
+)
+# 마지막 확인 후 이 시간이 지난 문서만 lastrevid를 다시 조회 (그 전에는 네트워크 요청 없이 사용)
+DEFAULT_REVALIDATE_SECONDS = int(float(os.getenv('WIKIPEDIA_CACHE_REVALIDATE_HOURS', '24')) * 3600)
+DEFAULT_CACHE_MAX_ENTRIES = int(os.getenv('WIKIPEDIA_CACHE_MAX_ENTRIES', '20000'))
+
+PageKey = Tuple[str, str]
+
+
+class WikipediaCache(SQLiteCache):
+    """위키백과 문서(요약, 분류, 링크, 본문, 위키텍스트) 로컬 캐시 (SQLite)
+
+    (언어, 제목)을 키로 문서 필드와 lastrevid를 저장한다. 필드는 처음 사용할 때 채워지며,
+    lastrevid가 바뀐 것이 확인되면 필드를 비우고 다시 받는다. 항목 수가 max_entries를
+    넘으면 마지막 접근 시각이 오래된 순(LRU)으로 삭제한다.
+    """
+
+    entries_table = 'pages'
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, revalidate_seconds: int = DEFAULT_REVALIDATE_SECONDS,
+                 max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        super().__init__(path)
+        self.revalidate_seconds = revalidate_seconds
+        self.max_entries = max_entries
+
+    def _create_schema(self, conn):
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS pages ('
+            ' lang TEXT NOT NULL,'
+            ' title TEXT NOT NULL,'
+            ' lastrevid INTEGER,'
+            ' fields TEXT NOT NULL,'
+            ' fetched_at REAL NOT NULL,'
+            ' checked_at REAL NOT NULL,'
+            ' last_access_at REAL NOT NULL,'
+            ' PRIMARY KEY (lang, title))'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_pages_last_access ON pages (last_access_at)')
+
+    def get_many(self, lang: str, titles: Iterable[str]) -> Dict[str, dict]:
+        """캐시에 있는 문서만 {title: {'lastrevid', 'fields', 'checked_at'}}로 반환"""
+        titles = list(dict.fromkeys(titles))
+        if not titles:
+            return {}
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"SELECT title, lastrevid, fields, checked_at FROM pages "
+                f"WHERE lang = ? AND title IN ({','.join('?' * len(titles))})",
+                [lang] + titles
+            ).fetchall()
+            if rows:
+                conn.execute(
+                    f"UPDATE pages SET last_access_at = ? WHERE lang = ? AND title IN ({','.join('?' * len(rows))})",
+                    [now, lang] + [row[0] for row in rows]
+                )
+            self._increment(conn, 'hits', len(rows))
+            self._increment(conn, 'misses', len(titles) - len(rows))
+        return {
+            title: {'lastrevid': lastrevid, 'fields': json.loads(fields), 'checked_at': checked_at}
+            for title, lastrevid, fields, checked_at in rows
+        }
+
+    def is_stale(self, entry: dict, now: Optional[float] = None) -> bool:
+        return (now or time.time()) - entry['checked_at'] > self.revalidate_seconds
+
+    def set_page(self, lang: str, title: str, lastrevid: Optional[int], fields: Optional[dict] = None):
+        """문서 저장 (필드를 주지 않으면 비운 상태로 저장해 다음 사용 때 다시 받음)"""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO pages (lang, title, lastrevid, fields, fetched_at, checked_at, last_access_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (lang, title, lastrevid, json.dumps(fields or {}, ensure_ascii=False), now, now, now)
+            )
+            # 크기 제한 초과분은 LRU 순으로 삭제
+            conn.execute(
+                'DELETE FROM pages WHERE rowid IN ('
+                ' SELECT rowid FROM pages ORDER BY last_access_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+
+    def update_fields(self, lang: str, title: str, fields: dict):
+        """기존 문서에 새로 받은 필드 추가 (lastrevid는 그대로)"""
+        with self._transaction() as conn:
+            row = conn.execute('SELECT fields FROM pages WHERE lang = ? AND title = ?', (lang, title)).fetchone()
+            if row is None:
+                return
+            merged = json.loads(row[0])
+            merged.update(fields)
+            conn.execute(
+                'UPDATE pages SET fields = ? WHERE lang = ? AND title = ?',
+                (json.dumps(merged, ensure_ascii=False), lang, title)
+            )
+
+    def mark_checked(self, lang: str, titles: Iterable[str], changed: int = 0):
+        """lastrevid가 같음을 확인한 문서의 확인 시각 갱신"""
+        titles = list(titles)
+        now = time.time()
+        with self._transaction() as conn:
+            if titles:
+                conn.execute(
+                    f"UPDATE pages SET checked_at = ? WHERE lang = ? AND title IN ({','.join('?' * len(titles))})",
+                    [now, lang] + titles
+                )
+            self._increment(conn, 'revalidated', len(titles))
+            self._increment(conn, 'changed', changed)
+
+    def _extra_stats(self, conn, counters):
+        return {
+            'revalidated': counters.get('revalidated', 0),
+            'changed': counters.get('changed', 0),
+            'max_entries': self.max_entries,
+            'revalidate_seconds': self.revalidate_seconds
+        }
+
+
+_default_cache = SharedCache(WikipediaCache, DEFAULT_CACHE_PATH)
+
+
+def get_wikipedia_cache() -> WikipediaCache:
+    """프로세스 공용 캐시 인스턴스 반환 (캐시 디렉터리가 없으면 생성)"""
+    return _default_cache.get()
@@ -0,0 +1,157 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+
+from backend.services.sqlite_cache import SharedCache, SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.getenv(
+    'WORDCLOUD_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cache', 'wordcloud_cache.sqlite3')
+)
+# 캐시 전체 크기 상한 (PNG 바이트 합계). 넘으면 오래 사용하지 않은 순(LRU)으로 삭제
+DEFAULT_CACHE_MAX_BYTES = int(os.getenv('WORDCLOUD_CACHE_MAX_MB', '256')) * 1024 * 1024
+# 렌더링/키워드 추출 방식이 바뀌면 올려서 기존 캐시를 무효화
+WORDCLOUD_CACHE_VERSION = 2
+
+RenderResult = Tuple[Optional[bytes], List[str]]
+
+
+def get_news_fingerprints(artist_ids: Iterable[int]) -> Dict[int, str]:
+    """아티스트별 뉴스 집합 식별값 'count:max_id' (뉴스가 없으면 키 없음)
+
+    뉴스가 추가되면 max_id가, 삭제되면 count가 바뀌므로 캐시 키로 사용한다.
+    """
+    from backend.app import db
+    from backend.models import News
+
+    artist_ids = list(artist_ids)
+    if not artist_ids:
+        return {}
+    rows = db.session.query(News.artist_id, func.count(News.id), func.max(News.id)).filter(
+        News.artist_id.in_(artist_ids)
+    ).group_by(News.artist_id).all()
+    return {artist_id: f"{count}:{max_id}" for artist_id, count, max_id in rows}
+
+
+class WordCloudCache(SQLiteCache):
+    """아티스트 워드클라우드 PNG/상위 키워드 디스크 캐시 (SQLite)
+
+    (artist_id, 뉴스 집합 식별값, num_words, 배율, 캐시 버전)을 키로 저장한다. 새 뉴스가
+    들어오면 키가 달라져 다시 렌더링하고, 같은 아티스트의 이전 뉴스 집합 항목은 그때 삭제한다.
+    PNG 크기 합계가 max_bytes를 넘으면 마지막 접근 시각이 오래된 순으로 삭제한다.
+    """
+
+    entries_table = 'wordclouds'
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        super().__init__(path)
+        self.max_bytes = max_bytes
+
+    def _create_schema(self, conn):
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS wordclouds ('
+            ' cache_key TEXT PRIMARY KEY,'
+            ' artist_id INTEGER NOT NULL,'
+            ' png BLOB,'
+            ' keywords TEXT NOT NULL,'
+            ' size_bytes INTEGER NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' last_access_at REAL NOT NULL)'
+        )
+        columns = {row[1] for row in conn.execute('PRAGMA table_info(wordclouds)')}
+        if 'fingerprint' not in columns:
+            # 같은 뉴스 집합의 미리보기/전체 배율 항목을 구분하기 위해 추가된 컬럼
+            conn.execute('ALTER TABLE wordclouds ADD COLUMN fingerprint TEXT')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_wordclouds_artist ON wordclouds (artist_id)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_wordclouds_last_access ON wordclouds (last_access_at)')
+
+    @staticmethod
+    def make_key(artist_id: int, fingerprint: str, num_words: int, scale: float) -> str:
+        payload = f"{WORDCLOUD_CACHE_VERSION}:{artist_id}:{fingerprint}:{num_words}:{scale:g}"
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def get_many(self, keys: Dict[int, str]) -> Dict[int, RenderResult]:
+        """{artist_id: cache_key} 중 캐시에 있는 항목만 {artist_id: (png, keywords)}로 반환"""
+        if not keys:
+            return {}
+        now = time.time()
+        by_key = {key: artist_id for artist_id, key in keys.items()}
+        with self._transaction() as conn:
+            placeholders = ','.join('?' * len(by_key))
+            rows = conn.execute(
+                f'SELECT cache_key, png, keywords FROM wordclouds WHERE cache_key IN ({placeholders})',
+                list(by_key.keys())
+            ).fetchall()
+            if rows:
+                conn.execute(
+                    f"UPDATE wordclouds SET last_access_at = ? WHERE cache_key IN ({','.join('?' * len(rows))})",
+                    [now] + [row[0] for row in rows]
+                )
+            self._increment(conn, 'hits', len(rows))
+            self._increment(conn, 'misses', len(by_key) - len(rows))
+        return {by_key[key]: (png, json.loads(keywords)) for key, png, keywords in rows}
+
+    def set(self, artist_id: int, key: str, png: Optional[bytes], keywords: List[str], fingerprint: str):
+        now = time.time()
+        size = len(png) if png else 0
+        with self._transaction() as conn:
+            # 뉴스 집합이 바뀌어 더 이상 쓰이지 않을 이전 항목 정리
+            conn.execute(
+                'DELETE FROM wordclouds WHERE artist_id = ? AND (fingerprint IS NULL OR fingerprint != ?)',
+                (artist_id, fingerprint)
+            )
+            conn.execute(
+                'INSERT OR REPLACE INTO wordclouds '
+                '(cache_key, artist_id, fingerprint, png, keywords, size_bytes, created_at, last_access_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, artist_id, fingerprint, png, json.dumps(keywords, ensure_ascii=False), size, now, now)
+            )
+            # 최근 사용 순으로 누적한 크기가 상한을 넘는 항목 삭제
+            conn.execute(
+                'DELETE FROM wordclouds WHERE cache_key IN ('
+                ' SELECT cache_key FROM ('
+                '  SELECT cache_key, SUM(size_bytes) OVER (ORDER BY last_access_at DESC, cache_key) AS running_bytes'
+                '  FROM wordclouds)'
+                ' WHERE running_bytes > ?)',
+                (self.max_bytes,)
+            )
+
+    def get_or_render(self, artist_id: int, fingerprint: str, num_words: int,
+                      render: Callable[[], RenderResult], scale: float) -> RenderResult:
+        """캐시에 있으면 반환, 없으면 render() 결과를 저장 후 반환"""
+        key = self.make_key(artist_id, fingerprint, num_words, scale)
+        try:
+            cached = self.get_many({artist_id: key}).get(artist_id)
+        except sqlite3.Error as e:
+            logger.warning(f"워드클라우드 캐시 조회 실패, 캐시 없이 진행합니다: {e}")
+            return render()
+
+        if cached is not None:
+            return cached
+
+        png, keywords = render()
+        try:
+            self.set(artist_id, key, png, keywords, fingerprint)
+        except sqlite3.Error as e:
+            logger.warning(f"워드클라우드 캐시 저장 실패: {e}")
+        return png, keywords
+
+    def _extra_stats(self, conn, counters):
+        total_bytes = conn.execute('SELECT COALESCE(SUM(size_bytes), 0) FROM wordclouds').fetchone()[0]
+        return {'size_bytes': total_bytes, 'max_bytes': self.max_bytes}
+
+
+_default_cache = SharedCache(WordCloudCache, DEFAULT_CACHE_PATH)
+
+
+def get_wordcloud_cache() -> WordCloudCache:
+    """프로세스 공용 캐시 인스턴스 반환 (캐시 디렉터리가 없으면 생성)"""
+    return _default_cache.get()
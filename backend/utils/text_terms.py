@@ -0,0 +1,241 @@
+"""Keyword tokenization shared by word clouds, the per-artist term index and reports.
+
+The active tokenizer is chosen with the TEXT_TOKENIZER environment variable:
+
+- ``korean_noun`` (default): pure-Python Korean noun extractor. It strips particles
+  (조사) and common predicate endings from each word, drops stopwords and
+  lowercases Latin words.
+- ``whitespace``: the original behaviour (split on whitespace, drop 1-char words).
+- ``okt``: konlpy's Okt noun extractor, if konlpy and a JVM are available.
+
+Other tokenizers can be added with ``register_tokenizer()``.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Anything that is not Korean, alphanumeric or whitespace is dropped before splitting
+_NON_WORD_PATTERN = re.compile(r'[^가-힣a-zA-Z0-9\s]')
+# Splits a word into Hangul / Latin / digit runs ("BTS와" -> "BTS", "와")
+_RUN_PATTERN = re.compile(r'[가-힣]+|[a-zA-Z]+|[0-9]+')
+# Terms are stored in VARCHAR(100) columns of the term index
+MAX_TERM_LENGTH = 100
+DOCUMENT_CACHE_SIZE = int(os.getenv('TEXT_TOKENIZER_CACHE_SIZE', '20000'))
+
+# Predicate endings: a word ending in one of these is a verb/adjective form. If what
+# remains is a noun stem (발표했다 -> 발표) the stem is kept, otherwise the word is dropped.
+PREDICATE_ENDINGS = (
+    '했습니다', '합니다', '했다고', '한다고', '됐다고', '된다고', '이라고', '라고',
+    '했으며', '하면서', '했지만', '하지만', '했는데', '하는데', '하겠다', '했다', '한다', '하는',
+    '하며', '하고', '하게', '해서', '했던', '하던', '할', '해', '됐다', '된다', '되는', '되며',
+    '되고', '됐던', '받았다', '받는', '시켰다', '시키는', '이었다', '였다', '이다', '입니다',
+)
+# Particles (조사), longest first so '에서는' wins over '는'
+PARTICLES = tuple(sorted((
+    '이', '가', '은', '는', '을', '를', '의', '에', '에서', '에게', '께서', '한테', '으로', '로',
+    '와', '과', '도', '만', '까지', '부터', '처럼', '보다', '마다', '이나', '나', '이랑', '랑',
+    '으로서', '로서', '으로써', '로써', '에서는', '에서도', '에게는', '으로는', '로는', '에는',
+    '과의', '와의', '에서의', '으로의', '로의', '이라는', '라는', '이란', '란', '이며', '며',
+    '이자', '께', '들', '들이', '들은', '들을', '들의', '들과', '들도', '들에게',
+), key=len, reverse=True))
+# Words that only ever appear as function words or news boilerplate
+KOREAN_STOPWORDS = frozenset((
+    '기자', '뉴스', '사진', '제공', '무단', '전재', '배포', '금지', '저작권', '오늘', '어제', '내일',
+    '이번', '지난', '최근', '현재', '당시', '통해', '대한', '대해', '위해', '위한', '관련', '가운데',
+    '그리고', '하지만', '그러나', '또한', '또는', '및', '등', '것', '수', '때', '중', '더', '한편',
+    '이날', '이어', '특히', '모든', '각각', '여러', '우리', '자신', '이후', '이전', '이상', '이하',
+    '정도', '경우', '때문', '따라', '바로', '다시', '함께', '있다', '없다', '있는', '없는', '했다',
+    '한다', '된다', '됐다', '이다', '이라고', '밝혔다', '전했다', '말했다', '설명했다', '덧붙였다',
+    '그는', '그녀는', '그녀', '이들', '해당', '오전', '오후', '올해', '지난해', '내년', '기사',
+))
+ENGLISH_STOPWORDS = frozenset((
+    'the', 'and', 'for', 'with', 'that', 'this', 'from', 'are', 'was', 'were', 'has', 'have',
+    'had', 'its', 'his', 'her', 'their', 'they', 'you', 'your', 'our', 'but', 'not', 'all',
+    'can', 'will', 'into', 'about', 'than', 'then', 'also', 'just', 'more', 'most', 'one',
+    'new', 'news', 'said', 'says', 'who', 'what', 'when', 'where', 'how', 'been', 'being',
+    'www', 'com', 'http', 'https',
+))
+
+
+class Tokenizer:
+    """Turns a document into keyword terms. Subclasses implement ``_tokenize``."""
+
+    name = None
+
+    def __init__(self, cache_size: int = DOCUMENT_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _tokenize(self, text: str) -> List[str]:
+        raise NotImplementedError
+
+    def tokenize(self, text: Optional[str]) -> List[str]:
+        """Terms of one document. Results are cached per document (LRU, keyed by content hash)."""
+        if not text:
+            return []
+        if not self.cache_size:
+            return self._tokenize(text)
+
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return list(cached)
+
+        terms = self._tokenize(text)
+        with self._lock:
+            self._cache[key] = tuple(terms)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return terms
+
+    def tokenize_many(self, texts: Iterable[Optional[str]]) -> List[List[str]]:
+        """Terms of many documents (duplicates within the batch are tokenized once)."""
+        seen: Dict[str, List[str]] = {}
+        results = []
+        for text in texts:
+            if text not in seen:
+                seen[text] = self.tokenize(text)
+            results.append(seen[text])
+        return results
+
+    def count_many(self, texts: Iterable[Optional[str]]) -> Counter:
+        """Combined term frequencies of many documents."""
+        counts = Counter()
+        for terms in self.tokenize_many(texts):
+            counts.update(terms)
+        return counts
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+
+class WhitespaceTokenizer(Tokenizer):
+    """Original word cloud tokenization: split on whitespace, drop one-character words."""
+
+    name = 'whitespace'
+
+    def _tokenize(self, text: str) -> List[str]:
+        # Simple cleaning: remove special chars, keep Korean and Alphanumeric
+        cleaned_text = _NON_WORD_PATTERN.sub('', text)
+        # Filter out very short words (likely particles in Korean or noise)
+        return [w[:MAX_TERM_LENGTH] for w in cleaned_text.split() if len(w) > 1]
+
+
+@lru_cache(maxsize=200_000)
+def _korean_noun(word: str) -> Optional[str]:
+    """Noun stem of one Hangul word, or None if it is a predicate/stopword/too short."""
+    for ending in PREDICATE_ENDINGS:
+        if word.endswith(ending):
+            stem = word[:-len(ending)]
+            # "발표했다" -> "발표"; "있다", "했다" leave nothing useful
+            word = stem if len(stem) >= 2 else ''
+            break
+    else:
+        for particle in PARTICLES:
+            # Keep at least two syllables so nouns ending in a particle-like
+            # syllable ("나이", "우리가") are not over-stripped
+            if word.endswith(particle) and len(word) - len(particle) >= 2:
+                word = word[:-len(particle)]
+                break
+
+    if len(word) < 2 or word in KOREAN_STOPWORDS:
+        return None
+    return word[:MAX_TERM_LENGTH]
+
+
+class KoreanNounTokenizer(Tokenizer):
+    """Pure-Python Korean noun extractor using bundled particle/ending and stopword lists.
+
+    Not a full morphological analyzer: it targets news text, where most keywords are
+    nouns followed by a particle ("아이유가", "콘서트를") or a 하다-verb ending
+    ("발표했다"). Latin words are lowercased and filtered with an English stopword list.
+    """
+
+    name = 'korean_noun'
+
+    def _tokenize(self, text: str) -> List[str]:
+        terms = []
+        for run in _RUN_PATTERN.findall(text):
+            first = run[0]
+            if '가' <= first <= '힣':
+                noun = _korean_noun(run)
+                if noun:
+                    terms.append(noun)
+            elif first.isalpha():
+                lowered = run.lower()
+                if len(lowered) > 1 and lowered not in ENGLISH_STOPWORDS:
+                    terms.append(lowered[:MAX_TERM_LENGTH])
+            # Bare numbers (dates, counts) are not useful keywords
+        return terms
+
+
+class OktTokenizer(Tokenizer):
+    """konlpy Okt noun extractor (requires konlpy and a JVM)."""
+
+    name = 'okt'
+
+    def __init__(self, cache_size: int = DOCUMENT_CACHE_SIZE):
+        super().__init__(cache_size)
+        from konlpy.tag import Okt
+        self._okt = Okt()
+        self._okt_lock = threading.Lock()
+
+    def _tokenize(self, text: str) -> List[str]:
+        with self._okt_lock:
+            nouns = self._okt.nouns(_NON_WORD_PATTERN.sub(' ', text))
+        return [n[:MAX_TERM_LENGTH] for n in nouns if len(n) > 1 and n not in KOREAN_STOPWORDS]
+
+
+_tokenizer_factories: Dict[str, Callable[[], Tokenizer]] = {
+    'korean_noun': KoreanNounTokenizer,
+    'whitespace': WhitespaceTokenizer,
+    'okt': OktTokenizer,
+}
+DEFAULT_TOKENIZER = os.getenv('TEXT_TOKENIZER', 'korean_noun')
+
+_tokenizers: Dict[str, Tokenizer] = {}
+_tokenizers_lock = threading.Lock()
+
+
+def register_tokenizer(name: str, factory: Callable[[], Tokenizer]):
+    """Registers a tokenizer that can then be selected with TEXT_TOKENIZER=<name>."""
+    _tokenizer_factories[name] = factory
+    with _tokenizers_lock:
+        _tokenizers.pop(name, None)
+
+
+def get_tokenizer(name: Optional[str] = None) -> Tokenizer:
+    """Shared tokenizer instance. Falls back to korean_noun if the requested one cannot load."""
+    name = name or DEFAULT_TOKENIZER
+    with _tokenizers_lock:
+        tokenizer = _tokenizers.get(name)
+        if tokenizer is None:
+            try:
+                tokenizer = _tokenizer_factories[name]()
+            except Exception as e:
+                logger.error(f"Could not load tokenizer '{name}', using korean_noun instead: {e}")
+                tokenizer = _tokenizers.get('korean_noun') or KoreanNounTokenizer()
+            _tokenizers[name] = tokenizer
+        return tokenizer
+
+
+def extract_terms(text_content: str) -> list:
+    """Keyword terms of a text using the configured tokenizer."""
+    return get_tokenizer().tokenize(text_content)
+
+
+def count_terms(text_content: str) -> Counter:
+    """Term frequencies of a text, shared by word clouds and the per-artist term index."""
+    return Counter(extract_terms(text_content))
@@ -0,0 +1,44 @@
+# backend/utils/url_utils.py
+
+import hashlib
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only carry tracking information and never change the article
+TRACKING_PARAM_PREFIXES = ('utm_',)
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'yclid',
+    'mc_cid', 'mc_eid', 'ref', 'ref_src', 'cmpid', 'ocid', 'spm',
+}
+
+
+def normalize_url(url: Optional[str]) -> str:
+    """Normalizes a URL for deduplication.
+
+    Lowercases the scheme and host, drops default ports, fragments and tracking
+    query parameters, sorts the remaining parameters and strips a trailing slash.
+    """
+    if not url:
+        return ''
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and not ((scheme == 'http' and parts.port == 80) or (scheme == 'https' and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+    path = parts.path.rstrip('/') if parts.path != '/' else ''
+
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+def compute_url_hash(url: Optional[str]) -> Optional[str]:
+    """Returns the SHA-1 hex digest (40 chars) of the normalized URL, or None for empty URLs."""
+    normalized = normalize_url(url)
+    if not normalized:
+        return None
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
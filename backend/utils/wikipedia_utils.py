@@ -25,6 +25,12 @@ import requests
 from datetime import datetime
 import re
 import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from backend.services.wikipedia_cache import get_wikipedia_cache
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +41,64 @@ EXCLUDE_KEYWORDS_KO = ['정치인', '기업인', '감독', '선수', '학자', '
 ENTERTAINMENT_KEYWORDS_EN = ['actor', 'singer', 'model', 'broadcaster', 'idol', 'member', 'group', 'entertainment', 'actor', 'artist', 'musical', 'announcer', 'comedian', 'influencer']
 EXCLUDE_KEYWORDS_EN = ['politician', 'businessman', 'director', 'player', 'scholar', 'professor']
 
-def get_raw_wikitext(title, lang='ko'):
+WIKI_USER_AGENT = 'theProjectCompany-Artist-Management-Framework/1.0 (contact@example.com)'
+WIKI_API_HEADERS = {
+    "User-Agent": "theProjectCompanyArtistManagement/1.0 (contact@example.com)"
+}
+# MediaWiki accepts up to 50 titles per query
+REVISION_BATCH_SIZE = 50
+
+_wikis = {}
+_wikis_lock = threading.Lock()
+
+
+def _get_wiki(lang: str) -> wikipediaapi.Wikipedia:
+    """Shared wikipediaapi client per language."""
+    with _wikis_lock:
+        if lang not in _wikis:
+            _wikis[lang] = wikipediaapi.Wikipedia(
+                language=lang,
+                extract_format=wikipediaapi.ExtractFormat.WIKI,
+                user_agent=WIKI_USER_AGENT
+            )
+        return _wikis[lang]
+
+
+def fetch_page_revisions(titles: Iterable[str], lang: str = 'ko') -> Dict[str, Optional[int]]:
+    """Returns {title: lastrevid} for the requested titles (None if the page does not exist).
+
+    One lightweight prop=info query per 50 titles; redirects and title normalization are
+    followed so the revision is that of the page the title resolves to.
+    """
+    url = f"https://{lang}.wikipedia.org/w/api.php"
+    titles = list(dict.fromkeys(titles))
+    revisions = {}
+    for start in range(0, len(titles), REVISION_BATCH_SIZE):
+        chunk = titles[start:start + REVISION_BATCH_SIZE]
+        params = {
+            "action": "query",
+            "prop": "info",
+            "titles": "|".join(chunk),
+            "redirects": 1,
+            "format": "json",
+            "formatversion": 2
+        }
+        response = requests.get(url, params=params, headers=WIKI_API_HEADERS, timeout=10)
+        response.raise_for_status()
+        query = response.json().get("query", {})
+        normalized = {item["from"]: item["to"] for item in query.get("normalized", [])}
+        redirects = {item["from"]: item["to"] for item in query.get("redirects", [])}
+        pages = {
+            page["title"]: None if page.get("missing") or page.get("invalid") else page.get("lastrevid")
+            for page in query.get("pages", [])
+        }
+        for title in chunk:
+            resolved = normalized.get(title, title)
+            revisions[title] = pages.get(redirects.get(resolved, resolved))
+    return revisions
+
+
+def _fetch_raw_wikitext(title, lang='ko'):
     """Fetches raw wikitext using MediaWiki API."""
     url = f"https://{lang}.wikipedia.org/w/api.php"
     params = {
@@ -45,11 +108,8 @@ def get_raw_wikitext(title, lang='ko'):
         "format": "json",
         "redirects": 1
     }
-    headers = {
-        "User-Agent": "theProjectCompanyArtistManagement/1.0 (contact@example.com)"
-    }
     try:
-        response = requests.get(url, params=params, headers=headers)
+        response = requests.get(url, params=params, headers=WIKI_API_HEADERS)
         data = response.json()
         if "parse" in data and "wikitext" in data["parse"]:
             return data["parse"]["wikitext"]["*"]
@@ -57,6 +117,135 @@ def get_raw_wikitext(title, lang='ko'):
         logger.error(f"Error fetching wikitext: {e}")
     return None
 
+
+class CachedWikiPage:
+    """Stand-in for a wikipediaapi page backed by the local Wikipedia cache.
+
+    Existence comes from the cached revision id. Summary, text, categories, links and
+    wikitext are fetched through wikipediaapi / the parse API the first time they are
+    read and then stored under (lang, title), so later lookups make no HTTP calls until
+    the page's lastrevid changes.
+    """
+
+    def __init__(self, wiki, title: str, lastrevid: Optional[int], fields: dict, cache):
+        self._wiki = wiki
+        self._title = title
+        self._fields = dict(fields)
+        self._cache = cache
+        self._page = None
+        self.language = wiki.language
+        self.lastrevid = lastrevid
+
+    def exists(self) -> bool:
+        return self.lastrevid is not None
+
+    @property
+    def title(self) -> str:
+        return self._title
+
+    def _wiki_page(self):
+        if self._page is None:
+            self._page = self._wiki.page(self._title)
+        return self._page
+
+    def _field(self, name, fetch):
+        if name not in self._fields:
+            value = fetch()
+            self._fields[name] = value
+            # Failed fetches (None) are not stored so they are retried next time
+            if value is not None:
+                try:
+                    self._cache.update_fields(self.language, self._title, {name: value})
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not store Wikipedia cache field '{name}' for {self._title}: {e}")
+        return self._fields[name]
+
+    @property
+    def fullurl(self) -> str:
+        return self._field('fullurl', lambda: self._wiki_page().fullurl)
+
+    @property
+    def summary(self) -> str:
+        return self._field('summary', lambda: self._wiki_page().summary)
+
+    @property
+    def text(self) -> str:
+        return self._field('text', lambda: self._wiki_page().text)
+
+    @property
+    def categories(self) -> dict:
+        return dict.fromkeys(self._field('categories', lambda: list(self._wiki_page().categories.keys())))
+
+    @property
+    def links(self) -> dict:
+        return dict.fromkeys(self._field('links', lambda: list(self._wiki_page().links.keys())))
+
+    @property
+    def wikitext(self) -> Optional[str]:
+        if not self.exists():
+            return None
+        return self._field('wikitext', lambda: _fetch_raw_wikitext(self._title, self.language))
+
+
+def get_wiki_pages(wiki, titles: Iterable[str], revalidate: bool = False) -> List:
+    """Returns pages for the titles, served from the local cache where possible.
+
+    Cached pages checked within WIKIPEDIA_CACHE_REVALIDATE_HOURS are used without any
+    HTTP call. Older ones (or all of them with revalidate=True) are checked with one
+    batched lastrevid query and only refetched if the revision changed. If the cache or
+    the revision query is unavailable, uncached wikipediaapi pages are returned.
+    """
+    titles = list(titles)
+    lang = wiki.language
+    cache = get_wikipedia_cache()
+    try:
+        entries = cache.get_many(lang, titles)
+    except sqlite3.Error as e:
+        logger.warning(f"Wikipedia cache lookup failed, fetching directly: {e}")
+        return [wiki.page(title) for title in titles]
+
+    now = time.time()
+    to_check = list(dict.fromkeys(
+        title for title in titles if title not in entries or revalidate or cache.is_stale(entries[title], now)
+    ))
+    if to_check:
+        try:
+            revisions = fetch_page_revisions(to_check, lang)
+        except Exception as e:
+            # Serve what we have (even if stale); titles never cached fall back to wikipediaapi
+            logger.warning(f"Could not check Wikipedia revisions ({lang}): {e}")
+        else:
+            unchanged = [title for title in to_check if title in entries and entries[title]['lastrevid'] == revisions[title]]
+            refetch = [title for title in to_check if title not in unchanged]
+            try:
+                cache.mark_checked(lang, unchanged, changed=sum(1 for title in refetch if title in entries))
+                for title in refetch:
+                    cache.set_page(lang, title, revisions[title])
+            except sqlite3.Error as e:
+                logger.warning(f"Could not update Wikipedia cache: {e}")
+            for title in refetch:
+                entries[title] = {'lastrevid': revisions[title], 'fields': {}}
+
+    return [
+        CachedWikiPage(wiki, title, entries[title]['lastrevid'], entries[title]['fields'], cache)
+        if title in entries else wiki.page(title)
+        for title in titles
+    ]
+
+
+def get_wiki_page(wiki, title: str, revalidate: bool = False):
+    return get_wiki_pages(wiki, [title], revalidate)[0]
+
+
+def get_raw_wikitext(title, lang='ko', use_cache=True):
+    """Fetches raw wikitext using MediaWiki API (through the local cache by default)."""
+    if not use_cache:
+        return _fetch_raw_wikitext(title, lang)
+    page = get_wiki_page(_get_wiki(lang), title)
+    if isinstance(page, CachedWikiPage):
+        return page.wikitext
+    return _fetch_raw_wikitext(title, lang)
+
 def _extract_artist_details(page, artist_name, used_wiki_instance) -> dict:
     """
     Extracts artist details using both wikipediaapi (for summary) and raw wikitext (for infobox).
@@ -87,7 +276,7 @@ def _extract_artist_details(page, artist_name, used_wiki_instance) -> dict:
     }
     
     lang = used_wiki_instance.language
-    wikitext = get_raw_wikitext(page.title, lang)
+    wikitext = page.wikitext if isinstance(page, CachedWikiPage) else get_raw_wikitext(page.title, lang, use_cache=False)
 
     # Extract some external links as additional sources if available
     ext_links = re.findall(r'\[(https?://[^\s\]]+)\s+([^\]]+)\]', wikitext or "")
@@ -217,34 +406,30 @@ def _is_disambiguation(page) -> bool:
     ]
     return any(cat in page.categories for cat in disambig_categories)
 
-def get_artist_info_from_wikipedia(artist_name: str) -> dict:
+def get_artist_info_from_wikipedia(artist_name: str, revalidate: bool = False) -> dict:
     """
     Searches Wikipedia for artist information and extracts relevant details.
+
+    Pages are read through the local Wikipedia cache, so repeat searches for the same
+    artist are served from local storage.
     
     Args:
         artist_name: The name of the artist to search for.
+        revalidate: Check every page's lastrevid now instead of after the revalidation interval.
         
     Returns:
         A dictionary containing extracted artist information, or an empty dictionary if not found.
     """
     
-    wiki_wiki_ko = wikipediaapi.Wikipedia(
-        language='ko',
-        extract_format=wikipediaapi.ExtractFormat.WIKI,
-        user_agent='theProjectCompany-Artist-Management-Framework/1.0 (contact@example.com)' # Added user_agent
-    )
+    wiki_wiki_ko = _get_wiki('ko')
 
-    page_py = wiki_wiki_ko.page(artist_name)
+    page_py = get_wiki_page(wiki_wiki_ko, artist_name, revalidate)
     used_wiki_instance = wiki_wiki_ko # Keep track of which Wikipedia instance was used
 
     if not page_py.exists():
         # Try searching in English Wikipedia if not found in Korean
-        wiki_wiki_en = wikipediaapi.Wikipedia(
-            language='en', 
-            extract_format=wikipediaapi.ExtractFormat.WIKI,
-            user_agent='theProjectCompany-Artist-Management-Framework/1.0 (contact@example.com)' # Added user_agent
-        )
-        page_py = wiki_wiki_en.page(artist_name)
+        wiki_wiki_en = _get_wiki('en')
+        page_py = get_wiki_page(wiki_wiki_en, artist_name, revalidate)
         used_wiki_instance = wiki_wiki_en # Update to English instance if found there
         if not page_py.exists():
             return {} # Artist not found in both languages
@@ -254,8 +439,8 @@ def get_artist_info_from_wikipedia(artist_name: str) -> dict:
         logger.info(f"Disambiguation page found for {artist_name}. Analyzing links...")
         
         candidates = []
-        for title in page_py.links.keys():
-            candidate_page = used_wiki_instance.page(title)
+        # Revisions of all linked pages are checked in batched queries
+        for candidate_page in get_wiki_pages(used_wiki_instance, page_py.links.keys(), revalidate):
             if candidate_page.exists() and not _is_disambiguation(candidate_page):
                 summary = candidate_page.summary.lower()
                 text = candidate_page.text.lower()
@@ -1,5 +1,6 @@
 import os
 import base64
+import threading
 from io import BytesIO
 from wordcloud import WordCloud
 import matplotlib
@@ -9,7 +10,8 @@ from matplotlib import cm
 from matplotlib.colors import LinearSegmentedColormap
 from collections import Counter
 import numpy as np
-import re
+
+from backend.utils.text_terms import count_terms
 
 def get_theProjectCompany_colormap():
     """Returns a custom colormap based on theProjectCompany brand colors (Orange and Navy/Slate)."""
@@ -23,67 +25,165 @@ def get_theProjectCompany_colormap():
     ]
     return LinearSegmentedColormap.from_list("theProjectCompany", colors, N=256)
 
-def generate_wordcloud_from_text(text_content: str, num_words: int = 100) -> (str, list):
-    """Generates a word cloud from text string and returns base64 image + keywords."""
+# Full-size layout canvas; PNGs are drawn at WORDCLOUD_IMAGE_SCALE times the canvas size
+WORDCLOUD_WIDTH = 1200
+WORDCLOUD_HEIGHT = 600
+WORDCLOUD_IMAGE_SCALE = 2
+# The PDF renders at full scale. UI previews lay out on a canvas this fraction of the full
+# size (layout is most of the render time) and come out proportionally smaller
+WORDCLOUD_FULL_SCALE = 1.0
+WORDCLOUD_PREVIEW_SCALE = float(os.getenv('WORDCLOUD_PREVIEW_SCALE', '0.5'))
+# Optional mask image (white = no words); the canvas then takes the mask's size
+WORDCLOUD_MASK_PATH = os.getenv('WORDCLOUD_MASK_PATH')
+DEFAULT_FONT_PATH = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', 'fonts', 'NanumGothic-Bold.ttf')
+
+
+class WordCloudRenderer:
+    """Long-lived word cloud renderer.
+
+    Resolves the font, builds the colormap and loads the mask once, and keeps one
+    WordCloud object per scale whose layout is recomputed for every frequency dict.
+    Renders are serialized with a lock because WordCloud keeps its layout on the
+    instance; the report process pool gets one renderer per worker.
+    """
+
+    def __init__(self, width: int = WORDCLOUD_WIDTH, height: int = WORDCLOUD_HEIGHT,
+                 font_path: str = DEFAULT_FONT_PATH, mask_path: str = WORDCLOUD_MASK_PATH):
+        # Fallback to the wordcloud default font if the Korean font is missing
+        self.font_path = font_path if font_path and os.path.exists(font_path) else None
+        self.colormap = get_theProjectCompany_colormap()
+        self.mask = self._load_mask(mask_path)
+        if self.mask is not None:
+            height, width = self.mask.shape
+        self.width = width
+        self.height = height
+        self._wordclouds = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _load_mask(mask_path):
+        if not mask_path:
+            return None
+        from PIL import Image
+        with Image.open(mask_path) as image:
+            return np.array(image.convert('L'))
+
+    def _scaled_mask(self, scale: float):
+        if self.mask is None or scale == WORDCLOUD_FULL_SCALE:
+            return self.mask
+        from PIL import Image
+        size = (max(1, int(self.width * scale)), max(1, int(self.height * scale)))
+        return np.array(Image.fromarray(self.mask).resize(size))
+
+    def _get_wordcloud(self, scale: float) -> WordCloud:
+        wc = self._wordclouds.get(scale)
+        if wc is None:
+            wc = WordCloud(
+                width=max(1, int(self.width * scale)),
+                height=max(1, int(self.height * scale)),
+                background_color='white',
+                font_path=self.font_path,
+                colormap=self.colormap,
+                mask=self._scaled_mask(scale),
+                prefer_horizontal=0.7,
+                relative_scaling=0.5,
+                scale=WORDCLOUD_IMAGE_SCALE
+            )
+            self._wordclouds[scale] = wc
+        return wc
+
+    def render(self, word_freq: dict, num_words: int = 100, scale: float = WORDCLOUD_FULL_SCALE) -> (bytes, list):
+        """Renders a term -> count mapping and returns PNG bytes + top keywords."""
+        word_freq = Counter({term: count for term, count in word_freq.items() if count > 0})
+        if not word_freq:
+            return None, []
+
+        with self._lock:
+            wc = self._get_wordcloud(scale)
+            wc.max_words = num_words
+            # We can use wc.to_image() directly without matplotlib figure overhead for simple image
+            image = wc.generate_from_frequencies(word_freq).to_image()
+        img_buffer = BytesIO()
+        image.save(img_buffer, format='PNG')
+
+        meta_tags = [word for word, count in word_freq.most_common(20)]
+
+        return img_buffer.getvalue(), meta_tags
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def get_wordcloud_renderer() -> WordCloudRenderer:
+    """Returns the per-process renderer, creating it on first use."""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = WordCloudRenderer()
+        return _renderer
+
+
+def render_wordcloud_from_frequencies(word_freq: dict, num_words: int = 100, preview: bool = False) -> (bytes, list):
+    """Renders a word cloud from a term -> count mapping and returns PNG bytes + top keywords."""
+    scale = WORDCLOUD_PREVIEW_SCALE if preview else WORDCLOUD_FULL_SCALE
+    return get_wordcloud_renderer().render(word_freq, num_words, scale)
+
+def render_wordcloud_png(text_content: str, num_words: int = 100, preview: bool = False) -> (bytes, list):
+    """Renders a word cloud from text and returns raw PNG bytes + top keywords."""
     if not text_content or len(text_content.strip()) < 10:
         return None, []
+    return render_wordcloud_from_frequencies(count_terms(text_content), num_words, preview)
 
-    # Simple cleaning: remove special chars, keep Korean and Alphanumeric
-    cleaned_text = re.sub(r'[^가-힣a-zA-Z0-9\s]', '', text_content)
-    
-    # Filter out very short words (likely particles in Korean or noise)
-    words = [w for w in cleaned_text.split() if len(w) > 1]
-    if not words:
-        return None, []
-    
-    word_freq = Counter(words)
-    
-    # Font path for Korean support
-    font_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', 'fonts', 'NanumGothic-Bold.ttf')
-    if not os.path.exists(font_path):
-        # Fallback if specific font is missing
-        font_path = None
-
-    # Generate WordCloud
-    wc = WordCloud(
-        width=1200,
-        height=600,
-        background_color='white',
-        font_path=font_path,
-        colormap=get_theProjectCompany_colormap(),
-        max_words=num_words,
-        prefer_horizontal=0.7,
-        relative_scaling=0.5,
-        scale=2
-    ).generate_from_frequencies(word_freq)
-
-    # Convert to Base64
-    img_buffer = BytesIO()
-    # We can use wc.to_image() directly without matplotlib figure overhead for simple image
-    wc.to_image().save(img_buffer, format='PNG')
-    img_str = base64.b64encode(img_buffer.getvalue()).decode('utf-8')
-    base64_data = f"data:image/png;base64,{img_str}"
-
-    meta_tags = [word for word, count in word_freq.most_common(20)]
-
-    return base64_data, meta_tags
-
-def generate_wordcloud_for_artist(artist_id: int, num_words: int = 100) -> (str, list):
-    """Fetches news content for an artist, generates a word cloud, and returns base64 image + keywords.
+def png_to_data_uri(png_bytes: bytes) -> str:
+    """Converts PNG bytes to a data:image/png;base64 URI (None stays None)."""
+    if png_bytes is None:
+        return None
+    img_str = base64.b64encode(png_bytes).decode('utf-8')
+    return f"data:image/png;base64,{img_str}"
+
+def generate_wordcloud_from_text(text_content: str, num_words: int = 100, preview: bool = False) -> (str, list):
+    """Generates a word cloud from text string and returns base64 image + keywords."""
+    png_bytes, meta_tags = render_wordcloud_png(text_content, num_words, preview)
+    return png_to_data_uri(png_bytes), meta_tags
+
+def generate_wordcloud_for_artist(artist_id: int, num_words: int = 100, use_cache: bool = True,
+                                  preview: bool = False) -> (str, list):
+    """Generates a word cloud from an artist's news and returns base64 image + keywords.
+
+    Frequencies come from the per-artist term index maintained by the crawler
+    (backend/services/news_terms.py), so news content is not re-tokenized; artists not
+    indexed yet fall back to streaming their news content in chunks. The PNG
+    and keywords are cached on disk keyed by the artist's news set (see
+    backend/services/wordcloud_cache.py), so artists without new news skip rendering.
+    preview=True renders at the smaller UI scale (cached separately from the full scale).
 
     Returns:
         A tuple containing:
         - Base64 encoded string of the word cloud image (data:image/png;base64,...)
         - A list of prominent meta tags (top keywords).
     """
-    from backend.models import News
-    
-    news_items = News.query.filter_by(artist_id=artist_id).all()
-    if not news_items:
+    from backend.services.news_terms import get_term_frequencies, stream_term_counts
+    from backend.services.wordcloud_cache import get_news_fingerprints, get_wordcloud_cache
+
+    fingerprint = get_news_fingerprints([artist_id]).get(artist_id)
+    if fingerprint is None:
         return None, []
 
-    text_content = " ".join([n.content for n in news_items if n.content])
-    return generate_wordcloud_from_text(text_content, num_words)
+    def render():
+        word_freq = get_term_frequencies(artist_id)
+        if word_freq:
+            return render_wordcloud_from_frequencies(word_freq, num_words, preview)
+        # Term index not built yet for this artist: count terms from the news content,
+        # streamed in chunks so memory stays bounded for artists with many articles
+        return render_wordcloud_from_frequencies(stream_term_counts([artist_id])[artist_id], num_words, preview)
+
+    if not use_cache:
+        png_bytes, meta_tags = render()
+    else:
+        scale = WORDCLOUD_PREVIEW_SCALE if preview else WORDCLOUD_FULL_SCALE
+        png_bytes, meta_tags = get_wordcloud_cache().get_or_render(artist_id, fingerprint, num_words, render, scale)
+    return png_to_data_uri(png_bytes), meta_tags
 
 if __name__ == '__main__':
     # This part is for testing the word cloud generator directly
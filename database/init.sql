@@ -32,6 +32,9 @@ CREATE TABLE channels (
     following_count INT DEFAULT 0,
     post_count INT DEFAULT 0,
     is_verified BOOLEAN DEFAULT FALSE,
+    latest_stat_id INT NULL, -- 가장 최근 channel_stats.id
+    latest_stat_date DATE NULL,
+    engagement_rate DECIMAL(5,2) NULL,
     last_sync_at TIMESTAMP NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
@@ -132,6 +135,7 @@ CREATE TABLE news (
     title VARCHAR(500) NOT NULL,
     content TEXT,
     url TEXT NOT NULL,
+    url_hash VARCHAR(40), -- 정규화된 URL의 SHA-1 (중복 확인용)
     source VARCHAR(200),
     published_at TIMESTAMP NULL,
     crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -142,7 +146,8 @@ CREATE TABLE news (
     thumbnail TEXT, -- 썸네일 이미지 URL
     media_name VARCHAR(255), -- 미디어 이름 (예: 연합뉴스, 조선일보)
     FOREIGN KEY (artist_id) REFERENCES artists(id) ON DELETE CASCADE,
-    UNIQUE KEY unique_news_url (url)
+    UNIQUE KEY unique_news_artist_url_hash (artist_id, url_hash),
+    FULLTEXT KEY ft_news_title_content (title, content) WITH PARSER ngram
 );
 
 -- 인덱스 생성
@@ -98,9 +98,15 @@ def run_migrations_online():
                     directives[:] = []
                     logger.info('No changes in schema detected.')
 
+        # MySQL 전용 FULLTEXT 인덱스는 모델에 선언하지 않으므로 autogenerate가 삭제하지 않도록 제외
+        def include_object(object, name, type_, reflected, compare_to):
+            return not (type_ == 'index' and name == 'ft_news_title_content')
+
         conf_args = current_app.extensions['migrate'].configure_args
         if conf_args.get("process_revision_directives") is None:
             conf_args["process_revision_directives"] = process_revision_directives
+        if conf_args.get("include_object") is None:
+            conf_args["include_object"] = include_object
 
         connectable = get_engine()
 
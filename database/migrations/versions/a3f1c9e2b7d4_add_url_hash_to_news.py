@@ -0,0 +1,100 @@
+"""Add url_hash column and (artist_id, url_hash) unique index to news
+
+Revision ID: a3f1c9e2b7d4
+Revises: 7e8bcf719d53
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from backend.utils.url_utils import compute_url_hash
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f1c9e2b7d4'
+down_revision = '7e8bcf719d53'
+branch_labels = None
+depends_on = None
+
+BACKFILL_CHUNK_SIZE = 1000
+
+news = sa.table(
+    'news',
+    sa.column('id', sa.Integer),
+    sa.column('artist_id', sa.Integer),
+    sa.column('url', sa.Text),
+    sa.column('url_hash', sa.String(40)),
+)
+
+
+def _backfill_url_hash(bind):
+    """id 순서대로 BACKFILL_CHUNK_SIZE 단위로 url_hash 채우기
+
+    정규화 후 같은 아티스트에서 해시가 겹치는 행(추적 파라미터만 다른 URL 등)은
+    첫 행만 해시를 받고 나머지는 NULL로 남겨 유니크 인덱스 생성이 실패하지 않게 한다.
+    """
+    seen = set()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(news.c.id, news.c.artist_id, news.c.url)
+            .where(news.c.id > last_id)
+            .order_by(news.c.id)
+            .limit(BACKFILL_CHUNK_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+
+        updates = []
+        for row_id, artist_id, url in rows:
+            url_hash = compute_url_hash(url)
+            if url_hash and (artist_id, url_hash) not in seen:
+                seen.add((artist_id, url_hash))
+                updates.append({'b_id': row_id, 'b_url_hash': url_hash})
+
+        if updates:
+            bind.execute(
+                news.update().where(news.c.id == sa.bindparam('b_id')).values(url_hash=sa.bindparam('b_url_hash')),
+                updates
+            )
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    bind = op.get_bind()
+
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('url_hash', sa.String(length=40), nullable=True))
+
+    _backfill_url_hash(bind)
+
+    # 기존 url(255) prefix 유니크 인덱스는 (artist_id, url_hash)로 대체
+    existing_indexes = {index['name'] for index in sa.inspect(bind).get_indexes('news')}
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        if 'unique_news_url' in existing_indexes:
+            batch_op.drop_index('unique_news_url')
+        batch_op.create_unique_constraint('unique_news_artist_url_hash', ['artist_id', 'url_hash'])
+
+
+def downgrade():
+    bind = op.get_bind()
+
+    # 이전 스키마는 url(255) 전체에 유니크 인덱스가 있으므로, 아티스트가 달라 함께 저장된 같은 URL이
+    # 있으면 인덱스를 만들 수 없음. 스키마를 바꾸기 전에 확인하고 중단
+    url_prefix = sa.func.substr(news.c.url, 1, 255)
+    duplicated = bind.execute(
+        sa.select(sa.func.count()).select_from(
+            sa.select(url_prefix).group_by(url_prefix).having(sa.func.count() > 1).subquery()
+        )
+    ).scalar()
+    if duplicated:
+        raise RuntimeError(
+            f"news에 URL이 같은 행이 {duplicated}건 있어 unique_news_url 인덱스를 복원할 수 없습니다. "
+            "중복 행을 정리한 뒤 다시 실행하세요."
+        )
+
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.drop_constraint('unique_news_artist_url_hash', type_='unique')
+        batch_op.drop_column('url_hash')
+        batch_op.create_index('unique_news_url', ['url'], unique=True, mysql_length={'url': 255})
@@ -0,0 +1,45 @@
+"""Add news_daily_stats rollup table
+
+Revision ID: a8c1e6d3f9b5
+Revises: f7b0d5c2e8a4
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8c1e6d3f9b5'
+down_revision = 'f7b0d5c2e8a4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('news_daily_stats',
+    sa.Column('stat_date', sa.Date(), nullable=False),
+    sa.Column('artist_id', sa.BigInteger(), nullable=False),
+    sa.Column('sentiment', sa.Enum('positive', 'negative', 'neutral'), nullable=False),
+    sa.Column('news_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['artist_id'], ['Artists.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('stat_date', 'artist_id', 'sentiment')
+    )
+    with op.batch_alter_table('news_daily_stats', schema=None) as batch_op:
+        batch_op.create_index('idx_news_daily_stats_artist', ['artist_id'], unique=False)
+
+    # 기존 뉴스로 집계 채우기
+    op.execute(
+        "INSERT INTO news_daily_stats (stat_date, artist_id, sentiment, news_count, updated_at) "
+        "SELECT DATE(crawled_at), artist_id, COALESCE(sentiment, 'neutral'), COUNT(*), CURRENT_TIMESTAMP "
+        "FROM news WHERE crawled_at IS NOT NULL "
+        "GROUP BY DATE(crawled_at), artist_id, COALESCE(sentiment, 'neutral')"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('news_daily_stats', schema=None) as batch_op:
+        batch_op.drop_index('idx_news_daily_stats_artist')
+
+    op.drop_table('news_daily_stats')
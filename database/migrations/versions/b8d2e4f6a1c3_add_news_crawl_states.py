@@ -0,0 +1,34 @@
+"""Add news_crawl_states table for incremental news crawling
+
+Revision ID: b8d2e4f6a1c3
+Revises: a3f1c9e2b7d4
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8d2e4f6a1c3'
+down_revision = 'a3f1c9e2b7d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('news_crawl_states',
+    sa.Column('artist_id', sa.BigInteger(), nullable=False),
+    sa.Column('last_published_at', sa.DateTime(), nullable=True),
+    sa.Column('recent_url_hashes', sa.JSON(), nullable=True),
+    sa.Column('empty_streak', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('last_crawled_at', sa.DateTime(), nullable=True),
+    sa.Column('next_crawl_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['artist_id'], ['Artists.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('artist_id')
+    )
+
+
+def downgrade():
+    op.drop_table('news_crawl_states')
@@ -0,0 +1,46 @@
+"""Add denormalized latest stat columns to channels
+
+Revision ID: b9d2f7e4a0c6
+Revises: a8c1e6d3f9b5
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9d2f7e4a0c6'
+down_revision = 'a8c1e6d3f9b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('channels', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('latest_stat_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('latest_stat_date', sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column('engagement_rate', sa.Numeric(precision=5, scale=2), nullable=True))
+
+    # 기존 통계에서 채널별 최신 값 채우기
+    op.execute(
+        "UPDATE channels SET latest_stat_date = "
+        "(SELECT MAX(s.stat_date) FROM channel_stats s WHERE s.channel_id = channels.id)"
+    )
+    latest_stat = "(SELECT s.{column} FROM channel_stats s WHERE s.channel_id = channels.id AND s.stat_date = channels.latest_stat_date)"
+    op.execute(
+        "UPDATE channels SET "
+        f"latest_stat_id = {latest_stat.format(column='id')}, "
+        f"follower_count = {latest_stat.format(column='follower_count')}, "
+        f"following_count = {latest_stat.format(column='following_count')}, "
+        f"post_count = {latest_stat.format(column='post_count')}, "
+        f"engagement_rate = {latest_stat.format(column='engagement_rate')} "
+        "WHERE latest_stat_date IS NOT NULL"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('channels', schema=None) as batch_op:
+        batch_op.drop_column('engagement_rate')
+        batch_op.drop_column('latest_stat_date')
+        batch_op.drop_column('latest_stat_id')
@@ -0,0 +1,46 @@
+"""Add channel_stat_rollups table
+
+Revision ID: c0e3a8f5b1d7
+Revises: b9d2f7e4a0c6
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c0e3a8f5b1d7'
+down_revision = 'b9d2f7e4a0c6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('channel_stat_rollups',
+    sa.Column('channel_id', sa.Integer(), nullable=False),
+    sa.Column('bucket', sa.Enum('week', 'month'), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('first_stat_date', sa.Date(), nullable=True),
+    sa.Column('last_stat_date', sa.Date(), nullable=True),
+    sa.Column('start_follower_count', sa.Integer(), nullable=True),
+    sa.Column('end_follower_count', sa.Integer(), nullable=True),
+    sa.Column('follower_delta', sa.Integer(), nullable=True),
+    sa.Column('growth_rate', sa.Float(), nullable=True),
+    sa.Column('post_delta', sa.Integer(), nullable=True),
+    sa.Column('avg_engagement_rate', sa.Float(), nullable=True),
+    sa.Column('sample_count', sa.Integer(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['channel_id'], ['channels.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('channel_id', 'bucket', 'period_start')
+    )
+    with op.batch_alter_table('channel_stat_rollups', schema=None) as batch_op:
+        batch_op.create_index('idx_channel_stat_rollups_bucket_period', ['bucket', 'period_start'], unique=False)
+    # 기존 통계 집계는 배포 후 POST /api/channels/rollups/rebuild로 생성
+
+
+def downgrade():
+    with op.batch_alter_table('channel_stat_rollups', schema=None) as batch_op:
+        batch_op.drop_index('idx_channel_stat_rollups_bucket_period')
+
+    op.drop_table('channel_stat_rollups')
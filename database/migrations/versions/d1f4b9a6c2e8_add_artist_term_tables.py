@@ -0,0 +1,52 @@
+"""Add artist_terms and artist_term_daily_counts tables
+
+Revision ID: d1f4b9a6c2e8
+Revises: c0e3a8f5b1d7
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd1f4b9a6c2e8'
+down_revision = 'c0e3a8f5b1d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('artist_terms',
+    sa.Column('artist_id', sa.BigInteger(), nullable=False),
+    sa.Column('term', sa.String(length=100), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('last_seen', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['artist_id'], ['Artists.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('artist_id', 'term')
+    )
+    with op.batch_alter_table('artist_terms', schema=None) as batch_op:
+        batch_op.create_index('idx_artist_terms_artist_count', ['artist_id', 'count'], unique=False)
+
+    op.create_table('artist_term_daily_counts',
+    sa.Column('artist_id', sa.BigInteger(), nullable=False),
+    sa.Column('term_date', sa.Date(), nullable=False),
+    sa.Column('term', sa.String(length=100), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['artist_id'], ['Artists.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('artist_id', 'term_date', 'term')
+    )
+    with op.batch_alter_table('artist_term_daily_counts', schema=None) as batch_op:
+        batch_op.create_index('idx_artist_term_daily_artist_date', ['artist_id', 'term_date'], unique=False)
+    # 본문 토큰화가 필요해 SQL로 채울 수 없으므로 배포 후 POST /api/news/terms/rebuild로 생성
+
+
+def downgrade():
+    with op.batch_alter_table('artist_term_daily_counts', schema=None) as batch_op:
+        batch_op.drop_index('idx_artist_term_daily_artist_date')
+
+    op.drop_table('artist_term_daily_counts')
+    with op.batch_alter_table('artist_terms', schema=None) as batch_op:
+        batch_op.drop_index('idx_artist_terms_artist_count')
+
+    op.drop_table('artist_terms')
@@ -0,0 +1,37 @@
+"""Add scheduler_leases table and jobs.worker_id/heartbeat_at for single-leader scheduling
+
+Revision ID: d5f8b3a0c6e2
+Revises: c4e7a2d9f5b1
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5f8b3a0c6e2'
+down_revision = 'c4e7a2d9f5b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('scheduler_leases',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('holder', sa.String(length=255), nullable=False),
+    sa.Column('acquired_at', sa.DateTime(), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('worker_id', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.drop_column('heartbeat_at')
+        batch_op.drop_column('worker_id')
+
+    op.drop_table('scheduler_leases')
@@ -0,0 +1,26 @@
+"""Add (crawled_at, id) index on news for keyset pagination
+
+Revision ID: e6a9c4b1d7f3
+Revises: d5f8b3a0c6e2
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6a9c4b1d7f3'
+down_revision = 'd5f8b3a0c6e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.create_index('idx_news_crawled_at_id', ['crawled_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.drop_index('idx_news_crawled_at_id')
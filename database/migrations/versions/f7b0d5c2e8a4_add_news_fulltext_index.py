@@ -0,0 +1,30 @@
+"""Add FULLTEXT (ngram) index on news title/content
+
+Revision ID: f7b0d5c2e8a4
+Revises: e6a9c4b1d7f3
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7b0d5c2e8a4'
+down_revision = 'e6a9c4b1d7f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # FULLTEXT 인덱스는 MySQL 전용. 다른 DB는 로컬 FTS5 인덱스(news_search)를 사용
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.execute("ALTER TABLE news ADD FULLTEXT INDEX ft_news_title_content (title, content) WITH PARSER ngram")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.drop_index('ft_news_title_content')
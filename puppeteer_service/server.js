@@ -5,67 +5,316 @@ const bodyParser = require('body-parser');
 const app = express();
 const PORT = process.env.PORT || 3001; // Use port 3001 or specified by environment
 
+// Browser pool settings
+const POOL_SIZE = parseInt(process.env.PDF_BROWSER_POOL_SIZE || '2', 10); // Warm Chromium instances
+const PAGES_PER_BROWSER = parseInt(process.env.PDF_PAGES_PER_BROWSER || '2', 10); // Concurrent renders per browser
+const MAX_RENDERS_PER_BROWSER = parseInt(process.env.PDF_BROWSER_MAX_RENDERS || '100', 10); // Recycle after N renders
+const MAX_QUEUE = parseInt(process.env.PDF_MAX_QUEUE || '50', 10); // Requests waiting for a free slot
+const RENDER_TIMEOUT_MS = parseInt(process.env.PDF_RENDER_TIMEOUT_MS || '110000', 10);
+const LATENCY_WINDOW = 200; // Recent renders kept for latency stats
+
+const MAX_CONCURRENT_RENDERS = POOL_SIZE * PAGES_PER_BROWSER;
+const WAIT_UNTIL_VALUES = ['load', 'domcontentloaded', 'networkidle0', 'networkidle2'];
+
+const LAUNCH_OPTIONS = {
+    headless: true, // Use 'new' for new headless mode, 'true' for old headless
+    args: [
+        '--no-sandbox', // Required for some environments
+        '--disable-setuid-sandbox',
+        '--font-render-hinting=none', // Ensure consistent font rendering
+    ],
+    // executablePath: '/usr/bin/google-chrome' // Specify path to Chrome/Chromium if not automatically found
+};
+
+class QueueFullError extends Error {}
+
+// ---------------------------------------------------------------------------
+// Browser pool
+// ---------------------------------------------------------------------------
+
+let nextBrowserId = 1;
+
+class BrowserSlot {
+    constructor() {
+        this.id = nextBrowserId++;
+        this.renders = 0;
+        this.active = 0;
+        this.idlePages = [];
+        this.retiring = false;
+        this.launchedAt = Date.now();
+        this.ready = puppeteer.launch(LAUNCH_OPTIONS).then((browser) => {
+            this.browser = browser;
+            browser.on('disconnected', () => {
+                if (!this.closing) {
+                    console.error(`Browser ${this.id} disconnected unexpectedly, replacing it.`);
+                    pool.replace(this);
+                }
+            });
+            return browser;
+        });
+    }
+
+    async getPage() {
+        const browser = await this.ready;
+        const page = this.idlePages.pop();
+        return page || browser.newPage();
+    }
+
+    async close() {
+        this.closing = true;
+        try {
+            const browser = await this.ready;
+            await browser.close();
+        } catch (error) {
+            console.error(`Error closing browser ${this.id}:`, error);
+        }
+    }
+
+    toJSON() {
+        return {
+            id: this.id,
+            renders: this.renders,
+            active: this.active,
+            idlePages: this.idlePages.length,
+            retiring: this.retiring,
+            uptimeSeconds: Math.round((Date.now() - this.launchedAt) / 1000),
+        };
+    }
+}
+
+const pool = {
+    slots: [],
+    retiring: new Set(),
+    waiters: [],
+    activeRenders: 0,
+
+    start() {
+        this.slots = Array.from({ length: POOL_SIZE }, () => new BrowserSlot());
+        return Promise.all(this.slots.map((slot) => slot.ready));
+    },
+
+    // Concurrency cap: at most MAX_CONCURRENT_RENDERS renders, then up to MAX_QUEUE waiters
+    acquireTurn() {
+        if (this.activeRenders < MAX_CONCURRENT_RENDERS) {
+            this.activeRenders++;
+            return Promise.resolve();
+        }
+        if (this.waiters.length >= MAX_QUEUE) {
+            return Promise.reject(new QueueFullError('PDF render queue is full.'));
+        }
+        return new Promise((resolve) => this.waiters.push(resolve));
+    },
+
+    releaseTurn() {
+        const next = this.waiters.shift();
+        if (next) {
+            next(); // Hand the slot over directly, activeRenders stays the same
+        } else {
+            this.activeRenders--;
+        }
+    },
+
+    pickSlot() {
+        return this.slots.reduce((best, slot) => (slot.active < best.active ? slot : best));
+    },
+
+    replace(slot) {
+        const index = this.slots.indexOf(slot);
+        if (index === -1) {
+            return;
+        }
+        slot.retiring = true;
+        this.slots[index] = new BrowserSlot();
+        this.slots[index].ready.catch((error) => console.error('Error launching replacement browser:', error));
+        this.retiring.add(slot);
+        this.closeIfDrained(slot);
+    },
+
+    closeIfDrained(slot) {
+        if (slot.retiring && slot.active === 0) {
+            this.retiring.delete(slot);
+            slot.close();
+        }
+    },
+
+    async render(htmlContent, pdfOptions, waitUntil) {
+        await this.acquireTurn();
+        const slot = this.pickSlot();
+        slot.active++;
+        let page;
+        let reusable = false;
+        try {
+            page = await slot.getPage();
+            page.setDefaultTimeout(RENDER_TIMEOUT_MS);
+            // Wait for network idle unless the caller inlined every resource ('load' is then enough)
+            await page.setContent(htmlContent, { waitUntil, timeout: RENDER_TIMEOUT_MS });
+            const pdfBuffer = await page.pdf({ timeout: RENDER_TIMEOUT_MS, ...pdfOptions });
+            reusable = true;
+            return pdfBuffer;
+        } finally {
+            slot.active--;
+            slot.renders++;
+            if (page) {
+                await this.returnPage(slot, page, reusable);
+            } else if (!slot.browser && !slot.retiring) {
+                // Browser failed to launch; start a fresh one for the next request
+                this.replace(slot);
+            }
+            if (!slot.retiring && slot.renders >= MAX_RENDERS_PER_BROWSER) {
+                this.replace(slot);
+            }
+            this.closeIfDrained(slot);
+            this.releaseTurn();
+        }
+    },
+
+    async returnPage(slot, page, reusable) {
+        if (reusable && !slot.retiring) {
+            try {
+                // Drop the previous report's DOM before the page is reused
+                await page.goto('about:blank');
+                slot.idlePages.push(page);
+                return;
+            } catch (error) {
+                console.error(`Error resetting page on browser ${slot.id}:`, error);
+            }
+        }
+        await page.close().catch(() => {});
+    },
+
+    async shutdown() {
+        const slots = [...this.slots, ...this.retiring];
+        this.slots = [];
+        await Promise.all(slots.map((slot) => slot.close()));
+    },
+};
+
+// ---------------------------------------------------------------------------
+// Metrics
+// ---------------------------------------------------------------------------
+
+const metrics = {
+    startedAt: Date.now(),
+    totalRenders: 0,
+    failedRenders: 0,
+    rejectedRequests: 0,
+    latenciesMs: [],
+
+    recordLatency(ms) {
+        this.latenciesMs.push(ms);
+        if (this.latenciesMs.length > LATENCY_WINDOW) {
+            this.latenciesMs.shift();
+        }
+    },
+
+    latencySummary() {
+        if (this.latenciesMs.length === 0) {
+            return { samples: 0, avgMs: null, p50Ms: null, p95Ms: null, maxMs: null };
+        }
+        const sorted = [...this.latenciesMs].sort((a, b) => a - b);
+        const percentile = (p) => sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))];
+        return {
+            samples: sorted.length,
+            avgMs: Math.round(sorted.reduce((sum, ms) => sum + ms, 0) / sorted.length),
+            p50Ms: percentile(50),
+            p95Ms: percentile(95),
+            maxMs: sorted[sorted.length - 1],
+        };
+    },
+};
+
+// ---------------------------------------------------------------------------
+// Routes
+// ---------------------------------------------------------------------------
+
 app.use(bodyParser.json({ limit: '50mb' })); // Increased limit for large HTML content
 
 app.post('/generate-pdf', async (req, res) => {
-    const { htmlContent, options } = req.body;
+    const { htmlContent, options, waitUntil = 'networkidle0' } = req.body;
 
     if (!htmlContent) {
         return res.status(400).send('HTML content is required.');
     }
+    if (!WAIT_UNTIL_VALUES.includes(waitUntil)) {
+        return res.status(400).send(`waitUntil must be one of ${WAIT_UNTIL_VALUES.join(', ')}.`);
+    }
 
-    let browser;
-    try {
-        browser = await puppeteer.launch({
-            headless: true, // Use 'new' for new headless mode, 'true' for old headless
-            args: [
-                '--no-sandbox', // Required for some environments
-                '--disable-setuid-sandbox',
-                '--font-render-hinting=none', // Ensure consistent font rendering
-            ],
-            // executablePath: '/usr/bin/google-chrome' // Specify path to Chrome/Chromium if not automatically found
-        });
-        const page = await browser.newPage();
-
-        // Set content and wait for network idle to ensure all resources are loaded
-        await page.setContent(htmlContent, { waitUntil: 'networkidle0' });
-
-        // Apply PDF generation options based on the analysis
-        // These options are crucial for matching R.book_03.pdf's layout
-        const pdfOptions = {
-            format: 'A4', // As inferred from analysis
-            printBackground: true, // Essential for background colors/images
-            margin: { // Based on the "Overall Layout & Structure" analysis
-                top: '2.54cm',    // ~1 inch
-                right: '1.9cm',   // ~0.75 inch
-                bottom: '2.54cm', // ~1 inch
-                left: '1.9cm',    // ~0.75 inch
-            },
-            // Emulate the @page CSS rules for headers/footers if needed,
-            // or ensure they are part of the HTML content itself.
-            // For now, rely on CSS @page rules for page numbers etc.
-            ...options // Allow Python to override/add specific options
-        };
+    // Apply PDF generation options based on the analysis
+    // These options are crucial for matching R.book_03.pdf's layout
+    const pdfOptions = {
+        format: 'A4', // As inferred from analysis
+        printBackground: true, // Essential for background colors/images
+        margin: { // Based on the "Overall Layout & Structure" analysis
+            top: '2.54cm',    // ~1 inch
+            right: '1.9cm',   // ~0.75 inch
+            bottom: '2.54cm', // ~1 inch
+            left: '1.9cm',    // ~0.75 inch
+        },
+        // Emulate the @page CSS rules for headers/footers if needed,
+        // or ensure they are part of the HTML content itself.
+        // For now, rely on CSS @page rules for page numbers etc.
+        ...options // Allow Python to override/add specific options
+    };
 
-        const pdfBuffer = await page.pdf(pdfOptions);
+    const startedAt = Date.now();
+    try {
+        const pdfBuffer = await pool.render(htmlContent, pdfOptions, waitUntil);
+        metrics.totalRenders++;
+        metrics.recordLatency(Date.now() - startedAt);
 
         res.set({
             'Content-Type': 'application/pdf',
             'Content-Length': pdfBuffer.length,
             'Content-Disposition': 'attachment; filename="report.pdf"',
         });
-        res.send(pdfBuffer);
+        res.send(Buffer.from(pdfBuffer));
 
     } catch (error) {
+        if (error instanceof QueueFullError) {
+            metrics.rejectedRequests++;
+            res.set('Retry-After', '5');
+            return res.status(503).send(error.message);
+        }
+        metrics.failedRenders++;
         console.error('Error generating PDF:', error);
         res.status(500).send('Error generating PDF.');
-    } finally {
-        if (browser) {
-            await browser.close();
-        }
     }
 });
 
-app.listen(PORT, () => {
-    console.log(`Puppeteer PDF service listening on port ${PORT}`);
+app.get('/health', (req, res) => {
+    res.json({
+        status: 'ok',
+        uptimeSeconds: Math.round((Date.now() - metrics.startedAt) / 1000),
+        queueDepth: pool.waiters.length,
+        activeRenders: pool.activeRenders,
+        maxConcurrentRenders: MAX_CONCURRENT_RENDERS,
+        maxQueue: MAX_QUEUE,
+        totalRenders: metrics.totalRenders,
+        failedRenders: metrics.failedRenders,
+        rejectedRequests: metrics.rejectedRequests,
+        renderLatency: metrics.latencySummary(),
+        browsers: pool.slots.map((slot) => slot.toJSON()),
+        retiringBrowsers: pool.retiring.size,
+    });
 });
+
+// Launch the pool before accepting requests so the first report does not pay the cold start
+pool.start()
+    .then(() => {
+        const server = app.listen(PORT, () => {
+            console.log(`Puppeteer PDF service listening on port ${PORT} (${POOL_SIZE} browsers x ${PAGES_PER_BROWSER} pages)`);
+        });
+
+        const shutdown = async () => {
+            console.log('Shutting down Puppeteer PDF service...');
+            server.close();
+            await pool.shutdown();
+            process.exit(0);
+        };
+        process.on('SIGTERM', shutdown);
+        process.on('SIGINT', shutdown);
+    })
+    .catch((error) => {
+        console.error('Failed to launch browser pool:', error);
+        process.exit(1);
+    });
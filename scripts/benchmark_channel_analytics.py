@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+채널 분석(성장률, 이동 평균, 이상치, 참여율 백분위) 벤치마크
+NumPy 벡터 연산(backend/services/channel_analytics.py) vs 행 단위 Python 루프
+
+    python scripts/benchmark_channel_analytics.py --channels 10000 --days 365
+
+행 단위 구현은 느리므로 --naive-channels 개 채널만 실행하고 전체 채널 수로 환산한다.
+두 구현의 결과가 같은지도 함께 확인한다.
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+# backend 패키지 import를 위해 프로젝트 루트를 경로에 추가
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from backend.services.channel_analytics import (  # noqa: E402
+    DEFAULT_ANOMALY_WINDOW, DEFAULT_ANOMALY_Z, DEFAULT_MOVING_AVERAGE_WINDOW,
+    build_stat_matrix, compute_channel_analytics
+)
+
+GROWTH_DAYS = (7, 30)
+
+
+def generate_rows(num_channels, num_days, missing_ratio=0.05, seed=42):
+    """channel_stats 조회 결과와 같은 (channel_id, day_offset, follower_count, engagement_rate) 열 배열 생성"""
+    rng = np.random.default_rng(seed)
+    base = rng.integers(1_000, 5_000_000, size=(num_channels, 1))
+    daily_growth = rng.normal(0.001, 0.002, size=(num_channels, num_days))
+    # 일부 날짜에 급증/급감 주입
+    spikes = rng.random((num_channels, num_days)) < 0.002
+    daily_growth[spikes] += rng.choice([-0.2, 0.3], size=spikes.sum())
+    followers = np.round(base * np.cumprod(1 + daily_growth, axis=1))
+    engagement = np.round(np.clip(rng.normal(3.0, 1.5, size=(num_channels, num_days)), 0, None), 2)
+
+    observed = rng.random((num_channels, num_days)) >= missing_ratio
+    channel_idx, day_idx = np.nonzero(observed)
+    return (
+        channel_idx + 1,
+        day_idx,
+        followers[channel_idx, day_idx],
+        engagement[channel_idx, day_idx]
+    )
+
+
+def naive_channel_analytics(rows, num_days):
+    """ORM 행을 순회하듯 채널별 Python 리스트로 같은 지표를 계산하는 기준 구현"""
+    series = {}
+    for channel_id, day, follower_count, engagement_rate in rows:
+        channel = series.setdefault(channel_id, ([None] * num_days, [None] * num_days))
+        channel[0][day] = follower_count
+        channel[1][day] = engagement_rate
+
+    results = {}
+    means = {}
+    for channel_id, (followers, engagement) in series.items():
+        filled = []
+        last = None
+        for value in followers:
+            if value is not None:
+                last = value
+            filled.append(last)
+
+        growth = {}
+        for days in GROWTH_DAYS:
+            start = filled[max(num_days - 1 - days, 0)]
+            end = filled[-1]
+            growth[days] = (end - start) / start * 100.0 if start else None
+
+        def trailing_mean(values):
+            window = [v for v in values[-DEFAULT_MOVING_AVERAGE_WINDOW:] if v is not None]
+            return sum(window) / len(window) if window else None
+
+        deltas = [None] * num_days
+        for day in range(1, num_days):
+            if followers[day] is not None and filled[day - 1] is not None:
+                deltas[day] = filled[day] - filled[day - 1]
+
+        anomaly_days = []
+        for day in range(num_days):
+            if deltas[day] is None:
+                continue
+            window = [d for d in deltas[max(day - DEFAULT_ANOMALY_WINDOW, 0):day] if d is not None]
+            if len(window) < 2:
+                continue
+            mean = sum(window) / len(window)
+            std = math.sqrt(max(sum(d * d for d in window) / len(window) - mean * mean, 0.0))
+            if std > 0 and abs(deltas[day] - mean) / std > DEFAULT_ANOMALY_Z:
+                anomaly_days.append(day)
+
+        observed = [v for v in engagement if v is not None]
+        means[channel_id] = round(sum(observed) / len(observed), 8) if observed else None
+        results[channel_id] = {
+            'growth': growth,
+            'follower_ma': trailing_mean(followers),
+            'engagement_ma': trailing_mean(engagement),
+            'anomaly_days': anomaly_days
+        }
+
+    ranked = sorted(m for m in means.values() if m is not None)
+    for channel_id, mean in means.items():
+        below = sum(1 for m in ranked if m < mean)
+        equal = sum(1 for m in ranked if m == mean)
+        results[channel_id]['engagement_percentile'] = (below + 0.5 * equal) / len(ranked) * 100.0
+    return results
+
+
+def _close(a, b, tolerance=1e-3):
+    if a is None or b is None:
+        return a is None and b is None
+    return abs(a - b) <= tolerance * max(1.0, abs(b))
+
+
+def compare(vectorized, naive, start_date):
+    mismatches = 0
+    for channel_id, expected in naive.items():
+        actual = vectorized['channels'][channel_id]
+        checks = [
+            _close(actual['growth_rates'][f'{days}d'], expected['growth'][days]) for days in GROWTH_DAYS
+        ] + [
+            _close(actual['follower_moving_average'], expected['follower_ma']),
+            _close(actual['engagement_moving_average'], expected['engagement_ma']),
+            actual['anomaly_dates'] == [(start_date + timedelta(days=d)).isoformat() for d in expected['anomaly_days']]
+        ]
+        if not all(checks):
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--channels', type=int, default=10_000)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--naive-channels', type=int, default=1_000, help='행 단위 구현을 실행할 채널 수')
+    args = parser.parse_args()
+
+    start_date = date.today() - timedelta(days=args.days - 1)
+    print(f"데이터 생성: {args.channels:,} 채널 × {args.days} 일")
+    channel_ids, day_offsets, followers, engagement = generate_rows(args.channels, args.days)
+    print(f"  통계 행 수: {len(channel_ids):,}")
+
+    started = time.perf_counter()
+    matrix = build_stat_matrix(channel_ids, day_offsets, followers, engagement, start_date, args.days)
+    vectorized = compute_channel_analytics(matrix, growth_days=GROWTH_DAYS)
+    vectorized_seconds = time.perf_counter() - started
+    print(f"NumPy 벡터 연산 (전체 {args.channels:,} 채널): {vectorized_seconds:.3f}s")
+
+    naive_channels = min(args.naive_channels, args.channels)
+    subset = channel_ids <= naive_channels
+    rows = list(zip(
+        channel_ids[subset].tolist(), day_offsets[subset].tolist(),
+        followers[subset].tolist(), engagement[subset].tolist()
+    ))
+    started = time.perf_counter()
+    naive = naive_channel_analytics(rows, args.days)
+    naive_seconds = time.perf_counter() - started
+    estimated = naive_seconds * args.channels / naive_channels
+    print(f"행 단위 Python 루프 ({naive_channels:,} 채널): {naive_seconds:.3f}s "
+          f"→ 전체 환산 약 {estimated:.1f}s ({estimated / vectorized_seconds:.0f}배)")
+
+    # 참여율 백분위는 비교 대상 채널 집합이 달라지므로 부분 집합으로 다시 계산해 비교
+    subset_matrix = build_stat_matrix(
+        channel_ids[subset], day_offsets[subset], followers[subset], engagement[subset], start_date, args.days
+    )
+    subset_result = compute_channel_analytics(subset_matrix, growth_days=GROWTH_DAYS)
+    mismatches = compare(subset_result, naive, start_date)
+    percentile_mismatches = sum(
+        1 for channel_id, expected in naive.items()
+        if not _close(subset_result['channels'][channel_id]['engagement_percentile'], expected['engagement_percentile'])
+    )
+    print(f"결과 비교: 지표 불일치 {mismatches}개, 백분위 불일치 {percentile_mismatches}개 채널")
+    return 0 if mismatches == 0 and percentile_mismatches == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+키워드 토크나이저 처리량 벤치마크 (backend/utils/text_terms.py)
+공백 분리(기존 방식) vs 한국어 명사 추출, 문서 캐시 cold/warm
+
+    python scripts/benchmark_tokenizer.py --snippets 100000
+
+뉴스 요약과 비슷한 합성 문장(명사+조사, 하다 동사, 영문 그룹명, 숫자)을 만들어
+초당 문서 수와 MB/s를 출력한다. --duplicate-ratio 만큼은 같은 문장이 반복된다
+(여러 아티스트에 같은 기사가 수집되는 경우).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# backend 패키지 import를 위해 프로젝트 루트를 경로에 추가
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from backend.utils.text_terms import KoreanNounTokenizer, WhitespaceTokenizer, _korean_noun  # noqa: E402
+
+NOUNS = [
+    '아이유', '콘서트', '앨범', '데뷔', '컴백', '드라마', '영화', '예능', '광고', '팬미팅', '월드투어', '음원',
+    '차트', '뮤직비디오', '소속사', '계약', '배우', '가수', '무대', '시상식', '신곡', '티저', '화보', '인터뷰',
+    '출연', '주연', '촬영', '공연', '서울', '일본', '미국', '유튜브', '조회수', '팬들', '멤버', '그룹',
+]
+PARTICLES = ['', '가', '이', '는', '은', '를', '을', '의', '에서', '와', '과', '도', '으로', '로', '까지', '에게']
+PREDICATES = ['발표했다', '공개했다', '참석했다', '출연한다', '진행했다', '밝혔다', '전했다', '있다', '예정이다']
+LATIN = ['BTS', 'NewJeans', 'IVE', 'Netflix', 'Billboard', 'the', 'and', 'MV', 'K-pop']
+
+
+def generate_snippets(count, duplicate_ratio=0.1, seed=42):
+    rng = random.Random(seed)
+    snippets = []
+    for _ in range(count):
+        if snippets and rng.random() < duplicate_ratio:
+            snippets.append(rng.choice(snippets))
+            continue
+        words = []
+        for _ in range(rng.randint(12, 30)):
+            roll = rng.random()
+            if roll < 0.7:
+                words.append(rng.choice(NOUNS) + rng.choice(PARTICLES))
+            elif roll < 0.85:
+                words.append(rng.choice(PREDICATES))
+            elif roll < 0.95:
+                words.append(rng.choice(LATIN))
+            else:
+                words.append(f"{rng.randint(1, 2025)}년")
+        snippets.append(' '.join(words) + '.')
+    return snippets
+
+
+def run(label, tokenizer, snippets, total_bytes):
+    started = time.perf_counter()
+    counts = tokenizer.count_many(snippets)
+    seconds = time.perf_counter() - started
+    print(f"  {label:<28} {seconds:7.3f}s  {len(snippets) / seconds:>10,.0f} docs/s  "
+          f"{total_bytes / seconds / 1024 / 1024:6.1f} MB/s  (고유 단어 {len(counts):,}개)")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--snippets', type=int, default=100_000)
+    parser.add_argument('--duplicate-ratio', type=float, default=0.1, help='반복되는 문장 비율')
+    args = parser.parse_args()
+
+    snippets = generate_snippets(args.snippets, args.duplicate_ratio)
+    total_bytes = sum(len(s.encode('utf-8')) for s in snippets)
+    print(f"합성 문장 {len(snippets):,}개, {total_bytes / 1024 / 1024:.1f} MB")
+
+    run('whitespace (캐시 없음)', WhitespaceTokenizer(cache_size=0), snippets, total_bytes)
+
+    _korean_noun.cache_clear()
+    run('korean_noun (캐시 없음)', KoreanNounTokenizer(cache_size=0), snippets, total_bytes)
+
+    cached = KoreanNounTokenizer(cache_size=len(snippets))
+    run('korean_noun (문서 캐시 cold)', cached, snippets, total_bytes)
+    counts = run('korean_noun (문서 캐시 warm)', cached, snippets, total_bytes)
+
+    print("상위 단어:", ', '.join(f"{term}({count:,})" for term, count in counts.most_common(10)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+워드클라우드 렌더링 마이크로벤치마크 (backend/utils/wordcloud_generator.py)
+매번 WordCloud 생성(기존 방식) vs 상주 렌더러(WordCloudRenderer) 전체/미리보기 크기
+
+    python scripts/benchmark_wordcloud_renderer.py --renders 20 --words 100
+
+아티스트 단어 빈도와 비슷한 합성 빈도(지프 분포)를 만들어 렌더링 1회당 평균 시간을 출력한다.
+기존 방식은 렌더링마다 글꼴 경로 확인, 컬러맵 생성, 크기별 글꼴 로딩을 다시 한다.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from io import BytesIO
+
+# backend 패키지 import를 위해 프로젝트 루트를 경로에 추가
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from wordcloud import WordCloud  # noqa: E402
+
+from backend.utils.wordcloud_generator import (  # noqa: E402
+    DEFAULT_FONT_PATH, WORDCLOUD_FULL_SCALE, WORDCLOUD_HEIGHT, WORDCLOUD_IMAGE_SCALE, WORDCLOUD_PREVIEW_SCALE,
+    WORDCLOUD_WIDTH, WordCloudRenderer, get_theProjectCompany_colormap
+)
+
+
+def generate_frequencies(count, num_terms=200, seed=42):
+    rng = random.Random(seed)
+    syllables = '가나다라마바사아자차카타파하콘서트앨범데뷔컴백드라마영화예능광고무대신곡'
+    frequencies = []
+    for _ in range(count):
+        terms = {''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(num_terms)}
+        frequencies.append({term: int(1000 / rank) + 1 for rank, term in enumerate(terms, start=1)})
+    return frequencies
+
+
+def render_per_call(word_freq, num_words):
+    """변경 전 render_wordcloud_from_frequencies와 같은 방식 (렌더링마다 새 WordCloud)"""
+    font_path = DEFAULT_FONT_PATH if os.path.exists(DEFAULT_FONT_PATH) else None
+    wc = WordCloud(
+        width=WORDCLOUD_WIDTH,
+        height=WORDCLOUD_HEIGHT,
+        background_color='white',
+        font_path=font_path,
+        colormap=get_theProjectCompany_colormap(),
+        max_words=num_words,
+        prefer_horizontal=0.7,
+        relative_scaling=0.5,
+        scale=WORDCLOUD_IMAGE_SCALE
+    ).generate_from_frequencies(word_freq)
+    buffer = BytesIO()
+    wc.to_image().save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def measure(label, render, frequencies):
+    started = time.perf_counter()
+    sizes = [len(render(word_freq)) for word_freq in frequencies]
+    per_render = (time.perf_counter() - started) / len(frequencies)
+    print(f"  {label:<32} {per_render * 1000:8.1f} ms/회  (PNG 평균 {sum(sizes) / len(sizes) / 1024:.0f} KB)")
+    return per_render
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--renders', type=int, default=20)
+    parser.add_argument('--words', type=int, default=100, help='워드클라우드에 그릴 단어 수')
+    args = parser.parse_args()
+
+    frequencies = generate_frequencies(args.renders)
+    print(f"합성 빈도 {len(frequencies)}개, 그릴 단어 {args.words}개")
+
+    baseline = measure('매번 WordCloud 생성 (전체)', lambda f: render_per_call(f, args.words), frequencies)
+
+    started = time.perf_counter()
+    renderer = WordCloudRenderer()
+    print(f"  렌더러 생성 (1회): {(time.perf_counter() - started) * 1000:.1f} ms")
+    # 첫 렌더링은 WordCloud 객체 생성이 포함되므로 한 번 돌려 둔 뒤 측정
+    renderer.render(frequencies[0], args.words, WORDCLOUD_FULL_SCALE)
+
+    full = measure(f'상주 렌더러 전체 (scale {WORDCLOUD_FULL_SCALE:g})',
+                   lambda f: renderer.render(f, args.words, WORDCLOUD_FULL_SCALE)[0], frequencies)
+    preview = measure(f'상주 렌더러 미리보기 (scale {WORDCLOUD_PREVIEW_SCALE:g})',
+                      lambda f: renderer.render(f, args.words, WORDCLOUD_PREVIEW_SCALE)[0], frequencies)
+    print(f"렌더링 1회당 절감: 전체 {(baseline - full) * 1000:.1f} ms ({baseline / full:.2f}배), "
+          f"미리보기 {(baseline - preview) * 1000:.1f} ms ({baseline / preview:.2f}배)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,14 +10,21 @@ source venv/bin/activate
 export FLASK_APP=app
 export FLASK_ENV=development
 
+# backend 패키지 import를 위해 프로젝트 루트를 PYTHONPATH에 추가
+export PYTHONPATH=$(cd ..; pwd)
+
 # 스케줄러 시작
 python -c "
-from services.scheduler import news_scheduler
+from backend.app import create_app
+from backend.services.scheduler import news_scheduler
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+app = create_app()
+news_scheduler.init_app(app)
+
 logger.info('뉴스 크롤링 스케줄러를 시작합니다...')
 news_scheduler.start_scheduler()
 
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+채널 통계 주/월 집계 테스트: 순서가 뒤섞인 통계를 증분 반영한 결과가 전체 재계산과 같은지 확인
+
+    python scripts/test_channel_rollups.py
+    python -m pytest scripts/test_channel_rollups.py
+
+메모리 SQLite DB를 사용하므로 MySQL 없이 실행된다.
+"""
+
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+# backend 패키지 import를 위해 프로젝트 루트를 경로에 추가
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from flask import Flask  # noqa: E402
+
+from backend.app import db  # noqa: E402
+from backend.models import Artist, Channel, ChannelStat, ChannelStatRollup  # noqa: E402
+from backend.services.channel_rollups import rebuild_channel_rollups, update_channel_rollups  # noqa: E402
+
+
+def create_test_app():
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        db.session.add(Artist(id=1, name='테스트', birth_date=date(2000, 1, 1), status='active'))
+        db.session.add(Channel(id=1, artist_id=1, platform='instagram', channel_id='test'))
+        db.session.commit()
+    return app
+
+
+def add_stats(stats):
+    """통계를 추가하고 채널 동기화와 같은 방식으로 증분 집계 반영"""
+    for stat_date, followers in stats:
+        db.session.add(ChannelStat(channel_id=1, stat_date=stat_date, follower_count=followers, post_count=followers // 10))
+    db.session.flush()
+    update_channel_rollups([(1, stat_date) for stat_date, _ in stats])
+    db.session.commit()
+
+
+def rollup_snapshot():
+    return sorted(
+        (r.bucket, r.period_start, r.first_stat_date, r.last_stat_date, r.start_follower_count,
+         r.end_follower_count, r.follower_delta, r.post_delta, r.sample_count)
+        for r in ChannelStatRollup.query.filter_by(channel_id=1)
+    )
+
+
+def assert_matches_rebuild():
+    incremental = rollup_snapshot()
+    rebuild_channel_rollups([1])
+    rebuilt = rollup_snapshot()
+    assert incremental == rebuilt, f"증분 {incremental}\n재계산 {rebuilt}"
+
+
+def test_late_stat_updates_next_period_with_data():
+    app = create_test_app()
+    with app.app_context():
+        add_stats([(date(2025, 9, 7), 100)])
+        add_stats([(date(2025, 9, 21), 300)])
+        # 9/9 주의 다음 달력 주(9/15)에는 통계가 없고, 9/21 주의 기준값이 바뀌어야 함
+        add_stats([(date(2025, 9, 9), 200)])
+
+        week = ChannelStatRollup.query.filter_by(channel_id=1, bucket='week', period_start=date(2025, 9, 15)).one()
+        assert (week.start_follower_count, week.follower_delta) == (200, 100)
+        assert_matches_rebuild()
+
+
+def test_out_of_order_inserts_match_rebuild():
+    app = create_test_app()
+    rng = random.Random(7)
+    days = [date(2025, 1, 1) + timedelta(days=offset) for offset in rng.sample(range(200), 80)]
+    with app.app_context():
+        for start in range(0, len(days), 5):
+            add_stats([(day, rng.randint(1_000, 100_000)) for day in days[start:start + 5]])
+            assert_matches_rebuild()
+
+
+if __name__ == '__main__':
+    test_late_stat_updates_next_period_with_data()
+    test_out_of_order_inserts_match_rebuild()
+    print("채널 집계 테스트 통과")
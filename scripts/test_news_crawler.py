@@ -58,8 +58,8 @@ def test_news_crawler():
         try:
             news_items = crawler.search_news_for_artist(artist)
             logger.info(f"검색된 뉴스 개수: {len(news_items)}")
-            saved_count = crawler.save_news_to_db(news_items, artist)
-            logger.info(f"DB에 저장된 뉴스 개수: {saved_count}")
+            saved = crawler.save_news_to_db(news_items, artist)
+            logger.info(f"DB에 저장된 뉴스 개수: {saved.inserted} (중복 제외: {saved.skipped})")
 
             try:
                 from models import News